@@ -0,0 +1,292 @@
+"""
+Performance benchmarks of the Ipanema fit pipeline.
+
+Usage (from the root directory of the project):
+
+    python benchmarks/run_benchmarks.py run --output results.json
+    python benchmarks/run_benchmarks.py compare baseline.json results.json
+
+'run' measures every benchmark (or the ones matching '--select') and stores
+the results as JSON, which can be kept as a baseline. 'compare' reports the
+ratio between two result files and exits with status 1 if any benchmark is
+slower than the baseline by more than '--tolerance'.
+
+Benchmarks run on the CPU ("numpy") backend by default, so they can be
+tracked on machines without GPUs; '--backend pycuda' runs them on a GPU.
+"""
+
+import argparse
+from contextlib import redirect_stdout
+import io
+import json
+import math
+from pathlib import Path
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Iterator
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from ipanema.config.config import CONFIG
+from ipanema.core import Core
+from ipanema.input.implementations.synthetic_peak_input import (
+    SyntheticPeakInput
+)
+from ipanema.model.implementations.signal_peak_model import SignalPeakModel
+from sdk.cuda_manager.abstract_cuda_manager import CudaManager
+from sdk.cuda_manager.implementations.numpy_cuda_manager import (
+    NumpyCudaManager
+)
+from sdk.math_utils.rotate.abstract_rotation_algorithm import (
+    AbstractRotationAlgorithm
+)
+from sdk.math_utils.rotate.numpy_rotation_algorithm import (
+    NumpyRotationAlgorithm
+)
+from sdk.math_utils.rotate.rotation_algorithm import RotationAlgorithm
+
+# A case is (name, callable to time, items processed per call)
+Case = tuple[str, Callable[[], object], int]
+
+BENCHMARKS: dict[str, Callable[[argparse.Namespace], Iterator[Case]]] = {}
+
+NOOP_KERNEL: str = "__global__ void noop(double *out) {}"
+
+def benchmark(name: str) -> Callable:
+    """Registers a benchmark generating cases."""
+    def register(function: Callable) -> Callable:
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+def cuda_manager(backend: str) -> CudaManager:
+    """Builds a CudaManager for the given backend."""
+    if backend == SignalPeakModel.Backend.NUMPY.value:
+        return NumpyCudaManager()
+    from sdk.cuda_manager.implementations.auto_cuda_manager import (
+        AutoCudaManager
+    )
+    return AutoCudaManager()
+
+
+#############
+# Benchmarks
+#############
+
+
+@benchmark("fcn_latency")
+def fcn_latency(args: argparse.Namespace) -> Iterator[Case]:
+    """SignalPeakModel FCN latency versus number of events."""
+    for n_events in args.sizes:
+        parameters = SyntheticPeakInput.generate(n_events, seed=0)
+        model = SignalPeakModel(parameters, args.backend)
+        model.prepare_fit()
+        fcn = model.fit_manager.fcn
+        values = np.array(model.fit_manager.values)
+        yield f"n={n_events}", lambda: fcn(values), n_events
+
+@benchmark("run_program_overhead")
+def run_program_overhead(args: argparse.Namespace) -> Iterator[Case]:
+    """Launch overhead of an empty kernel."""
+    manager = cuda_manager(args.backend)
+    manager.add_code_fragment("noop", NOOP_KERNEL)
+    if isinstance(manager, NumpyCudaManager):
+        manager.add_host_kernel("noop", lambda out: None)
+    yield "noop", lambda: manager.run_program(
+        "noop", [0], {0: ((1,), np.float64)}, (1, 1, 1), (1, 1), None
+    ), 1
+
+@benchmark("single_operation")
+def single_operation(args: argparse.Namespace) -> Iterator[Case]:
+    """Element-wise operation throughput."""
+    manager = cuda_manager(args.backend)
+    for size in args.sizes:
+        array = np.random.default_rng(0).random(size)
+        for operation in ("exp", "log"):
+            yield f"{operation}[n={size}]", (
+                lambda operation=operation, array=array:
+                manager.single_operation(operation, array)
+            ), size
+
+@benchmark("reduction_operation")
+def reduction_operation(args: argparse.Namespace) -> Iterator[Case]:
+    """Reduction throughput."""
+    manager = cuda_manager(args.backend)
+    for size in args.sizes:
+        array = np.random.default_rng(0).random(size)
+        yield f"sum[n={size}]", (
+            lambda array=array: manager.reduction_operation("sum", array)
+        ), size
+
+@benchmark("rotation")
+def rotation(args: argparse.Namespace) -> Iterator[Case]:
+    """Rotation throughput versus number of rows."""
+    algorithm: AbstractRotationAlgorithm
+    if args.backend == SignalPeakModel.Backend.NUMPY.value:
+        algorithm = NumpyRotationAlgorithm()
+    else:
+        algorithm = RotationAlgorithm(cuda_manager(args.backend))
+    t_matrix = np.eye(3, dtype=np.float32)
+    for rows in args.sizes:
+        in_matrix = np.random.default_rng(0).random(
+            3*rows, dtype=np.float32
+        )
+        yield f"rows={rows}", (
+            lambda in_matrix=in_matrix:
+            algorithm.transform_f32(in_matrix, t_matrix, 3)
+        ), rows
+
+@benchmark("rotation_batch")
+def rotation_batch(args: argparse.Namespace) -> Iterator[Case]:
+    """Per-row transform throughput versus number of rows."""
+    algorithm: AbstractRotationAlgorithm
+    if args.backend == SignalPeakModel.Backend.NUMPY.value:
+        algorithm = NumpyRotationAlgorithm()
+    else:
+        algorithm = RotationAlgorithm(cuda_manager(args.backend))
+    for rows in args.sizes:
+        rng = np.random.default_rng(0)
+        in_matrix = rng.random((rows, 4), dtype=np.float32)
+        t_matrices = rng.random((rows, 4, 4), dtype=np.float32)
+        yield f"rows={rows}", (
+            lambda in_matrix=in_matrix, t_matrices=t_matrices:
+            algorithm.transform_batch(in_matrix, t_matrices)
+        ), rows
+
+@benchmark("run_ipanema")
+def run_ipanema(args: argparse.Namespace) -> Iterator[Case]:
+    """End-to-end Core.run_ipanema time on the bundled dataset."""
+    config = dict(CONFIG)
+    CONFIG.update({
+        "input": "signal_peak_input",
+        "model": "signal_peak_model",
+        "outputs": ["command_line_output"],
+        "backend": args.backend,
+        "fit": {"steps": ["migrad", "hesse"], "cache": None, "strategy": None},
+        "metrics": {"path": None, "fcn_trace": None},
+    })
+    core = Core()
+
+    def run() -> None:
+        with redirect_stdout(io.StringIO()):
+            core.run_ipanema()
+
+    try:
+        yield "signal_peak", run, 1
+    finally:
+        CONFIG.clear()
+        CONFIG.update(config)
+
+
+##########
+# Runner
+##########
+
+
+def measure(function: Callable[[], object], repeat: int) -> list[float]:
+    """Times 'repeat' calls of a function, after a warm-up call."""
+    function()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def run(args: argparse.Namespace) -> None:
+    """Runs the selected benchmarks and stores their results."""
+    results: dict[str, dict] = {}
+    for name, generate in BENCHMARKS.items():
+        if args.select and not any(key in name for key in args.select):
+            continue
+        for case, function, items in generate(args):
+            timings = measure(function, args.repeat)
+            median = statistics.median(timings)
+            results[f"{name}[{case}]"] = {
+                "median": median,
+                "min": min(timings),
+                "items_per_second": items/median if median > 0 else math.inf
+            }
+            print(f"{name}[{case}]: {median*1e3:.3f} ms")
+
+    report = {
+        "backend": args.backend,
+        "repeat": args.repeat,
+        "machine": {
+            "node": platform.node(),
+            "processor": platform.processor(),
+            "python": platform.python_version(),
+            "numpy": np.__version__
+        },
+        "timestamp": time.time(),
+        "results": results
+    }
+    with open(args.output, "w", encoding="UTF-8") as file:
+        json.dump(report, file, indent=2)
+
+def compare(args: argparse.Namespace) -> int:
+    """Compares two result files, returning 1 if there are regressions."""
+    with open(args.baseline, encoding="UTF-8") as file:
+        baseline = json.load(file)["results"]
+    with open(args.current, encoding="UTF-8") as file:
+        current = json.load(file)["results"]
+
+    regressions = 0
+    print(f"{'benchmark':<48}{'baseline [ms]':>15}{'current [ms]':>14}"
+          f"{'ratio':>8}")
+    for name in sorted(set(baseline) & set(current)):
+        ratio = current[name]["median"]/baseline[name]["median"]
+        flag = ""
+        if ratio > 1 + args.tolerance:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{name:<48.48}{baseline[name]['median']*1e3:>15.3f}"
+              f"{current[name]['median']*1e3:>14.3f}{ratio:>8.2f}{flag}")
+    for name in sorted(set(baseline) ^ set(current)):
+        source = "baseline" if name in baseline else "current"
+        print(f"{name:<48.48} only in {source}")
+    return 1 if regressions else 0
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--output", default="benchmark_results.json")
+    run_parser.add_argument(
+        "--backend", default=SignalPeakModel.Backend.NUMPY.value,
+        choices=[backend.value for backend in SignalPeakModel.Backend]
+    )
+    run_parser.add_argument(
+        "--sizes", type=lambda sizes: [int(float(s)) for s in sizes.split(",")],
+        default=[10**3, 10**4, 10**5, 10**6],
+        help="Comma separated problem sizes (e.g. 1e3,1e6,1e8)"
+    )
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument(
+        "--select", nargs="*", default=[],
+        help=f"Benchmarks to run, among {list(BENCHMARKS)}"
+    )
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compare results with a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--tolerance", type=float, default=0.2,
+        help="Allowed relative slowdown before reporting a regression"
+    )
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+        return 0
+    return compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,47 @@
 # - input (str): Name of the specific InputPlugin module to load.
 # - model (str): Name of the specific ModelPlugin module to load.
 # - outputs (list[str]): List of OutputPlugin modules to be used.
+# - backend (str): CudaManager backend of the models supporting it. 
+#       "pycuda" runs kernels on a GPU; "numpy" runs on CPU.
+# - launch_tuning (str | None): JSON file where the block sizes autotuned 
+#       for each kernel, device and problem size are kept. None uses fixed
+#       block sizes.
+# - precision (str): Precision of the FCN of the models supporting it. 
+#       "double" computes in float64; "mixed" evaluates per-event densities
+#       in float32 and accumulates in float64; "validate" runs "mixed" and
+#       records its difference from "double".
+# - synthetic_input (dict): Settings of the "synthetic_peak_input" plugin,
+#       given as keyword arguments of 'SyntheticPeakInput.generate' 
+#       (n_events, signal_fraction, k, seed, chunk_size, path, ...).
+# - output_workers (int | None): Threads used to run the output plugins 
+#       concurrently. None uses one thread per thread-safe plugin.
+# - fit (dict): Fit stage settings.
+#     - steps (list[str]): Fit steps run once before the outputs, in order
+#           ("migrad", "hesse", "minos").
+#     - cache (str | None): Directory of the fit result cache. Results of an 
+#           unchanged model and dataset are reused, and fits of an unchanged 
+#           model on new data start from the last stored result. None 
+#           disables the cache.
+#     - strategy (dict | None): Strategy run before the fit steps, given by 
+#           its "name" and options. None runs the fit steps directly.
+#           - "coarse_to_fine": fits random subsamples first.
+#               - stages (list[dict]): "fraction" of events and MIGRAD 
+#                     "tolerance" of each coarse fit, in order.
+#               - seed (int | None): Seed of the subsamples.
+#           - "multi_start": MIGRAD from the best of many starting points 
+#                 drawn within the parameter limits.
+#               - n_starts (int): Candidate starting points.
+#               - n_best (int): Candidates refined concurrently with MIGRAD.
+#               - sampling (str): "lhs" (Latin hypercube) or "sobol".
+#               - seed (int | None): Seed of the candidates.
+#               - max_workers (int | None): Worker processes.
+# - metrics (dict): Export of the per-stage timings and FCN latencies of 
+#       each run.
+#     - path (str | None): Destination file. None disables the export.
+#     - format (str): "jsonl" appends one JSON line per run; "prometheus" 
+#           writes a Prometheus textfile.
+#     - fcn_trace (str | None): '.npz' file where the parameters, value and 
+#           latency of the FCN calls of the fit are saved. None disables it.
 # -----------------------------------------------------------------------------
 CONFIG = {
 
@@ -21,4 +62,31 @@ CONFIG = {
     "outputs": [
         "command_line_output"
     ],
+
+    "backend": "pycuda",
+
+    "launch_tuning": None,
+
+    "precision": "double",
+
+    "synthetic_input": {
+        "n_events": 100_000,
+        "signal_fraction": 0.3,
+        "seed": None,
+        "path": None,
+    },
+
+    "output_workers": None,
+
+    "fit": {
+        "steps": ["migrad", "hesse"],
+        "cache": None,
+        "strategy": None,
+    },
+
+    "metrics": {
+        "path": None,
+        "format": "jsonl",
+        "fcn_trace": None,
+    },
 }
\ No newline at end of file
@@ -1,20 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor, wait
 from enum import Enum
 import importlib
 import importlib.util
 import logging
-import time
 from pathlib import Path
+from time import perf_counter
 from types import ModuleType
+from typing import Optional
 from venv import logger
 from ipanema.config.config import CONFIG
+from ipanema.core.run_metrics import RunMetrics
 from ipanema.exceptions import (
     IpanemaImportError, 
     IpanemaInitializationError, 
     IpanemaFittingError, 
     IpanemaOutputError
 )
+from ipanema.fit import FitResult, FitStage
 from ipanema.input import InputPlugin
-from ipanema.model import ModelPlugin
+from ipanema.model import FcnProfiler, ModelPlugin
 from ipanema.output import OutputPlugin
 
 class Core():
@@ -22,14 +26,17 @@ class Core():
     Main handler class for Ipanema's Plugin-Based System.
 
     This class is responsible for coordinating the full workflow: 
-    dynamically loading input, model, and output plugins; preparing and fitting
-    the model; and displaying results via the specified output plugins.
+    dynamically loading input, model, and output plugins; preparing the model;
+    fitting it once in a dedicated fit stage; and displaying the fit results 
+    via the specified output plugins.
 
     Attributes:
         PluginType (Enum): Identifiers for plugin types (input, model, output).
         PluginPath (Enum): Base module paths for resolving plugins.
         DefaultPlugin (Enum): Fallback plugin names if none are specified 
             in the config.
+        metrics (RunMetrics): Stage timings and FCN latencies of the last 
+            run.
     """
 
     class PluginType(Enum):
@@ -52,24 +59,55 @@ class Core():
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s'
         ) 
+        self.metrics = RunMetrics()
 
     def run_ipanema(self) -> None:
         """
         Executes the complete Ipanema workflow.
  
         Loads the plugins specified in the configuration, prepares the model 
-        using parameters from the input plugin, runs the fit, and generates 
-        results via the output plugins.
+        using parameters from the input plugin, runs the configured fit steps 
+        once, and generates results via the output plugins from the shared 
+        fit result.
+
+        Every stage is timed into 'metrics', which are exported as set in 
+        the "metrics" section of the configuration, even if the run fails.
 
         Raises:
             IpanemaInitializationError: If an error occurs during input plugin 
                 execution.
-            IpanemaFittingError: If an error occurs during model preparation.
-            IpanemaOutputError: If an error occurs while fitting the model or
-                generating output results.
+            IpanemaFittingError: If an error occurs during model preparation
+                or while fitting the model.
+            IpanemaOutputError: If an error occurs while generating output 
+                results.
         """
+        metrics = self.metrics = RunMetrics()
         try:
-            InputClass, ModelClass, output_classes = self._resolve_plugins()
+            self._run_stages(metrics)
+        finally:
+            # Exported whatever the outcome, so failed runs are monitored too
+            self._export_metrics(metrics)
+
+    def _run_stages(self, metrics: RunMetrics) -> None:
+        """
+        Runs the stages of the Ipanema workflow, timing them into 'metrics'.
+
+        Args:
+            metrics (RunMetrics): Metrics of the run.
+
+        Raises:
+            IpanemaInitializationError: If an error occurs during input plugin 
+                execution.
+            IpanemaFittingError: If an error occurs during model preparation
+                or while fitting the model.
+            IpanemaOutputError: If an error occurs while generating output 
+                results.
+        """
+        try:
+            with metrics.stage("resolve_plugins"):
+                InputClass, ModelClass, output_classes = (
+                    self._resolve_plugins()
+                )
         except IpanemaImportError as e:
             logger.critical(f"Problem during module import" 
                             f"or class resolution: {e}")
@@ -77,7 +115,8 @@ class Core():
         
         logger.info(f"Obtaining parameters from '{InputClass}'")
         try:
-            parameters: dict = InputClass.get_params()
+            with metrics.stage("input"):
+                parameters: dict = InputClass.get_params()
         except Exception as e:
             logger.exception(
                 f"Problem obtaining input parameters" 
@@ -89,9 +128,10 @@ class Core():
 
         logger.info(f"Preparing model '{ModelClass}' for fitting")
         model: ModelPlugin = ModelClass(parameters)
-        start_time: float = time.time()
+        start_time: float = perf_counter()
         try:
-            model.prepare_fit()
+            with metrics.stage("prepare_fit"):
+                model.prepare_fit()
         except Exception as e:
             logger.exception(
                 f"Problem during fit manager preparation" 
@@ -100,27 +140,162 @@ class Core():
             raise IpanemaFittingError(
                 "Problem during fit manager preparation"
             ) from e
+
+        logger.info(f"Fitting model '{ModelClass}'")
+        hooks: list = []
+        registered: list = []
+        trace_path: Optional[str] = (CONFIG.get("metrics") or {}).get(
+            "fcn_trace"
+        )
+        try:
+            if hasattr(model, "add_fcn_hook"):
+                hooks.append(metrics.record_fcn)
+                if trace_path:
+                    hooks.append(
+                        FcnProfiler(names=model.fit_manager.parameters)
+                    )
+            for hook in hooks:
+                model.add_fcn_hook(hook)
+                registered.append(hook)
+            fit_stage = FitStage.from_config(CONFIG.get("fit", {}))
+            with metrics.stage("fit"):
+                result: FitResult = fit_stage.run(model)
+        except Exception as e:
+            logger.exception(
+                f"Problem during fit manager execution in '{ModelClass}'"
+            )
+            raise IpanemaFittingError(
+                "Problem during fit manager execution"
+            ) from e
+        finally:
+            for hook in registered:
+                model.remove_fcn_hook(hook)
+                if isinstance(hook, FcnProfiler):
+                    self._save_fcn_trace(hook, trace_path)
+        for step, seconds in fit_stage.timings.items():
+            metrics.record(f"fit.{step}", seconds)
+
+        try:
+            with metrics.stage("outputs"):
+                self._run_outputs(model, result, output_classes, metrics)
+        finally:
+            end_time: float = perf_counter()
+            logger.info(
+                f"Calculation time: {end_time - start_time:.10f} seconds"
+            )
         
-        for OutputClass in output_classes:
-            output: OutputPlugin = OutputClass()
+    def _run_outputs(
+            self,
+            model: ModelPlugin,
+            result: FitResult,
+            output_classes: list[type[OutputPlugin]],
+            metrics: Optional[RunMetrics] = None
+        ) -> None:
+        """
+        Runs every output plugin concurrently over the shared fit result.
+
+        Thread-safe plugins are submitted individually to a thread pool, 
+        while the remaining plugins are executed one after another on the 
+        calling thread, concurrently with the thread-safe ones. The calling
+        thread owns the CUDA context of the model, so only non-thread-safe
+        plugins may use 'model.cuda_manager'. A failing plugin does not stop
+        the others.
+
+        Args:
+            model (ModelPlugin): The fitted model.
+            result (FitResult): Immutable result of the model fit.
+            output_classes (list[type[OutputPlugin]]): Output plugins to run.
+            metrics (RunMetrics, optional): Metrics where the time spent by 
+                each plugin is recorded as "output.<class name>".
+
+        Raises:
+            IpanemaOutputError: If one or more output plugins failed, once 
+                every plugin has finished.
+        """
+        outputs: list[OutputPlugin] = [
+            OutputClass() for OutputClass in output_classes
+        ]
+        concurrent: list[OutputPlugin] = [
+            output for output in outputs 
+            if getattr(output, "thread_safe", False)
+        ]
+        sequential: list[OutputPlugin] = [
+            output for output in outputs 
+            if not getattr(output, "thread_safe", False)
+        ]
+        failed: list[str] = []
+
+        def generate(output: OutputPlugin) -> None:
             logger.info(
-                    f"Starting Results Generation on '{OutputClass}'"
-                    f" for model '{ModelClass}'"
-                )
-            try:   
-                output.generate_results(model)
-            except Exception as e:
+                f"Starting Results Generation on '{type(output)}'"
+                f" for model '{type(model)}'"
+            )
+            start = perf_counter()
+            try:
+                output.generate_results(model, result)
+            except Exception:
                 logger.exception(
-                    f"Problem during fit manager execution or results " 
-                    f"presentation in '{OutputClass}'"
+                    f"Problem during results presentation in '{type(output)}'"
                 )
-                raise IpanemaOutputError(
-                    "Problem during fit manager execution or results"
-                ) from e
-            
-        end_time: float = time.time()
-        logger.info(f"Calculation time: {end_time - start_time:.10f} seconds")
-        
+                failed.append(type(output).__name__)
+            if metrics is not None:
+                metrics.record(
+                    f"output.{type(output).__name__}", perf_counter() - start
+                )
+
+        max_workers: int = (
+            CONFIG.get("output_workers") or max(len(concurrent), 1)
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(generate, output) for output in concurrent
+            ]
+            # Run on the calling thread, the one owning the CUDA context
+            for output in sequential:
+                generate(output)
+            wait(futures)
+
+        if failed:
+            raise IpanemaOutputError(
+                f"Problem during results presentation in {sorted(failed)}"
+            )
+
+    @staticmethod
+    def _export_metrics(metrics: RunMetrics) -> None:
+        """
+        Exports the metrics of a run as set in the configuration.
+
+        Export problems are logged and never interrupt the run.
+
+        Args:
+            metrics (RunMetrics): Metrics of the run.
+        """
+        metrics_config: dict = CONFIG.get("metrics") or {}
+        path: Optional[str] = metrics_config.get("path")
+        if not path:
+            return
+        try:
+            metrics.export(path, metrics_config.get("format", "jsonl"))
+        except Exception:
+            logger.exception(f"Problem exporting run metrics to '{path}'")
+
+    @staticmethod
+    def _save_fcn_trace(profiler: FcnProfiler, path: str) -> None:
+        """
+        Saves the FCN trace of a run, logging its call-pattern summary.
+
+        Saving problems are logged and never interrupt the run.
+
+        Args:
+            profiler (FcnProfiler): Profiler attached during the fit.
+            path (str): Destination '.npz' file.
+        """
+        logger.info(f"FCN call pattern: {profiler.call_pattern()}")
+        try:
+            profiler.save(path)
+        except Exception:
+            logger.exception(f"Problem saving FCN trace to '{path}'")
+
     def _resolve_plugins(
             self
         ) -> tuple[
@@ -0,0 +1,173 @@
+from contextlib import contextmanager
+from enum import Enum
+import json
+from pathlib import Path
+import socket
+from threading import Lock
+import time
+from typing import Iterator
+import numpy as np
+
+class RunMetrics():
+    """
+    Per-stage timings and FCN latency statistics of an Ipanema run.
+
+    Stage durations are measured with 'time.perf_counter'. FCN latencies are
+    gathered through 'record_fcn', which can be registered as a FCN hook of
+    a ModelPlugin. Metrics are exported at the end of a run, either appended
+    as a JSON line or written as a Prometheus textfile.
+
+    Attributes:
+        ExportFormat (Enum): Supported export formats.
+        QUANTILES (tuple[float, ...]): FCN latency quantiles reported.
+        stages (dict[str, float]): Seconds spent in each stage, in order.
+        fcn_latencies (np.ndarray): Duration of each recorded FCN call.
+    """
+
+    class ExportFormat(Enum):
+        JSON_LINES: str = "jsonl"
+        PROMETHEUS: str = "prometheus"
+
+    QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99)
+
+    __lock: Lock
+    __stages: dict[str, float]
+    __fcn_latencies: list[float]
+
+    def __init__(self) -> None:
+        """Initializes empty metrics."""
+        self.__lock = Lock()
+        self.__stages = {}
+        self.__fcn_latencies = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Measures the duration of a block of code as a stage.
+
+        The stage is recorded even if the block raises.
+
+        Args:
+            name (str): Name of the stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Adds a duration to a stage.
+
+        Args:
+            name (str): Name of the stage.
+            seconds (float): Duration to add.
+        """
+        with self.__lock:
+            self.__stages[name] = self.__stages.get(name, 0.) + seconds
+
+    def record_fcn(self, args: tuple, value: float, seconds: float) -> None:
+        """
+        FCN hook recording the latency of a call.
+
+        Args:
+            args (tuple): Arguments of the call (unused).
+            value (float): FCN value (unused).
+            seconds (float): Duration of the call.
+        """
+        self.__fcn_latencies.append(seconds)
+
+    def summary(self) -> dict:
+        """
+        Builds a serializable summary of the metrics.
+
+        Returns:
+            dict: Stage durations and FCN call count, mean latency and
+                latency quantiles (in seconds).
+        """
+        latencies = self.fcn_latencies
+        fcn: dict = {"calls": int(latencies.size)}
+        if latencies.size:
+            fcn["mean"] = float(latencies.mean())
+            for q in RunMetrics.QUANTILES:
+                fcn[f"p{q*100:g}"] = float(np.quantile(latencies, q))
+        return {"stages": self.stages, "fcn": fcn}
+
+    def export(self, path: str | Path, fmt: str = "jsonl") -> None:
+        """
+        Exports the metrics of the run.
+
+        JSON lines are appended to 'path', so a single file collects the
+        history of several runs. Prometheus textfiles are replaced
+        atomically, as expected by the node exporter textfile collector.
+
+        Args:
+            path (str | Path): Destination file.
+            fmt (str, optional): "jsonl" or "prometheus". Defaults to "jsonl".
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if fmt == RunMetrics.ExportFormat.JSON_LINES.value:
+            record = {
+                "timestamp": time.time(),
+                "host": socket.gethostname(),
+                **self.summary()
+            }
+            with open(path, "a", encoding="UTF-8") as file:
+                file.write(json.dumps(record) + "\n")
+        elif fmt == RunMetrics.ExportFormat.PROMETHEUS.value:
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "w", encoding="UTF-8") as file:
+                file.write(self.__prometheus())
+            tmp_path.replace(path)
+        else:
+            raise ValueError(f"Unsupported metrics format: '{fmt}'")
+
+    def __prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format."""
+        summary = self.summary()
+        lines = [
+            "# HELP ipanema_stage_seconds Duration of each stage of the run.",
+            "# TYPE ipanema_stage_seconds gauge"
+        ]
+        lines += [
+            f'ipanema_stage_seconds{{stage="{name}"}} {seconds:.9g}'
+            for name, seconds in summary["stages"].items()
+        ]
+        fcn = summary["fcn"]
+        lines += [
+            "# HELP ipanema_fcn_calls Number of FCN calls of the run.",
+            "# TYPE ipanema_fcn_calls gauge",
+            f"ipanema_fcn_calls {fcn['calls']}"
+        ]
+        if fcn["calls"]:
+            lines += [
+                "# HELP ipanema_fcn_latency_seconds Latency of the FCN calls.",
+                "# TYPE ipanema_fcn_latency_seconds summary"
+            ]
+            lines += [
+                f'ipanema_fcn_latency_seconds{{quantile="{q:g}"}} '
+                f'{fcn[f"p{q*100:g}"]:.9g}'
+                for q in RunMetrics.QUANTILES
+            ]
+            lines += [
+                f"ipanema_fcn_latency_seconds_sum "
+                f"{fcn['mean']*fcn['calls']:.9g}",
+                f"ipanema_fcn_latency_seconds_count {fcn['calls']}"
+            ]
+        return "\n".join(lines) + "\n"
+
+    @property
+    def stages(self) -> dict[str, float]:
+        """Getter for stages property (copy)."""
+        with self.__lock:
+            return dict(self.__stages)
+
+    @property
+    def fcn_latencies(self) -> np.ndarray:
+        """Getter for fcn_latencies property (copy)."""
+        return np.array(self.__fcn_latencies, dtype=np.float64)
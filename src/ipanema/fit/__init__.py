@@ -0,0 +1,15 @@
+from .fit_cache import FitCache
+from .fit_result import FitResult
+from .fit_stage import FitStage
+from .scan_engine import ScanEngine
+from .toy_engine import ToyEngine
+from .worker_pool import ModelWorkerPool
+
+__all__ = [
+    "FitCache",
+    "FitResult",
+    "FitStage",
+    "ModelWorkerPool",
+    "ScanEngine",
+    "ToyEngine"
+]
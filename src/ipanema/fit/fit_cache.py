@@ -0,0 +1,169 @@
+import hashlib
+from pathlib import Path
+import pickle
+from typing import Any, Mapping, Optional
+import numpy as np
+from iminuit import Minuit
+from ipanema.config.config import CONFIG
+from ipanema.fit.fit_result import FitResult
+
+class FitCache():
+    """
+    On-disk cache of fit results keyed on model and dataset fingerprints.
+
+    Results are stored as '<path>/<model key>/<dataset key>.pkl'. A lookup
+    with both keys known returns the stored result directly; a lookup with
+    a known model but new data returns the most recent result of that model,
+    which can be used to warm-start the fit.
+
+    Attributes:
+        MODEL_SETTINGS (tuple[str, ...]): Configuration keys changing the
+            FCN of the models reading them, part of every model fingerprint.
+        path (Path): Directory where results are stored.
+    """
+
+    MODEL_SETTINGS: tuple[str, ...] = ("backend", "precision")
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            path (str | Path): Directory where results are stored. Created
+                if it does not exist.
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def dataset_fingerprint(parameters: Mapping[str, Any]) -> str:
+        """
+        Fast hash of the parameters returned by an input plugin.
+
+        Arrays are hashed from their raw memory together with their dtype
+        and shape; any other value is hashed from its representation.
+
+        Args:
+            parameters (Mapping[str, Any]): Parameters of the input plugin.
+
+        Returns:
+            str: Hexadecimal fingerprint of the dataset.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for key in sorted(parameters):
+            value = parameters[key]
+            digest.update(key.encode())
+            if isinstance(value, np.ndarray):
+                digest.update(f"{value.dtype.str}{value.shape}".encode())
+                digest.update(memoryview(np.ascontiguousarray(value)).cast("B"))
+            else:
+                digest.update(repr(value).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def model_fingerprint(
+            model_class: type,
+            fit_manager: Minuit,
+            steps: tuple[str, ...],
+            settings: Optional[Mapping[str, Any]] = None
+        ) -> str:
+        """
+        Hash of a model plugin and its fit configuration.
+
+        Combines the model class, its settings (the 'MODEL_SETTINGS' of 
+        CONFIG, overridden by 'settings'), the initial state of its fit 
+        manager (values, errors, limits and fixed parameters) and the fit 
+        steps. The initial values, errors and limits of the 
+        'extensive_parameters' of the model are left out, as models usually
+        derive them from the number of events, so the same model fitted to 
+        datasets of other sizes shares its fingerprint.
+
+        Args:
+            model_class (type): ModelPlugin class.
+            fit_manager (Minuit): Prepared, not yet fitted, fit manager.
+            steps (tuple[str, ...]): Fit steps to execute.
+            settings (Mapping[str, Any], optional): Settings of the model 
+                instance (e.g. 'ModelPlugin.init_kwargs').
+
+        Returns:
+            str: Hexadecimal fingerprint of the model configuration.
+        """
+        model_settings = {
+            key: CONFIG.get(key) for key in FitCache.MODEL_SETTINGS
+        }
+        model_settings.update(settings or {})
+        extensive = set(getattr(model_class, "extensive_parameters", ()))
+        intensive = [
+            i for i, name in enumerate(fit_manager.parameters) 
+            if name not in extensive
+        ]
+        configuration = (
+            f"{model_class.__module__}.{model_class.__qualname__}",
+            tuple(sorted(model_settings.items())),
+            tuple(fit_manager.parameters),
+            tuple(fit_manager.values[i] for i in intensive),
+            tuple(fit_manager.errors[i] for i in intensive),
+            tuple(tuple(fit_manager.limits[i]) for i in intensive),
+            tuple(fit_manager.fixed),
+            fit_manager.errordef,
+            tuple(steps)
+        )
+        return hashlib.blake2b(
+            repr(configuration).encode(), digest_size=16
+        ).hexdigest()
+
+    def lookup(
+            self,
+            model_key: str,
+            dataset_key: str
+        ) -> tuple[Optional[FitResult], Optional[FitResult]]:
+        """
+        Searches the cache for a stored result.
+
+        Args:
+            model_key (str): Fingerprint of the model configuration.
+            dataset_key (str): Fingerprint of the dataset.
+
+        Returns:
+            tuple: Result stored for both keys (or None) and the most
+                recent result stored for the model on any dataset (or None).
+        """
+        model_dir = self.path / model_key
+        exact_file = model_dir / f"{dataset_key}.pkl"
+        if exact_file.exists():
+            exact = self.__load(exact_file)
+            return exact, exact
+        candidates = sorted(
+            model_dir.glob("*.pkl"), key=lambda file: file.stat().st_mtime
+        ) if model_dir.exists() else []
+        if candidates:
+            return None, self.__load(candidates[-1])
+        return None, None
+
+    def store(
+            self,
+            model_key: str,
+            dataset_key: str,
+            result: FitResult
+        ) -> None:
+        """
+        Stores a fit result.
+
+        Args:
+            model_key (str): Fingerprint of the model configuration.
+            dataset_key (str): Fingerprint of the dataset.
+            result (FitResult): Result to store.
+        """
+        model_dir = self.path / model_key
+        model_dir.mkdir(exist_ok=True)
+        # Written aside and renamed, so readers never see partial files
+        tmp_file = model_dir / f"{dataset_key}.tmp"
+        with open(tmp_file, "wb") as file:
+            pickle.dump(result, file)
+        tmp_file.replace(model_dir / f"{dataset_key}.pkl")
+
+    @staticmethod
+    def __load(file_path: Path) -> FitResult:
+        """Loads a stored result."""
+        with open(file_path, "rb") as file:
+            return pickle.load(file)
@@ -0,0 +1,111 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional
+import numpy as np
+from iminuit import Minuit
+
+@dataclass(frozen=True)
+class FitResult():
+    """
+    Immutable snapshot of a finished fit.
+
+    Produced once by the fit stage and shared by every output plugin, so
+    results can be presented without touching (or re-running) the fit manager.
+
+    Attributes:
+        parameters (tuple[str, ...]): Ordered names of the fitted parameters.
+        values (Mapping[str, float]): Parameter values at the minimum.
+        errors (Mapping[str, float]): Parabolic parameter errors.
+        fixed (Mapping[str, bool]): Whether each parameter was fixed.
+        fval (float): FCN value at the minimum.
+        valid (bool): Whether the minimization converged to a valid minimum.
+        nfcn (int): Total number of FCN calls used by the fit.
+        steps (tuple[str, ...]): Fit steps executed, in order.
+        covariance (np.ndarray, optional): Read-only covariance matrix, if
+            it was computed.
+        minos_errors (Mapping[str, tuple[float, float]]): Asymmetric
+            (lower, upper) errors of the parameters processed by MINOS.
+        n_events (int, optional): Number of events of the fitted data, if
+            recorded (cached fits record it to rescale the extensive 
+            parameters of later fits).
+    """
+
+    parameters: tuple[str, ...]
+    values: Mapping[str, float]
+    errors: Mapping[str, float]
+    fixed: Mapping[str, bool]
+    fval: float
+    valid: bool
+    nfcn: int
+    steps: tuple[str, ...] = ()
+    covariance: Optional[np.ndarray] = None
+    minos_errors: Mapping[str, tuple[float, float]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    n_events: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # Private read-only copies, whatever the mappings given
+        for name in ("values", "errors", "fixed", "minos_errors"):
+            object.__setattr__(
+                self, name, MappingProxyType(dict(getattr(self, name)))
+            )
+        object.__setattr__(self, "parameters", tuple(self.parameters))
+        object.__setattr__(self, "steps", tuple(self.steps))
+        if self.covariance is not None:
+            covariance = np.array(self.covariance, dtype=np.float64)
+            covariance.setflags(write=False)
+            object.__setattr__(self, "covariance", covariance)
+
+    def __reduce__(self) -> tuple:
+        # Mapping proxies cannot be pickled, plain copies are sent instead
+        return FitResult, (
+            self.parameters,
+            dict(self.values),
+            dict(self.errors),
+            dict(self.fixed),
+            self.fval,
+            self.valid,
+            self.nfcn,
+            self.steps,
+            self.covariance,
+            dict(self.minos_errors),
+            self.n_events
+        )
+
+    @classmethod
+    def from_minuit(
+            cls,
+            minuit: Minuit,
+            steps: tuple[str, ...] = (),
+            n_events: Optional[int] = None
+        ) -> "FitResult":
+        """
+        Builds a FitResult from the current state of a Minuit instance.
+
+        Args:
+            minuit (Minuit): Fit manager after the fit steps were executed.
+            steps (tuple[str, ...], optional): Names of the executed steps.
+            n_events (int, optional): Number of events of the fitted data.
+
+        Returns:
+            FitResult: Read-only copy of the fit manager state.
+        """
+        names: tuple[str, ...] = tuple(minuit.parameters)
+
+        return cls(
+            parameters=names,
+            values={name: float(minuit.values[name]) for name in names},
+            errors={name: float(minuit.errors[name]) for name in names},
+            fixed={name: bool(minuit.fixed[name]) for name in names},
+            fval=float(minuit.fval) if minuit.fval is not None else np.nan,
+            valid=bool(minuit.valid),
+            nfcn=int(minuit.nfcn),
+            steps=steps,
+            covariance=minuit.covariance,
+            minos_errors={
+                name: (float(error.lower), float(error.upper))
+                for name, error in minuit.merrors.items()
+            },
+            n_events=n_events,
+        )
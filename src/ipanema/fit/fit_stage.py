@@ -0,0 +1,226 @@
+from enum import Enum
+from time import perf_counter
+from typing import Mapping, Optional
+from venv import logger
+import numpy as np
+from iminuit import Minuit
+from ipanema.fit.fit_cache import FitCache
+from ipanema.fit.fit_result import FitResult
+from ipanema.fit.strategies import STRATEGIES, FitStrategy
+from ipanema.model import ModelPlugin
+
+class FitStage():
+    """
+    Pipeline stage responsible for the minimization of a prepared model.
+
+    The configured fit steps are executed exactly once over the model's fit
+    manager and the outcome is frozen into a FitResult, which is then shared
+    by every output plugin.
+
+    If a FitCache is given, a result stored for the same model configuration
+    and dataset is returned without fitting, and a result stored for the
+    same model configuration on other data is used to warm-start the fit,
+    with its 'extensive_parameters' rescaled to the number of events.
+    If a FitStrategy is given, it runs right before the fit steps to bring 
+    the fit manager close to the minimum.
+
+    Attributes:
+        FitStep (Enum): Fit steps supported by the stage.
+        steps (tuple[str, ...]): Fit steps executed by 'run', in order.
+        cache (FitCache, optional): Result cache used by 'run'.
+        strategy (FitStrategy, optional): Strategy run before the fit steps.
+        timings (dict[str, float]): Seconds spent by the last 'run' in the 
+            strategy ("strategy") and in each fit step.
+    """
+
+    class FitStep(Enum):
+        MIGRAD: str = "migrad"
+        HESSE: str = "hesse"
+        MINOS: str = "minos"
+
+    DEFAULT_STEPS: tuple[str, ...] = (
+        FitStep.MIGRAD.value,
+        FitStep.HESSE.value
+    )
+
+    __steps: tuple[str, ...]
+
+    def __init__(
+            self, 
+            steps: list[str] | None = None,
+            cache: Optional[FitCache] = None,
+            strategy: Optional[FitStrategy] = None
+        ) -> None:
+        """
+        Initializes the fit stage.
+
+        Args:
+            steps (list[str], optional): Names of the fit steps to execute.
+                Defaults to 'DEFAULT_STEPS'.
+            cache (FitCache, optional): Result cache. Defaults to None.
+            strategy (FitStrategy, optional): Strategy run before the fit 
+                steps. Defaults to None.
+
+        Raises:
+            ValueError: If any of the steps is not supported.
+        """
+        if steps is None:
+            steps = list(FitStage.DEFAULT_STEPS)
+        supported: set[str] = {step.value for step in FitStage.FitStep}
+        unknown: list[str] = [step for step in steps if step not in supported]
+        if unknown:
+            raise ValueError(f"Unsupported fit steps: {unknown}")
+        self.__steps = tuple(steps)
+        self.cache = cache
+        self.strategy = strategy
+        self.timings = {}
+
+    @classmethod
+    def from_config(cls, config: dict) -> "FitStage":
+        """
+        Builds a fit stage from the "fit" section of the configuration.
+
+        Args:
+            config (dict): Fit settings with the optional keys "steps", 
+                "cache" (directory) and "strategy" (dict with a "name" from 
+                'STRATEGIES' and the keyword arguments of that strategy).
+
+        Returns:
+            FitStage: Configured fit stage.
+
+        Raises:
+            ValueError: If the steps or the strategy name are not supported.
+        """
+        cache_path = config.get("cache")
+        strategy_config: Optional[dict] = config.get("strategy")
+        strategy = None
+        if strategy_config:
+            options = dict(strategy_config)
+            name = options.pop("name")
+            if name not in STRATEGIES:
+                raise ValueError(f"Unsupported fit strategy: '{name}'")
+            strategy = STRATEGIES[name](**options)
+        return cls(
+            config.get("steps"),
+            FitCache(cache_path) if cache_path else None,
+            strategy
+        )
+
+    def run(self, model: ModelPlugin) -> FitResult:
+        """
+        Executes the configured fit steps over the model's fit manager.
+
+        Args:
+            model (ModelPlugin): Model whose 'fit_manager' has been prepared.
+
+        Returns:
+            FitResult: Immutable snapshot of the fit manager after the steps.
+        """
+        fit_manager = model.fit_manager
+        self.timings = {}
+        n_events = None
+
+        if self.cache is not None:
+            n_events = model.n_events
+            model_key = FitCache.model_fingerprint(
+                type(model), fit_manager, self.__steps, model.init_kwargs
+            )
+            dataset_key = FitCache.dataset_fingerprint(model.parameters)
+            exact, nearest = self.cache.lookup(model_key, dataset_key)
+            if exact is not None:
+                logger.info("Fit result found in cache, skipping fit")
+                self._load_values(fit_manager, exact, with_errors=True)
+                return exact
+            if nearest is not None:
+                logger.info("Warm-starting fit from a cached result")
+                self._load_values(
+                    fit_manager, nearest, with_errors=True, 
+                    scales=self._extensive_scales(model, nearest)
+                )
+
+        if self.strategy is not None:
+            start = perf_counter()
+            self.strategy.prepare(model)
+            self.timings["strategy"] = perf_counter() - start
+
+        for step in self.__steps:
+            logger.info(f"Running fit step '{step}'")
+            start = perf_counter()
+            getattr(fit_manager, step)()
+            self.timings[step] = perf_counter() - start
+        result = FitResult.from_minuit(
+            fit_manager, self.__steps, n_events
+        )
+
+        if self.cache is not None:
+            self.cache.store(model_key, dataset_key, result)
+        return result
+
+    @staticmethod
+    def _load_values(
+            fit_manager: Minuit, 
+            result: FitResult,
+            with_errors: bool = False,
+            scales: Optional[Mapping[str, float]] = None
+        ) -> None:
+        """
+        Loads the values of a previous result into a fit manager.
+
+        Values are multiplied by their scale, if any, and clipped to the 
+        current limits. Errors of free parameters are also loaded if 
+        requested, taken from the covariance diagonal when available, so 
+        that they drive the initial step sizes of MIGRAD. Errors of scaled 
+        values are multiplied by the square root of the scale, as those of 
+        event yields.
+
+        Args:
+            fit_manager (Minuit): Fit manager to update.
+            result (FitResult): Result providing the values.
+            with_errors (bool, optional): Whether to load errors too.
+            scales (Mapping[str, float], optional): Factors applied to the
+                values of some parameters. Defaults to none.
+        """
+        scales = scales or {}
+        for i, name in enumerate(result.parameters):
+            if name not in fit_manager.parameters or fit_manager.fixed[name]:
+                continue
+            scale = scales.get(name, 1.)
+            low, high = fit_manager.limits[name]
+            fit_manager.values[name] = float(
+                np.clip(result.values[name]*scale, low, high)
+            )
+            if not with_errors:
+                continue
+            error = result.errors[name]
+            if result.covariance is not None:
+                error = float(np.sqrt(result.covariance[i, i]))
+            if error > 0:
+                fit_manager.errors[name] = error*np.sqrt(scale)
+
+    @staticmethod
+    def _extensive_scales(
+            model: ModelPlugin, 
+            result: FitResult
+        ) -> dict[str, float]:
+        """
+        Factors bringing the extensive parameters of a result obtained on 
+        other data to the number of events of the model.
+
+        Args:
+            model (ModelPlugin): Model to fit.
+            result (FitResult): Result on other data.
+
+        Returns:
+            dict[str, float]: Ratio of event counts for each extensive
+                parameter, or no factors if either count is unknown.
+        """
+        n_events = model.n_events
+        if not n_events or not result.n_events:
+            return {}
+        ratio = n_events/result.n_events
+        return {name: ratio for name in model.extensive_parameters}
+
+    @property
+    def steps(self) -> tuple[str, ...]:
+        """Getter for steps property."""
+        return self.__steps
@@ -0,0 +1,247 @@
+from typing import Any, Mapping, Optional
+import numpy as np
+from ipanema.fit.fit_result import FitResult
+from ipanema.fit.worker_pool import ModelWorkerPool, worker_model
+from ipanema.model import ModelPlugin
+
+PROFILE_DTYPE = np.dtype([
+    ("value", np.float64),
+    ("fval", np.float64),
+    ("valid", np.bool_)
+])
+
+GRID_DTYPE = np.dtype([
+    ("x", np.float64),
+    ("y", np.float64),
+    ("fval", np.float64),
+    ("valid", np.bool_)
+])
+
+MINOS_DTYPE = np.dtype([
+    ("parameter", "U32"),
+    ("lower", np.float64),
+    ("upper", np.float64),
+    ("valid", np.bool_)
+])
+
+def _minimize_fixed(names: tuple[str, ...], values: tuple[float, ...]) -> tuple:
+    """
+    Worker task: minimizes the worker model with some parameters fixed.
+
+    Args:
+        names (tuple[str, ...]): Parameters to fix.
+        values (tuple[float, ...]): Values of the fixed parameters.
+
+    Returns:
+        tuple: FCN value at the conditional minimum and its validity.
+    """
+    fit_manager = worker_model().fit_manager
+    for name, value in zip(names, values):
+        fit_manager.fixed[name] = True
+        fit_manager.values[name] = value
+    fit_manager.migrad()
+    return float(fit_manager.fval), bool(fit_manager.valid)
+
+def _run_minos(name: str) -> tuple:
+    """
+    Worker task: computes the MINOS errors of a single parameter.
+
+    Args:
+        name (str): Parameter to process.
+
+    Returns:
+        tuple: Parameter name, lower and upper errors and their validity.
+    """
+    fit_manager = worker_model().fit_manager
+    fit_manager.migrad()
+    fit_manager.minos(name)
+    error = fit_manager.merrors[name]
+    return name, float(error.lower), float(error.upper), bool(error.is_valid)
+
+
+class ScanEngine():
+    """
+    Distributes likelihood scans and MINOS runs across a process pool.
+
+    Every worker holds its own model instance, built from the input plugin
+    parameters through Core's plugin resolution and started from the
+    fitted values. Scan points and per-parameter MINOS runs are independent
+    tasks, and results are returned as compact structured arrays.
+
+    Attributes:
+        result (FitResult): Fit used as starting point of every task.
+        max_workers (int, optional): Number of worker processes.
+    """
+
+    def __init__(
+            self,
+            parameters: dict,
+            result: FitResult,
+            model_class: Optional[type[ModelPlugin]] = None,
+            max_workers: Optional[int] = None,
+            model_kwargs: Optional[Mapping[str, Any]] = None
+        ) -> None:
+        """
+        Initializes the scan engine.
+
+        Args:
+            parameters (dict): Parameters returned by the input plugin.
+            result (FitResult): Fit used as starting point of every task.
+            model_class (type[ModelPlugin], optional): Model built by the
+                workers. Defaults to the model resolved by Core.
+            max_workers (int, optional): Number of worker processes.
+                Defaults to the number of CPUs.
+            model_kwargs (Mapping[str, Any], optional): Keyword arguments of
+                the model constructor (see 'ModelPlugin.init_kwargs').
+        """
+        self.result = result
+        self.max_workers = max_workers
+        self.__parameters = parameters
+        self.__model_class = model_class
+        self.__model_kwargs = dict(model_kwargs or {})
+
+    def profile(
+            self,
+            name: str,
+            values: Optional[np.ndarray] = None,
+            size: int = 21,
+            bound: float = 3.
+        ) -> np.ndarray:
+        """
+        Computes the profile likelihood of a single parameter.
+
+        Args:
+            name (str): Parameter to profile.
+            values (np.ndarray, optional): Points of the scan. Defaults to
+                'size' points within 'bound' errors around the fitted value.
+            size (int, optional): Number of default scan points.
+            bound (float, optional): Default scan half-width, in errors.
+
+        Returns:
+            np.ndarray: Structured array of PROFILE_DTYPE, one row per point.
+        """
+        return self.profiles([name], values, size, bound)[name]
+
+    def profiles(
+            self,
+            names: list[str],
+            values: Optional[np.ndarray] = None,
+            size: int = 21,
+            bound: float = 3.
+        ) -> dict[str, np.ndarray]:
+        """
+        Computes the profile likelihood of several parameters in one pool.
+
+        Args:
+            names (list[str]): Parameters to profile.
+            values (np.ndarray, optional): Points used for every scan.
+                Defaults to 'size' points within 'bound' errors around each
+                fitted value.
+            size (int, optional): Number of default scan points.
+            bound (float, optional): Default scan half-width, in errors.
+
+        Returns:
+            dict[str, np.ndarray]: Structured array of PROFILE_DTYPE for each
+                parameter.
+        """
+        scans: dict[str, np.ndarray] = {
+            name: np.asarray(values, dtype=np.float64) if values is not None
+            else self._default_points(name, size, bound)
+            for name in names
+        }
+        tasks: list[tuple[tuple[str, ...], tuple[float, ...]]] = [
+            ((name,), (float(value),))
+            for name, points in scans.items() for value in points
+        ]
+        # Without scan points there is nothing to send to the pool
+        outcomes = self._map(_minimize_fixed, *zip(*tasks)) if tasks else []
+
+        profiles: dict[str, np.ndarray] = {}
+        start = 0
+        for name, points in scans.items():
+            profile = np.empty(len(points), dtype=PROFILE_DTYPE)
+            profile["value"] = points
+            chunk = outcomes[start:start + len(points)]
+            profile["fval"] = [fval for fval, _ in chunk]
+            profile["valid"] = [valid for _, valid in chunk]
+            profiles[name] = profile
+            start += len(points)
+        return profiles
+
+    def grid(
+            self,
+            x: str,
+            y: str,
+            x_values: np.ndarray,
+            y_values: np.ndarray
+        ) -> np.ndarray:
+        """
+        Computes a two-parameter profile over a grid, for contour studies.
+
+        Args:
+            x (str): First parameter.
+            y (str): Second parameter.
+            x_values (np.ndarray): Scan points of the first parameter.
+            y_values (np.ndarray): Scan points of the second parameter.
+
+        Returns:
+            np.ndarray: Structured array of GRID_DTYPE with shape
+                (len(x_values), len(y_values)).
+        """
+        xx, yy = np.meshgrid(x_values, y_values, indexing="ij")
+        names = [(x, y)] * xx.size
+        points = [
+            (float(a), float(b)) for a, b in zip(xx.ravel(), yy.ravel())
+        ]
+        outcomes = self._map(_minimize_fixed, names, points)
+
+        scan = np.empty(xx.size, dtype=GRID_DTYPE)
+        scan["x"] = xx.ravel()
+        scan["y"] = yy.ravel()
+        scan["fval"] = [fval for fval, _ in outcomes]
+        scan["valid"] = [valid for _, valid in outcomes]
+        return scan.reshape(xx.shape)
+
+    def minos(self, names: Optional[list[str]] = None) -> np.ndarray:
+        """
+        Runs MINOS for every parameter, one worker task per parameter.
+
+        Args:
+            names (list[str], optional): Parameters to process. Defaults to
+                every free parameter of the fit.
+
+        Returns:
+            np.ndarray: Structured array of MINOS_DTYPE, one row per
+                parameter.
+        """
+        if names is None:
+            names = [
+                name for name in self.result.parameters
+                if not self.result.fixed[name]
+            ]
+        return np.array(
+            [tuple(row) for row in self._map(_run_minos, names)],
+            dtype=MINOS_DTYPE
+        )
+
+    def _default_points(
+            self,
+            name: str,
+            size: int,
+            bound: float
+        ) -> np.ndarray:
+        """Scan points within 'bound' errors around the fitted value."""
+        value = self.result.values[name]
+        error = self.result.errors[name]
+        return np.linspace(value - bound*error, value + bound*error, size)
+
+    def _map(self, func, *iterables) -> list:
+        """Runs a worker task over the iterables in a fresh model pool."""
+        with ModelWorkerPool(
+            self.__parameters,
+            dict(self.result.values),
+            self.__model_class,
+            self.max_workers,
+            model_kwargs=self.__model_kwargs
+        ) as pool:
+            return pool.map(func, *iterables)
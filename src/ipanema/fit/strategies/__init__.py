@@ -0,0 +1,15 @@
+from .fit_strategy import FitStrategy
+from .coarse_to_fine_strategy import CoarseToFineStrategy
+from .multi_start_strategy import MultiStartStrategy
+
+STRATEGIES: dict[str, type[FitStrategy]] = {
+    "coarse_to_fine": CoarseToFineStrategy,
+    "multi_start": MultiStartStrategy,
+}
+
+__all__ = [
+    "CoarseToFineStrategy", 
+    "FitStrategy", 
+    "MultiStartStrategy", 
+    "STRATEGIES"
+]
@@ -0,0 +1,104 @@
+from typing import Optional
+from venv import logger
+import numpy as np
+from ipanema.fit.strategies.fit_strategy import FitStrategy
+from ipanema.model import ModelPlugin
+
+class CoarseToFineStrategy(FitStrategy):
+    """
+    Fit strategy which locates the minimum on random subsamples of the data.
+
+    Each stage fits a fresh model built on a random fraction of the events 
+    with a loose tolerance, starting from the result of the previous stage. 
+    The last result is loaded into the model, so the full-data fit steps 
+    start close to the minimum. Extensive parameters of the model (e.g. 
+    yields) are rescaled by the subsample fraction between stages.
+
+    Models opt in by implementing 'ModelPlugin.subsample'; for other models 
+    the strategy does nothing.
+
+    Attributes:
+        stages (list[dict]): Subsample 'fraction' and MIGRAD 'tolerance' of 
+            each coarse stage, in order.
+        seed (int, optional): Seed used to draw the subsamples.
+    """
+
+    DEFAULT_STAGES: tuple[dict, ...] = (
+        {"fraction": 0.02, "tolerance": 1.},
+    )
+
+    def __init__(
+            self, 
+            stages: Optional[list[dict]] = None,
+            seed: Optional[int] = None
+        ) -> None:
+        """
+        Initializes the strategy.
+
+        Args:
+            stages (list[dict], optional): Subsample 'fraction' and MIGRAD 
+                'tolerance' of each coarse stage. Defaults to 
+                'DEFAULT_STAGES'.
+            seed (int, optional): Seed used to draw the subsamples.
+
+        Raises:
+            ValueError: If a fraction is not within (0, 1].
+        """
+        if stages is None:
+            stages = [dict(stage) for stage in self.DEFAULT_STAGES]
+        for stage in stages:
+            if not 0 < stage["fraction"] <= 1:
+                raise ValueError(
+                    f"Subsample fraction must be in (0, 1]: {stage}"
+                )
+        self.stages = stages
+        self.seed = seed
+
+    def prepare(self, model: ModelPlugin) -> None:
+        """
+        Runs the coarse stages and loads their result into the model.
+
+        Args:
+            model (ModelPlugin): Model whose 'fit_manager' has been prepared.
+        """
+        rng = np.random.default_rng(self.seed)
+        fit_manager = model.fit_manager
+        extensive = set(model.extensive_parameters)
+        values: dict[str, float] = {
+            name: float(fit_manager.values[name]) 
+            for name in fit_manager.parameters
+        }
+
+        for stage in self.stages:
+            fraction = stage["fraction"]
+            try:
+                sub_parameters = model.subsample(fraction, rng)
+            except NotImplementedError:
+                logger.warning(
+                    f"{type(model).__name__} does not support subsampling, "
+                    f"skipping coarse fit"
+                )
+                return
+            logger.info(f"Coarse fit over {fraction:.2%} of the data")
+            sub_model = type(model)(sub_parameters, **model.init_kwargs)
+            sub_model.prepare_fit()
+            sub_manager = sub_model.fit_manager
+            for name, value in values.items():
+                if not sub_manager.fixed[name]:
+                    scale = fraction if name in extensive else 1.
+                    low, high = sub_manager.limits[name]
+                    sub_manager.values[name] = float(
+                        np.clip(value*scale, low, high)
+                    )
+            sub_manager.tol = stage.get("tolerance", sub_manager.tol)
+            sub_manager.migrad()
+            values = {
+                name: float(sub_manager.values[name]) / (
+                    fraction if name in extensive else 1.
+                ) for name in values
+            }
+
+        for name, value in values.items():
+            if not fit_manager.fixed[name]:
+                low, high = fit_manager.limits[name]
+                fit_manager.values[name] = float(np.clip(value, low, high))
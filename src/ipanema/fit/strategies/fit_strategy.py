@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from ipanema.model import ModelPlugin
+
+class FitStrategy(ABC):
+    """
+    Abstract base class for the fit stage strategies.
+
+    A strategy runs before the configured fit steps and is responsible for 
+    moving the model's fit manager to a good starting point, so that the 
+    fit steps over the full dataset need as few FCN calls as possible.
+    """
+
+    @abstractmethod
+    def prepare(self, model: ModelPlugin) -> None:
+        """
+        Updates the values of the model's fit manager before the fit steps.
+
+        Args:
+            model (ModelPlugin): Model whose 'fit_manager' has been prepared.
+        """
+        pass
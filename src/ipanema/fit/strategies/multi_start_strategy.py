@@ -0,0 +1,178 @@
+from enum import Enum
+from importlib.util import find_spec
+import pickle
+from typing import Optional
+from venv import logger
+import numpy as np
+from ipanema.fit.strategies.fit_strategy import FitStrategy
+from ipanema.fit.worker_pool import ModelWorkerPool, worker_model
+from ipanema.model import ModelPlugin
+from sdk.math_utils.sampling import latin_hypercube, sobol
+
+def _migrad_from(start: dict[str, float]) -> tuple:
+    """
+    Worker task: runs MIGRAD from the given starting point.
+
+    Args:
+        start (dict[str, float]): Starting values of the free parameters.
+
+    Returns:
+        tuple: Values at the minimum, FCN value and validity of the minimum.
+    """
+    fit_manager = worker_model().fit_manager
+    for name, value in start.items():
+        fit_manager.values[name] = value
+    fit_manager.migrad()
+    return (
+        {name: float(fit_manager.values[name]) for name in start},
+        float(fit_manager.fval),
+        bool(fit_manager.valid)
+    )
+
+
+class MultiStartStrategy(FitStrategy):
+    """
+    Fit strategy which searches the global minimum from many starting points.
+
+    Starting points are drawn within the limits of the free parameters with
+    a space-filling design. They are pre-screened with a single batched FCN
+    evaluation ('ModelPlugin.evaluate_batch') and MIGRAD runs concurrently,
+    on a process pool, from the best candidates. The best minimum found is
+    loaded into the model before the fit steps.
+
+    Parameters without finite limits keep their current value.
+
+    Attributes:
+        Sampling (Enum): Supported space-filling designs.
+        n_starts (int): Number of candidate starting points.
+        n_best (int): Number of candidates refined with MIGRAD.
+        sampling (str): Space-filling design used for the candidates.
+        seed (int, optional): Seed of the candidates.
+        max_workers (int, optional): Number of worker processes.
+    """
+
+    class Sampling(Enum):
+        LATIN_HYPERCUBE: str = "lhs"
+        SOBOL: str = "sobol"
+
+    def __init__(
+            self,
+            n_starts: int = 64,
+            n_best: int = 4,
+            sampling: str = "lhs",
+            seed: Optional[int] = None,
+            max_workers: Optional[int] = None
+        ) -> None:
+        """
+        Initializes the strategy.
+
+        Args:
+            n_starts (int, optional): Number of candidate starting points.
+            n_best (int, optional): Number of candidates refined with MIGRAD.
+            sampling (str, optional): "lhs" (Latin hypercube) or "sobol".
+                "sobol" requires SciPy (the "sobol" extra).
+            seed (int, optional): Seed of the candidates.
+            max_workers (int, optional): Number of worker processes.
+                Defaults to 'n_best'.
+
+        Raises:
+            ValueError: If the sampling is not supported or 'n_best' is not
+                within [1, n_starts].
+            ImportError: If "sobol" sampling is requested without SciPy.
+        """
+        supported = {design.value for design in self.Sampling}
+        if sampling not in supported:
+            raise ValueError(f"Unsupported sampling '{sampling}'")
+        if not 1 <= n_best <= n_starts:
+            raise ValueError("'n_best' must be within [1, n_starts]")
+        sobol_sampling = sampling == self.Sampling.SOBOL.value
+        if sobol_sampling and find_spec("scipy") is None:
+            raise ImportError(
+                "Sobol sampling requires scipy, install it with "
+                "'pip install ipanema[sobol]'"
+            )
+        self.n_starts = n_starts
+        self.n_best = n_best
+        self.sampling = sampling
+        self.seed = seed
+        self.max_workers = max_workers
+
+    def prepare(self, model: ModelPlugin) -> None:
+        """
+        Searches the best minimum and loads it into the model.
+
+        Args:
+            model (ModelPlugin): Model whose 'fit_manager' has been prepared.
+        """
+        fit_manager = model.fit_manager
+        names: list[str] = list(fit_manager.parameters)
+        current = np.array(
+            [fit_manager.values[name] for name in names], dtype=np.float64
+        )
+        sampled: list[int] = [
+            i for i, name in enumerate(names)
+            if not fit_manager.fixed[name]
+            and np.all(np.isfinite(fit_manager.limits[name]))
+        ]
+        if not sampled:
+            logger.warning("No bounded free parameters, skipping multi-start")
+            return
+
+        # Candidate starting points within the limits
+        unit = self._unit_sample(len(sampled))
+        low = np.array([fit_manager.limits[names[i]][0] for i in sampled])
+        high = np.array([fit_manager.limits[names[i]][1] for i in sampled])
+        points = np.tile(current, (self.n_starts, 1))
+        points[:, sampled] = low + unit*(high - low)
+
+        # Cheap pre-screening of the candidates
+        fvals = model.evaluate_batch(points)
+        fvals = np.where(np.isfinite(fvals), fvals, np.inf)
+        best = np.argsort(fvals)[:self.n_best]
+        logger.info(
+            f"Running MIGRAD from the best {self.n_best} of "
+            f"{self.n_starts} starting points"
+        )
+
+        free = [name for name in names if not fit_manager.fixed[name]]
+        starts = [
+            {name: float(points[k, names.index(name)]) for name in free}
+            for k in best
+        ]
+        with ModelWorkerPool(
+            model.parameters,
+            {name: float(fit_manager.values[name]) for name in names},
+            self._model_class(model),
+            self.max_workers or self.n_best,
+            model_kwargs=model.init_kwargs
+        ) as pool:
+            minima = pool.map(_migrad_from, starts)
+
+        valid = [minimum for minimum in minima if minimum[2]] or minima
+        values, fval, _ = min(valid, key=lambda minimum: minimum[1])
+        logger.info(f"Best minimum found at FCN = {fval}")
+        for name, value in values.items():
+            fit_manager.values[name] = value
+
+    def _unit_sample(self, dimension: int) -> np.ndarray:
+        """Candidates over the unit hypercube, following 'sampling'."""
+        if self.sampling == self.Sampling.SOBOL.value:
+            return sobol(self.n_starts, dimension, self.seed)
+        return latin_hypercube(
+            self.n_starts, dimension, np.random.default_rng(self.seed)
+        )
+
+    @staticmethod
+    def _model_class(model: ModelPlugin) -> Optional[type[ModelPlugin]]:
+        """
+        Model class handed to the workers.
+
+        Plugins loaded from custom paths cannot be imported by name in the
+        workers; for them None is returned and workers resolve the model
+        through Core instead.
+        """
+        try:
+            pickle.dumps(type(model))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return None
+        return type(model)
@@ -0,0 +1,148 @@
+from typing import Any, Mapping, Optional
+import numpy as np
+from ipanema.fit.fit_result import FitResult
+from ipanema.fit.worker_pool import ModelWorkerPool, worker_model
+from ipanema.model import ModelPlugin
+
+def _run_toy(
+        seed: np.random.SeedSequence,
+        truth: Mapping[str, float]
+    ) -> tuple:
+    """
+    Worker task: generates and fits a single pseudo-experiment.
+
+    The toy is generated from the worker model at 'truth' and the fit is
+    warm-started from the same values.
+
+    Args:
+        seed (np.random.SeedSequence): Seed of this toy.
+        truth (Mapping[str, float]): Values used to generate the toy.
+
+    Returns:
+        tuple: Fitted values, errors, FCN value and validity of the fit.
+    """
+    model = worker_model()
+    model.parameters = model.generate_toy(truth, np.random.default_rng(seed))
+    model.prepare_fit()
+
+    fit_manager = model.fit_manager
+    for name, value in truth.items():
+        fit_manager.values[name] = value
+    fit_manager.migrad()
+    fit_manager.hesse()
+    return (
+        {name: float(fit_manager.values[name]) for name in truth},
+        {name: float(fit_manager.errors[name]) for name in truth},
+        float(fit_manager.fval),
+        bool(fit_manager.valid)
+    )
+
+
+class ToyEngine():
+    """
+    Runs toy Monte Carlo campaigns (generation and fit) on a process pool.
+
+    Every toy is generated from the model evaluated at the fitted values,
+    through 'ModelPlugin.generate_toy', and refitted starting from those
+    same values. Workers build their model once, through Core's plugin
+    resolution, and reuse it for every toy they process.
+
+    Attributes:
+        result (FitResult): Fit whose values generate the toys.
+        max_workers (int, optional): Number of worker processes.
+    """
+
+    def __init__(
+            self,
+            parameters: dict,
+            result: FitResult,
+            model_class: Optional[type[ModelPlugin]] = None,
+            max_workers: Optional[int] = None,
+            model_kwargs: Optional[Mapping[str, Any]] = None
+        ) -> None:
+        """
+        Initializes the toy engine.
+
+        Args:
+            parameters (dict): Parameters returned by the input plugin.
+            result (FitResult): Fit whose values generate the toys.
+            model_class (type[ModelPlugin], optional): Model built by the
+                workers. Defaults to the model resolved by Core.
+            max_workers (int, optional): Number of worker processes.
+                Defaults to the number of CPUs.
+            model_kwargs (Mapping[str, Any], optional): Keyword arguments of
+                the model constructor (see 'ModelPlugin.init_kwargs').
+        """
+        self.result = result
+        self.max_workers = max_workers
+        self.__parameters = parameters
+        self.__model_class = model_class
+        self.__model_kwargs = dict(model_kwargs or {})
+
+    def run(self, n_toys: int, seed: Optional[int] = None) -> np.ndarray:
+        """
+        Generates and fits 'n_toys' pseudo-experiments.
+
+        Args:
+            n_toys (int): Number of pseudo-experiments.
+            seed (int, optional): Seed of the campaign. Each toy receives an
+                independent stream spawned from it.
+
+        Returns:
+            np.ndarray: Structured array with one row per toy and the
+                columns 'toy', 'fval', 'valid' and, for each free parameter,
+                '<name>', '<name>_err' and '<name>_pull'.
+        """
+        truth: dict[str, float] = dict(self.result.values)
+        free: list[str] = [
+            name for name in self.result.parameters
+            if not self.result.fixed[name]
+        ]
+        seeds = np.random.SeedSequence(seed).spawn(n_toys)
+
+        with ModelWorkerPool(
+            self.__parameters,
+            truth,
+            self.__model_class,
+            self.max_workers,
+            model_kwargs=self.__model_kwargs
+        ) as pool:
+            outcomes = pool.map(_run_toy, seeds, [truth] * n_toys)
+
+        toys = np.empty(n_toys, dtype=self.dtype(free))
+        toys["toy"] = np.arange(n_toys)
+        for i, (values, errors, fval, valid) in enumerate(outcomes):
+            toys["fval"][i] = fval
+            toys["valid"][i] = valid
+            for name in free:
+                toys[name][i] = values[name]
+                toys[f"{name}_err"][i] = errors[name]
+        for name in free:
+            toys[f"{name}_pull"] = (
+                (toys[name] - truth[name])/toys[f"{name}_err"]
+            )
+        return toys
+
+    @staticmethod
+    def dtype(names: list[str]) -> np.dtype:
+        """
+        Structured dtype of a toy campaign over the given parameters.
+
+        Args:
+            names (list[str]): Free parameters of the fit.
+
+        Returns:
+            np.dtype: Columnar layout used by 'run'.
+        """
+        fields: list[tuple[str, type]] = [
+            ("toy", np.int64),
+            ("fval", np.float64),
+            ("valid", np.bool_)
+        ]
+        for name in names:
+            fields += [
+                (name, np.float64),
+                (f"{name}_err", np.float64),
+                (f"{name}_pull", np.float64)
+            ]
+        return np.dtype(fields)
@@ -0,0 +1,167 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from typing import Any, Callable, Iterable, Mapping, Optional
+from ipanema.config.config import CONFIG
+from ipanema.input import SharedDataset
+from ipanema.model import ModelPlugin
+
+# Model owned by the current worker process, built by '_initialize_worker'
+_worker_model: Optional[ModelPlugin] = None
+_worker_start_values: dict[str, float] = {}
+_worker_fixed: dict[str, bool] = {}
+
+def _initialize_worker(
+        parameters: dict,
+        start_values: Mapping[str, float],
+        model_class: Optional[type[ModelPlugin]],
+        model_kwargs: Mapping[str, Any],
+        config: dict
+    ) -> None:
+    """
+    Builds and prepares the model held by a worker process.
+
+    Args:
+        parameters (dict): Parameters returned by the input plugin.
+        start_values (Mapping[str, float]): Values loaded into the fit manager
+            before every task.
+        model_class (type[ModelPlugin], optional): Model to build. If None,
+            the model configured in CONFIG is resolved through Core.
+        model_kwargs (Mapping[str, Any]): Keyword arguments of the model
+            constructor.
+        config (dict): Snapshot of the parent's CONFIG, replacing the one
+            imported by the worker.
+    """
+    global _worker_model, _worker_start_values, _worker_fixed
+    # Spawned workers import a fresh CONFIG, missing runtime changes
+    CONFIG.clear()
+    CONFIG.update(config)
+    if model_class is None:
+        # Imported here, 'ipanema.core' depends on this package
+        from ipanema.core import Core
+        _, model_class, _ = Core()._resolve_plugins()
+    _worker_model = model_class(parameters, **model_kwargs)
+    _worker_model.prepare_fit()
+    _worker_start_values = dict(start_values)
+    _worker_fixed = {
+        name: bool(_worker_model.fit_manager.fixed[name])
+        for name in _worker_model.fit_manager.parameters
+    }
+
+def worker_model() -> ModelPlugin:
+    """
+    Returns the model of the current worker, reset to its start values.
+
+    Fixed parameters are restored to the state left by 'prepare_fit' and 
+    every value is set back to the start values.
+
+    Returns:
+        ModelPlugin: Prepared model owned by the worker process.
+
+    Raises:
+        RuntimeError: If called outside a ModelWorkerPool worker.
+    """
+    if _worker_model is None:
+        raise RuntimeError("No model available outside a worker process")
+    fit_manager = _worker_model.fit_manager
+    for name, fixed in _worker_fixed.items():
+        fit_manager.fixed[name] = fixed
+    for name, value in _worker_start_values.items():
+        fit_manager.values[name] = value
+    return _worker_model
+
+
+class ModelWorkerPool():
+    """
+    Process pool whose workers hold their own prepared model instance.
+
+    Each worker builds its model once, at start-up, from the parameters of
+    the input plugin, the constructor keyword arguments of the model and a 
+    snapshot of CONFIG taken when the pool is entered. Parameters are 
+    handed to the workers as a SharedDataset, so workers attach to the data
+    instead of receiving a copy. Tasks submitted to the pool must be 
+    module-level functions and obtain the model through 'worker_model'.
+
+    Attributes:
+        max_workers (int, optional): Number of worker processes.
+    """
+
+    __executor: Optional[ProcessPoolExecutor]
+    __shared: Optional[SharedDataset]
+
+    def __init__(
+            self,
+            parameters: dict,
+            start_values: Mapping[str, float],
+            model_class: Optional[type[ModelPlugin]] = None,
+            max_workers: Optional[int] = None,
+            start_method: str = "spawn",
+            model_kwargs: Optional[Mapping[str, Any]] = None
+        ) -> None:
+        """
+        Initializes the pool (workers are started on '__enter__').
+
+        Args:
+            parameters (dict): Parameters returned by the input plugin. 
+                Unless already a SharedDataset, they are copied into one 
+                for the lifetime of the pool.
+            start_values (Mapping[str, float]): Fit manager values loaded
+                before every task.
+            model_class (type[ModelPlugin], optional): Model to build in the
+                workers. Defaults to the model resolved by Core.
+            max_workers (int, optional): Number of worker processes.
+                Defaults to the number of CPUs.
+            start_method (str, optional): Multiprocessing start method.
+                Defaults to "spawn", since CUDA contexts do not survive
+                a fork.
+            model_kwargs (Mapping[str, Any], optional): Keyword arguments of
+                the model constructor (see 'ModelPlugin.init_kwargs').
+        """
+        self.max_workers = max_workers
+        self.__parameters = parameters
+        self.__start_values = dict(start_values)
+        self.__model_class = model_class
+        self.__model_kwargs = dict(model_kwargs or {})
+        self.__start_method = start_method
+        self.__executor = None
+        self.__shared = None
+
+    def __enter__(self) -> "ModelWorkerPool":
+        parameters = self.__parameters
+        if not isinstance(parameters, SharedDataset):
+            self.__shared = SharedDataset(parameters)
+            parameters = self.__shared
+        self.__executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(self.__start_method),
+            initializer=_initialize_worker,
+            initargs=(
+                parameters, self.__start_values, self.__model_class,
+                self.__model_kwargs, dict(CONFIG)
+            )
+        )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.__executor.shutdown()
+        self.__executor = None
+        if self.__shared is not None:
+            self.__shared.unlink()
+            self.__shared = None
+
+    def map(self, func: Callable, *iterables: Iterable) -> list[Any]:
+        """
+        Runs 'func' over the given iterables across the worker processes.
+
+        Args:
+            func (Callable): Module-level function executed by the workers.
+            *iterables (Iterable): Arguments for each call, as in 'map'.
+
+        Returns:
+            list[Any]: Results of every call, in submission order.
+
+        Raises:
+            RuntimeError: If the pool has not been entered.
+        """
+        if self.__executor is None:
+            raise RuntimeError("ModelWorkerPool must be used as a context")
+        return list(self.__executor.map(func, *iterables))
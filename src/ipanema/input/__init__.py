@@ -1,4 +1,5 @@
 from .input_plugin import InputPlugin
+from .shared_dataset import SharedDataset
 from .implementations import *
 
-__all__ = ["InputPlugin"]
\ No newline at end of file
+__all__ = ["InputPlugin", "SharedDataset"]
\ No newline at end of file
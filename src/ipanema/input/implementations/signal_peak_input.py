@@ -27,9 +27,7 @@ class SignalPeakInput(InputPlugin):
         params: dict = {}
 
         with open(
-            Path(
-                r"src\ipanema\input\implementations\support_files\data_SnB.ext"
-            ), 
+            Path(__file__).parent / "support_files" / "data_SnB.ext", 
             "rb"
         ) as file:
             data = pickle.load(file, encoding="latin1")
@@ -0,0 +1,167 @@
+from pathlib import Path
+from typing import Iterator, Mapping, Optional
+import numpy as np
+from ipanema.config.config import CONFIG
+from ipanema.input.input_plugin import InputPlugin
+from ipanema.model.implementations._support_files.ipatia_host import (
+    log_ap_ipatia
+)
+from sdk.math_utils.sampling import sample_exponential, sample_from_grid
+
+class SyntheticPeakInput(InputPlugin):
+    """
+    Plugin generating a signal peak on top of an exponential background.
+
+    Produces the same parameters as SignalPeakInput ('mydat', 'n_dat', 'd_m',
+    'm_max', 'm_min' and 'massbins') for a sample of any size, so that the
+    scaling of a fit with the number of events can be studied.
+
+    Events are generated in chunks with vectorized inverse-CDF sampling: an
+    Ipatia peak for the signal and a truncated exponential for the
+    background. Each chunk has its own random stream spawned from the seed,
+    so a sample is reproducible for a given seed and chunk size. Giving a
+    'path' streams the chunks into a memory-mapped '.npy' file, so samples
+    larger than memory (e.g. 1e9 events) can be generated.
+
+    The generation settings are read from the "synthetic_input" section of
+    the configuration, with the keyword arguments of 'generate'.
+
+    Attributes:
+        SIGNAL_SHAPE (dict[str, float]): Ipatia shape parameters of the
+            generated peak.
+    """
+
+    SIGNAL_SHAPE: dict[str, float] = {
+        "mu": 5365., "sigma": 7., "l": -3., "beta": 0.,
+        "a": 3., "n": 1., "a2": 6., "n2": 1.
+    }
+
+    @staticmethod
+    def get_params() -> dict:
+        """
+        Prepares data for a model initialization.
+
+        Returns:
+            dict: Dictionary formed by the expected parameters.
+        """
+        return SyntheticPeakInput.generate(
+            **(CONFIG.get("synthetic_input") or {})
+        )
+
+    @staticmethod
+    def generate(
+            n_events: int = 100_000,
+            signal_fraction: float = 0.3,
+            k: float = -0.01,
+            seed: Optional[int] = None,
+            chunk_size: int = 1 << 20,
+            path: Optional[str | Path] = None,
+            m_min: float = 5179.17,
+            m_max: float = 5379.15,
+            n_bins: int = 10_000,
+            signal_shape: Optional[Mapping[str, float]] = None
+        ) -> dict:
+        """
+        Generates a synthetic sample.
+
+        Args:
+            n_events (int, optional): Number of events.
+            signal_fraction (float, optional): Expected fraction of signal
+                events, within [0, 1].
+            k (float, optional): Slope of the exponential background.
+            seed (int, optional): Seed of the sample.
+            chunk_size (int, optional): Events generated at once.
+            path (str | Path, optional): '.npy' file where the events are
+                streamed. Defaults to None, which keeps them in memory.
+            m_min (float, optional): Lower bound of the mass range.
+            m_max (float, optional): Upper bound of the mass range.
+            n_bins (int, optional): Number of points of 'massbins'.
+            signal_shape (Mapping[str, float], optional): Ipatia shape
+                parameters. Defaults to 'SIGNAL_SHAPE'.
+
+        Returns:
+            dict: Dictionary formed by the expected parameters. 'mydat' is a
+                read-only memory map when 'path' is given.
+
+        Raises:
+            ValueError: If the number of events, the chunk size or the
+                signal fraction are not valid.
+        """
+        if n_events < 1 or chunk_size < 1:
+            raise ValueError("'n_events' and 'chunk_size' must be positive")
+        if not 0. <= signal_fraction <= 1.:
+            raise ValueError("'signal_fraction' must be within [0, 1]")
+
+        massbins = np.linspace(m_min, m_max, n_bins)
+        if path is None:
+            mydat = np.empty(n_events, dtype=np.float64)
+        else:
+            mydat = np.lib.format.open_memmap(
+                path, mode="w+", dtype=np.float64, shape=(n_events,)
+            )
+
+        offset = 0
+        for chunk in SyntheticPeakInput.iter_chunks(
+                n_events, massbins, signal_fraction, k, seed, chunk_size,
+                signal_shape
+            ):
+            mydat[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+
+        if path is not None:
+            mydat.flush()
+            del mydat
+            mydat = np.load(path, mmap_mode="r")
+
+        return {
+            "mydat": mydat,
+            "n_dat": n_events,
+            "d_m": massbins[1] - massbins[0],
+            "m_max": massbins[-1],
+            "m_min": massbins[0],
+            "massbins": massbins
+        }
+
+    @staticmethod
+    def iter_chunks(
+            n_events: int,
+            massbins: np.ndarray,
+            signal_fraction: float,
+            k: float,
+            seed: Optional[int] = None,
+            chunk_size: int = 1 << 20,
+            signal_shape: Optional[Mapping[str, float]] = None
+        ) -> Iterator[np.ndarray]:
+        """
+        Generates a synthetic sample chunk by chunk.
+
+        Within a chunk, signal events precede background events.
+
+        Args:
+            n_events (int): Number of events.
+            massbins (np.ndarray): Grid where the signal shape is tabulated,
+                spanning the mass range.
+            signal_fraction (float): Expected fraction of signal events.
+            k (float): Slope of the exponential background.
+            seed (int, optional): Seed of the sample.
+            chunk_size (int, optional): Events per chunk.
+            signal_shape (Mapping[str, float], optional): Ipatia shape
+                parameters. Defaults to 'SIGNAL_SHAPE'.
+
+        Yields:
+            np.ndarray: Events of the next chunk.
+        """
+        shape = dict(signal_shape or SyntheticPeakInput.SIGNAL_SHAPE)
+        density = np.exp(log_ap_ipatia(massbins, **shape))
+        n_chunks = -(-n_events // chunk_size)
+        streams = np.random.SeedSequence(seed).spawn(n_chunks)
+        for i, stream in enumerate(streams):
+            rng = np.random.default_rng(stream)
+            size = min(chunk_size, n_events - i*chunk_size)
+            n_sig = rng.binomial(size, signal_fraction)
+            chunk = np.empty(size, dtype=np.float64)
+            chunk[:n_sig] = sample_from_grid(massbins, density, n_sig, rng)
+            chunk[n_sig:] = sample_exponential(
+                k, massbins[0], massbins[-1], size - n_sig, rng
+            )
+            yield chunk
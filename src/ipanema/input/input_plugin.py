@@ -16,6 +16,7 @@ class InputPlugin(ABC):
 
         Returns:
             dict: A dictionary containing the parameters required by a 
-                Model Plugin.
+                Model Plugin. A SharedDataset may be returned instead, so 
+                that process pools attach to the data instead of copying it.
         """
         pass
\ No newline at end of file
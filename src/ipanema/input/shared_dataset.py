@@ -0,0 +1,177 @@
+from collections.abc import Mapping
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterator
+import weakref
+import numpy as np
+
+class SharedDataset(Mapping):
+    """
+    Parameters mapping whose arrays live in shared memory.
+
+    Input plugins may return a SharedDataset instead of a plain dictionary.
+    Every NumPy array is copied once into a named shared memory block; any
+    other value is stored as is. Pickling a SharedDataset only sends the
+    block names, shapes and dtypes, so worker processes attach to the data
+    in O(1) instead of receiving a copy, and read it through read-only
+    NumPy views.
+
+    The process that creates the dataset owns the shared memory blocks and
+    releases them on 'unlink', when it is garbage collected or at exit, 
+    whichever comes first. Attached copies only 'close' their handles.
+
+    Attributes:
+        owner (bool): Whether this instance created the shared memory blocks.
+    """
+
+    __arrays: dict[str, np.ndarray]
+    __blocks: dict[str, SharedMemory]
+    __layout: dict[str, tuple[str, tuple[int, ...], str]]
+    __values: dict[str, Any]
+    __release: weakref.finalize
+
+    def __init__(self, params: Mapping[str, Any]) -> None:
+        """
+        Copies the given parameters into shared memory.
+
+        Args:
+            params (Mapping[str, Any]): Parameters of an input plugin.
+        """
+        self.owner = True
+        self.__arrays = {}
+        self.__blocks = {}
+        self.__layout = {}
+        self.__values = {}
+        for key, value in params.items():
+            if isinstance(value, np.ndarray):
+                block = SharedMemory(create=True, size=max(value.nbytes, 1))
+                self.__blocks[key] = block
+                self.__layout[key] = (block.name, value.shape, value.dtype.str)
+                view = np.ndarray(value.shape, value.dtype, buffer=block.buf)
+                view[...] = value
+                view.flags.writeable = False
+                self.__arrays[key] = view
+            else:
+                self.__values[key] = value
+        # Holds the blocks, not the dataset, so unused datasets are released
+        self.__release = weakref.finalize(
+            self, SharedDataset.__unlink_blocks, list(self.__blocks.values())
+        )
+
+    @classmethod
+    def _attach(
+            cls,
+            layout: dict[str, tuple[str, tuple[int, ...], str]],
+            values: dict[str, Any]
+        ) -> "SharedDataset":
+        """
+        Attaches to the shared memory blocks of an existing dataset.
+
+        Args:
+            layout (dict): Block name, shape and dtype of each array.
+            values (dict): Parameters not stored in shared memory.
+
+        Returns:
+            SharedDataset: Non-owning view of the dataset.
+        """
+        dataset = cls.__new__(cls)
+        dataset.owner = False
+        dataset.__arrays = {}
+        dataset.__blocks = {}
+        dataset.__layout = dict(layout)
+        dataset.__values = dict(values)
+        for key, (name, shape, dtype) in layout.items():
+            block = SharedDataset.__open(name)
+            dataset.__blocks[key] = block
+            dataset.__arrays[key] = SharedDataset.__view(block, shape, dtype)
+        return dataset
+
+    def __reduce__(self) -> tuple:
+        return SharedDataset._attach, (self.__layout, self.__values)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__arrays:
+            return self.__arrays[key]
+        return self.__values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.__arrays
+        yield from self.__values
+
+    def __len__(self) -> int:
+        return len(self.__arrays) + len(self.__values)
+
+    def __enter__(self) -> "SharedDataset":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Closes the shared memory handles of this instance.
+
+        Arrays obtained from the dataset must not be used afterwards.
+        """
+        self.__arrays.clear()
+        for block in self.__blocks.values():
+            try:
+                block.close()
+            except BufferError:
+                # Views still referenced elsewhere keep the mapping alive
+                pass
+        self.__blocks.clear()
+
+    def unlink(self) -> None:
+        """
+        Closes and releases the shared memory blocks.
+
+        Only has effect on the owner of the dataset.
+        """
+        if not self.owner:
+            return
+        self.close()
+        self.__release()
+        self.owner = False
+
+    @staticmethod
+    def __unlink_blocks(blocks: list[SharedMemory]) -> None:
+        """Closes and releases shared memory blocks."""
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def __open(name: str) -> SharedMemory:
+        """
+        Attaches to an existing shared memory block without tracking it.
+
+        The owner is the only process allowed to release the block, so the
+        attaching process must not register it with its resource tracker.
+        """
+        try:
+            return SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 always tracks attached blocks. Worker processes
+            # share the resource tracker of their parent, where the block is
+            # already registered by the owner, so this is harmless for them.
+            return SharedMemory(name=name)
+
+    @staticmethod
+    def __view(
+            block: SharedMemory,
+            shape: tuple[int, ...],
+            dtype: str
+        ) -> np.ndarray:
+        """Read-only NumPy view over a shared memory block."""
+        view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        view.flags.writeable = False
+        return view
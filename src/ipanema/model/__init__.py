@@ -1,4 +1,5 @@
 from .model_plugin import ModelPlugin
+from .fcn_profiler import FcnProfiler
 from .implementations import *
 
-__all__ = ["ModelPlugin"]
\ No newline at end of file
+__all__ = ["FcnProfiler", "ModelPlugin"]
\ No newline at end of file
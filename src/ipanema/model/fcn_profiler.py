@@ -0,0 +1,167 @@
+from pathlib import Path
+from typing import Optional, Sequence
+import numpy as np
+
+class FcnProfiler():
+    """
+    FCN hook recording the parameters, value and latency of each call.
+
+    Calls are stored in preallocated ring buffers, so profiling long fits
+    has a bounded memory footprint: only the most recent 'capacity' calls
+    are kept. Models opt in by wrapping their FCN with 
+    'ModelPlugin.wrap_fcn'; the profiler is then registered with 
+    'add_fcn_hook'.
+
+    The call-pattern summary classifies each call by the parameters that
+    changed since the previous one: repeated points (cache candidates),
+    single parameter moves (finite-difference gradient steps) and moves of
+    several parameters (line-search steps).
+
+    Attributes:
+        capacity (int): Maximum number of calls kept.
+        names (tuple[str, ...], optional): Parameter names, used to label
+            the call-pattern summary.
+        calls (int): Total number of calls observed, including the ones
+            overwritten in the buffers.
+    """
+
+    __parameters: Optional[np.ndarray]
+    __values: np.ndarray
+    __latencies: np.ndarray
+
+    def __init__(
+            self,
+            capacity: int = 100_000,
+            names: Optional[Sequence[str]] = None
+        ) -> None:
+        """
+        Initializes the profiler.
+
+        Args:
+            capacity (int, optional): Maximum number of calls kept. Defaults
+                to 100000.
+            names (Sequence[str], optional): Parameter names. Defaults to
+                None.
+
+        Raises:
+            ValueError: If 'capacity' is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("'capacity' must be positive")
+        self.capacity = capacity
+        self.names = tuple(names) if names is not None else None
+        self.calls = 0
+        self.__values = np.empty(capacity, dtype=np.float64)
+        self.__latencies = np.empty(capacity, dtype=np.float64)
+        # Allocated on the first call, once the number of parameters is known
+        self.__parameters = None
+
+    def __call__(self, args: tuple, value: float, seconds: float) -> None:
+        """
+        Records a FCN call.
+
+        Args:
+            args (tuple): Arguments of the call (parameter values, or a
+                single array of them).
+            value (float): FCN value.
+            seconds (float): Duration of the call.
+        """
+        point = np.ravel(args)
+        if self.__parameters is None:
+            self.__parameters = np.empty(
+                (self.capacity, len(point)), dtype=np.float64
+            )
+        i = self.calls % self.capacity
+        self.__parameters[i] = point
+        self.__values[i] = value
+        self.__latencies[i] = seconds
+        self.calls += 1
+
+    def reset(self) -> None:
+        """Discards every recorded call."""
+        self.calls = 0
+
+    def trace(self) -> dict[str, np.ndarray]:
+        """
+        Recorded calls in chronological order.
+
+        Returns:
+            dict[str, np.ndarray]: "parameters" (shape (K, P)), "values" and
+                "latencies" (shape (K,)) of the last K recorded calls.
+        """
+        kept = min(self.calls, self.capacity)
+        order = (np.arange(kept) + self.calls - kept) % self.capacity
+        if self.__parameters is None:
+            parameters = np.empty((0, len(self.names or ())))
+        else:
+            parameters = self.__parameters[order]
+        return {
+            "parameters": parameters,
+            "values": self.__values[order],
+            "latencies": self.__latencies[order]
+        }
+
+    def latency_histogram(
+            self,
+            bins: int = 50
+        ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Histogram of the recorded latencies with logarithmic bins.
+
+        Args:
+            bins (int, optional): Number of bins. Defaults to 50.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Counts and bin edges (seconds).
+        """
+        latencies = self.trace()["latencies"]
+        latencies = latencies[latencies > 0]
+        if not latencies.size:
+            return np.zeros(bins, dtype=np.int64), np.zeros(bins + 1)
+        low, high = latencies.min(), latencies.max()
+        edges = np.geomspace(low, high if high > low else 2*low, bins + 1)
+        counts, edges = np.histogram(latencies, edges)
+        return counts, edges
+
+    def call_pattern(self) -> dict:
+        """
+        Summary of how parameters change between consecutive calls.
+
+        Returns:
+            dict: Number of compared calls ("calls"), of calls repeating the
+                previous point ("repeated"), moving a single parameter
+                ("single_parameter") or several ("multi_parameter"), and the
+                number of single parameter moves of each parameter
+                ("single_moves", keyed on parameter name).
+        """
+        parameters = self.trace()["parameters"]
+        changed = parameters[1:] != parameters[:-1]
+        n_changed = changed.sum(axis=1)
+        names = self.names or tuple(
+            f"p{i}" for i in range(parameters.shape[1])
+        )
+        single = changed[n_changed == 1].sum(axis=0)
+        return {
+            "calls": int(len(changed)),
+            "repeated": int((n_changed == 0).sum()),
+            "single_parameter": int((n_changed == 1).sum()),
+            "multi_parameter": int((n_changed > 1).sum()),
+            "single_moves": {
+                name: int(count) for name, count in zip(names, single)
+            }
+        }
+
+    def save(self, path: str | Path) -> None:
+        """
+        Saves the recorded calls as a compressed '.npz' trace.
+
+        Args:
+            path (str | Path): Destination file.
+        """
+        trace = self.trace()
+        np.savez_compressed(
+            path,
+            names=np.array(self.names or (), dtype=str),
+            calls=np.int64(self.calls),
+            **trace
+        )
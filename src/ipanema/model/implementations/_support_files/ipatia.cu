@@ -4,6 +4,32 @@
 
 #include <math.h>
 
+// Specialization of the tail parameters. Compiling with IPATIA_FIXED_<NAME>
+// defined replaces the runtime value of that parameter by the constant, so
+// the compiler can fold the arithmetic depending on it.
+#ifdef IPATIA_FIXED_A
+#define IPATIA_SET_A(a) a = IPATIA_FIXED_A
+#else
+#define IPATIA_SET_A(a)
+#endif
+#ifdef IPATIA_FIXED_N
+#define IPATIA_SET_N(n) n = IPATIA_FIXED_N
+#else
+#define IPATIA_SET_N(n)
+#endif
+#ifdef IPATIA_FIXED_A2
+#define IPATIA_SET_A2(a2) a2 = IPATIA_FIXED_A2
+#else
+#define IPATIA_SET_A2(a2)
+#endif
+#ifdef IPATIA_FIXED_N2
+#define IPATIA_SET_N2(n2) n2 = IPATIA_FIXED_N2
+#else
+#define IPATIA_SET_N2(n2)
+#endif
+#define IPATIA_SET_FIXED(a, n, a2, n2) \
+  IPATIA_SET_A(a); IPATIA_SET_N(n); IPATIA_SET_A2(a2); IPATIA_SET_N2(n2)
+
 __device__ double log_apIpatia(double x, double mu, double sigma, double l, double beta,  double a, double n,  double a2, double n2) {
   double d = x-mu;
   double delta, delta2, cons1, phi, B, k1, k2;
@@ -47,12 +73,86 @@ __device__ double log_apIpatia(double x, double mu, double sigma, double l, doub
   return out;
 }
 __global__ void logIpatia(double *in, double *out,double mu, double sigma, double l, double beta, double a, double n, double a2, double n2) {
+  IPATIA_SET_FIXED(a, n, a2, n2);
   int idx = threadIdx.x + blockDim.x * blockIdx.x;//+ threadIdx.y*4;
   out[idx] = log_apIpatia(in[idx],mu, sigma, l, beta, a, n, a2, n2);
 }
 __global__ void Ipatia(double *in, double *out,double mu, double sigma, double l, double beta, double a, double n, double a2, double n2, int N) {
+  IPATIA_SET_FIXED(a, n, a2, n2);
   int idx = threadIdx.x + blockDim.x * blockIdx.x;//+ threadIdx.y*4;
   if (idx < N) {
         out[idx] = exp(log_apIpatia(in[idx], mu, sigma, l, beta, a, n, a2, n2));
     }
 }
+
+// Single precision 'log_apIpatia', for the per-event density of mixed
+// precision fits. Parameters are rounded to float once per call.
+__device__ float log_apIpatiaF32(float x, float mu, float sigma, float l, float beta, float a, float n, float a2, float n2) {
+  float d = x-mu;
+  float delta, delta2, phi, B, k1, k2, logk1, logcons1;
+  float asigma = a*sigma;
+  float a2sigma = a2*sigma;
+  if (l<=-1.0f) delta = sigma*sqrtf(-2.0f-2.0f*l);
+  else delta = sigma;
+  delta2 = delta*delta;
+  if (d < -asigma) {
+    logcons1 = -beta*asigma;
+    phi = 1.0f + asigma*asigma/delta2;
+    logk1 = logcons1 + (l-0.5f)*logf(phi);
+    k1 = expf(logk1);
+    k2 = beta*k1 - expf(logcons1)*(l-0.5f)*powf(phi,l-1.5f)*2.0f*asigma/delta2;
+    B = -asigma + n*k1/k2;
+    return logk1 + n*logf(B+asigma) - n*logf(B-d);
+  } else if (d > a2sigma) {
+    logcons1 = beta*a2sigma;
+    phi = 1.0f + a2sigma*a2sigma/delta2;
+    logk1 = logcons1 + (l-0.5f)*logf(phi);
+    k1 = expf(logk1);
+    k2 = beta*k1 + expf(logcons1)*(l-0.5f)*powf(phi,l-1.5f)*2.0f*a2sigma/delta2;
+    B = -a2sigma - n2*k1/k2;
+    return logf(k1) + n2*logf(B+a2sigma) - n2*logf(B+d);
+  }
+  return beta*d + (l-0.5f)*logf(1.0f + d*d/delta2);
+}
+__global__ void IpatiaF32(float *in, float *out, double mu, double sigma, double l, double beta, double a, double n, double a2, double n2, int N) {
+  IPATIA_SET_FIXED(a, n, a2, n2);
+  int idx = threadIdx.x + blockDim.x * blockIdx.x;
+  if (idx < N) {
+    out[idx] = expf(log_apIpatiaF32(in[idx], (float)mu, (float)sigma, (float)l, (float)beta, (float)a, (float)n, (float)a2, (float)n2));
+  }
+}
+
+// Batched evaluation over K parameter sets, each one at its own N points.
+// 'in' and 'out' hold N consecutive values per set and 'params' holds the 8
+// shape parameters of each set. Launch with a (ceil(N/block), K) grid.
+__global__ void IpatiaBatchNodes(double *in, double *out, double *params, int N, int K) {
+  int idx = threadIdx.x + blockDim.x * blockIdx.x;
+  int set = blockIdx.y;
+  if (idx < N && set < K) {
+    const double *p = params + 8*set;
+    out[set*N + idx] = exp(log_apIpatia(in[set*N + idx], p[0], p[1], p[2], p[3], p[4], p[5], p[6], p[7]));
+  }
+}
+// Per-block partial sums of log(cs*Ipatia(x) + cb*exp(k*x)) for K parameter
+// sets. 'params' holds 11 values per set (mu, sigma, l, beta, a, n, a2, n2,
+// k, cs, cb) and 'out' receives gridDim.x partial sums per set. Launch with a
+// power of two block size of at most 512 threads and a (ceil(N/block), K) grid.
+__global__ void logLikelihoodBatch(double *in, double *out, double *params, int N, int K) {
+  __shared__ double cache[512];
+  int idx = threadIdx.x + blockDim.x * blockIdx.x;
+  int set = blockIdx.y;
+  double value = 0.;
+  if (idx < N && set < K) {
+    const double *p = params + 11*set;
+    double x = in[idx];
+    double sig = exp(log_apIpatia(x, p[0], p[1], p[2], p[3], p[4], p[5], p[6], p[7]));
+    value = log(p[9]*sig + p[10]*exp(p[8]*x));
+  }
+  cache[threadIdx.x] = value;
+  __syncthreads();
+  for (int s = blockDim.x/2; s > 0; s >>= 1) {
+    if (threadIdx.x < s) cache[threadIdx.x] += cache[threadIdx.x + s];
+    __syncthreads();
+  }
+  if (threadIdx.x == 0 && set < K) out[set*gridDim.x + blockIdx.x] = cache[0];
+}
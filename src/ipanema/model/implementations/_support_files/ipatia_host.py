@@ -0,0 +1,107 @@
+# Original code Copyright (C) Diego Martinez Santos
+# Licensed under the GNU Affero General Public License v3.0
+# Modifications Copyright (C) 2025 Gabriel Alejandro Fernandez Fernandez
+
+# Host (NumPy) implementations of the kernels in 'ipatia.cu', registered on
+# CPU backends with 'NumpyCudaManager.add_host_kernel'.
+
+from typing import Callable
+import numpy as np
+
+# Events processed at once by the batched kernels, bounding temporaries to
+# (K, CHUNK) arrays
+CHUNK: int = 1 << 16
+
+def log_ap_ipatia(x, mu, sigma, l, beta, a, n, a2, n2) -> np.ndarray:
+    """
+    Vectorized 'log_apIpatia'.
+
+    Parameters may be scalars or arrays broadcasting against 'x' (e.g. of
+    shape (K, 1) to evaluate K parameter sets at once).
+    """
+    d = x - mu
+    asigma = a*sigma
+    a2sigma = a2*sigma
+    delta = np.where(l <= -1., sigma*np.sqrt(np.abs(-2. - 2.*l)), sigma)
+    delta2 = delta*delta
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Left tail
+        logcons1 = -beta*asigma
+        phi = 1. + asigma*asigma/delta2
+        logk1 = logcons1 + (l - 0.5)*np.log(phi)
+        k1 = np.exp(logk1)
+        k2 = (
+            beta*k1
+            - np.exp(logcons1)*(l - 0.5)*phi**(l - 1.5)*2*asigma/delta2
+        )
+        B = -asigma + n*k1/k2
+        left = logk1 + n*np.log(B + asigma) - n*np.log(B - d)
+
+        # Right tail
+        logcons1 = beta*a2sigma
+        phi = 1. + a2sigma*a2sigma/delta2
+        logk1 = logcons1 + (l - 0.5)*np.log(phi)
+        k1 = np.exp(logk1)
+        k2 = (
+            beta*k1
+            + np.exp(logcons1)*(l - 0.5)*phi**(l - 1.5)*2.*a2sigma/delta2
+        )
+        B = -a2sigma - n2*k1/k2
+        right = np.log(k1) + n2*np.log(B + a2sigma) - n2*np.log(B + d)
+
+        core = beta*d + (l - 0.5)*np.log(1. + d*d/delta2)
+
+    return np.where(d < -asigma, left, np.where(d > a2sigma, right, core))
+
+def log_ipatia(in_, out, mu, sigma, l, beta, a, n, a2, n2) -> None:
+    """Host version of the 'logIpatia' kernel."""
+    out[:] = log_ap_ipatia(in_, mu, sigma, l, beta, a, n, a2, n2)
+
+def ipatia(in_, out, mu, sigma, l, beta, a, n, a2, n2, N) -> None:
+    """Host version of the 'Ipatia' kernel."""
+    size = min(int(N), len(in_), len(out))
+    out[:size] = np.exp(
+        log_ap_ipatia(in_[:size], mu, sigma, l, beta, a, n, a2, n2)
+    )
+
+def ipatia_f32(in_, out, mu, sigma, l, beta, a, n, a2, n2, N) -> None:
+    """Host version of the 'IpatiaF32' kernel, computed in float32."""
+    size = min(int(N), len(in_), len(out))
+    shape = np.array([mu, sigma, l, beta, a, n, a2, n2], dtype=np.float32)
+    out[:size] = np.exp(log_ap_ipatia(
+        np.asarray(in_[:size], dtype=np.float32), *shape
+    ))
+
+def ipatia_batch_nodes(in_, out, params, N, K) -> None:
+    """Host version of the 'IpatiaBatchNodes' kernel."""
+    shape = np.reshape(params, (int(K), 8))[:, :, None]
+    out.reshape(int(K), int(N))[:] = np.exp(log_ap_ipatia(
+        np.reshape(in_, (int(K), int(N))), *shape.transpose(1, 0, 2)
+    ))
+
+def log_likelihood_batch(in_, out, params, N, K) -> None:
+    """
+    Host version of the 'logLikelihoodBatch' kernel.
+
+    The whole sum of each parameter set is stored in its first partial sum
+    and the remaining partial sums are set to zero.
+    """
+    coefficients = np.reshape(params, (int(K), 11))[:, :, None]
+    shape, (k, cs, cb) = coefficients[:, :8], coefficients[:, 8:].transpose(
+        1, 0, 2
+    )
+    partial_sums = out.reshape(int(K), -1)
+    partial_sums[:] = 0.
+    for start in range(0, int(N), CHUNK):
+        x = in_[None, start:min(start + CHUNK, int(N))]
+        signal = np.exp(log_ap_ipatia(x, *shape.transpose(1, 0, 2)))
+        partial_sums[:, 0] += np.log(cs*signal + cb*np.exp(k*x)).sum(axis=1)
+
+HOST_KERNELS: dict[str, Callable] = {
+    "logIpatia": log_ipatia,
+    "Ipatia": ipatia,
+    "IpatiaF32": ipatia_f32,
+    "IpatiaBatchNodes": ipatia_batch_nodes,
+    "logLikelihoodBatch": log_likelihood_batch,
+}
@@ -25,7 +25,7 @@ class DefaultModel(ModelPlugin):
         Initializes the Minuit fit manager with the generated FCN 
         (function to minimize).
         """
-        self.fit_manager = Minuit(self._generate_fcn(), x=1)
+        self.fit_manager = Minuit(self.wrap_fcn(self._generate_fcn()), x=1)
 
     def _generate_fcn(self):
         """
@@ -1,11 +1,20 @@
+from enum import Enum
 from pathlib import Path
+from ipanema.config.config import CONFIG
 from ipanema.model import ModelPlugin
+from ipanema.model.implementations._support_files.ipatia_host import (
+    HOST_KERNELS
+)
 from iminuit import Minuit
 from sdk.cuda_manager.abstract_cuda_manager import CudaManager
-from sdk.cuda_manager.implementations.auto_cuda_manager import AutoCudaManager
-from sdk.cuda_manager.implementations.interactive_cuda_manager import (
-    InteractiveCudaManager
+from sdk.cuda_manager.implementations.numpy_cuda_manager import (
+    NumpyCudaManager
 )
+from sdk.cuda_manager.expression import exp, log
+from sdk.math_utils.integration import GaussLegendreQuadrature
+from sdk.math_utils.sampling import sample_exponential, sample_from_grid
+from typing import Mapping, Optional
+from venv import logger
 import numpy as np
 import math
 
@@ -24,14 +33,94 @@ class SignalPeakModel(ModelPlugin):
             'fit_manager' initialization. 
         cuda_manager (CudaManager): CUDA handler used for the HPC calculus
             during FCN execution.
+        SHAPE_PARAMETERS (tuple[str, ...]): Ipatia shape parameters, in the 
+            order expected by the CUDA kernels.
+        TAIL_MACROS (dict[str, str]): Macro baking each tail parameter into
+            the Ipatia kernels of the FCN while it is fixed in the fit.
+        Backend (Enum): Supported CudaManager backends. "pycuda" runs the
+            kernels on a GPU; "numpy" runs their host versions on CPU.
+        Precision (Enum): Precision modes of the FCN. "double" computes 
+            everything in float64. "mixed" stores 'mydat' and evaluates the
+            per-event Ipatia density in float32, while the normalization, 
+            the logarithm and the accumulation of the log-likelihood stay in
+            float64. "validate" runs the "mixed" FCN and records its
+            difference from the "double" one at every call.
+        backend (SignalPeakModel.Backend): Backend of 'cuda_manager'.
+        precision (SignalPeakModel.Precision): Precision mode of the FCN.
+        precision_difference (float): Largest absolute difference between 
+            the "mixed" and "double" FCN values found in "validate" mode.
+        normalization (GaussLegendreQuadrature): Quadrature integrating the
+            Ipatia shape over the mass range, with its integrals cached by
+            shape parameters.
+        NORMALIZATION_ORDER (int): Points of the normalization rule on each
+            piece of the Ipatia shape.
     """
 
+    class Backend(Enum):
+        PYCUDA: str = "pycuda"
+        NUMPY: str = "numpy"
+
+    class Precision(Enum):
+        DOUBLE: str = "double"
+        MIXED: str = "mixed"
+        VALIDATE: str = "validate"
+
+    SHAPE_PARAMETERS: tuple[str, ...] = (
+        "mu", "sigma", "l", "beta", "a", "n", "a2", "n2"
+    )
+    TAIL_MACROS: dict[str, str] = {
+        "a": "IPATIA_FIXED_A", "n": "IPATIA_FIXED_N",
+        "a2": "IPATIA_FIXED_A2", "n2": "IPATIA_FIXED_N2"
+    }
+    NORMALIZATION_ORDER: int = 32
+    extensive_parameters: tuple[str, ...] = ("Ns", "Nb")
+
     _cuda_manager: CudaManager
 
-    def __init__(self, params):
-        """Initializes the model."""
+    def __init__(
+            self, 
+            params, 
+            backend: Optional[str] = None, 
+            precision: Optional[str] = None
+        ):
+        """
+        Initializes the model.
+
+        Args:
+            params (dict): Parameters of the input plugin.
+            backend (str, optional): CudaManager backend. Defaults to the 
+                "backend" of the configuration, or "pycuda".
+            precision (str, optional): Precision mode of the FCN. Defaults 
+                to the "precision" of the configuration, or "double".
+
+        Raises:
+            ValueError: If the backend or the precision are not supported.
+        """
         super().__init__(params)
-        self.cuda_manager = InteractiveCudaManager(None, False)
+        self.precision = SignalPeakModel.Precision(precision or CONFIG.get(
+            "precision", SignalPeakModel.Precision.DOUBLE.value
+        ))
+        self.precision_difference = 0.
+        self.normalization = GaussLegendreQuadrature(
+            SignalPeakModel.NORMALIZATION_ORDER
+        )
+        backend = backend or CONFIG.get(
+            "backend", SignalPeakModel.Backend.PYCUDA.value
+        )
+        if backend == SignalPeakModel.Backend.PYCUDA.value:
+            # Imported on demand, so CPU-only machines do not need PyCUDA
+            from sdk.cuda_manager.implementations.interactive_cuda_manager \
+                import InteractiveCudaManager
+            self.cuda_manager = InteractiveCudaManager(None, False)
+        elif backend == SignalPeakModel.Backend.NUMPY.value:
+            self.cuda_manager = NumpyCudaManager()
+            for name, kernel in HOST_KERNELS.items():
+                self.cuda_manager.add_host_kernel(name, kernel)
+        else:
+            raise ValueError(f"Unsupported backend: '{backend}'")
+        self.backend = SignalPeakModel.Backend(backend)
+        if CONFIG.get("launch_tuning"):
+            self.cuda_manager.enable_autotuning(CONFIG["launch_tuning"])
 
     def prepare_fit(self) -> None:
         """
@@ -40,16 +129,16 @@ class SignalPeakModel(ModelPlugin):
         Initializes 'fit_manager' using the 'parameters' previously provided.
         """
         n_dat = self.parameters["n_dat"]
+        self.precision_difference = 0.
+        self.normalization.clear()
         self.cuda_manager.add_code_fragment(
             "ipatia",
-            Path(
-                r"src\ipanema\model\implementations\_support_files\ipatia.cu"
-            )
+            Path(__file__).parent / "_support_files" / "ipatia.cu"
         )
 
         # Minuit Fit Manager Initialization
         self.fit_manager = Minuit(
-            self._generate_fcn(), 
+            self.wrap_fcn(self._generate_fcn()), 
             mu = 5365., 
             sigma = 7., 
             l = -3., 
@@ -81,39 +170,80 @@ class SignalPeakModel(ModelPlugin):
 
         # Obtaining parameters
         params = self.parameters
-        d_m = params["d_m"]
         m_max = params["m_max"]
         m_min = params["m_min"]
         mydat = params["mydat"]
-        massbins = params["massbins"]
         n_dat = params["n_dat"]
+        precision = self.precision
+        n_events = len(mydat)
+        # Events are uploaded once and only in the precisions in use. The
+        # single precision copy halves the data read at every call
+        if precision != SignalPeakModel.Precision.MIXED:
+            events_f64 = self.cuda_manager.to_device(
+                np.asarray(mydat, dtype=np.float64)
+            )
+        if precision != SignalPeakModel.Precision.DOUBLE:
+            events_f32 = self.cuda_manager.to_device(
+                np.asarray(mydat, dtype=np.float32)
+            )
+
+        def events_ll(events, kernel, dtype, shape, constants,
+                      k, coef_b, coef_s, Nexp):
+            # Calling ipatia for the events, keeping its output on the 
+            # device for the expression below
+            signal = self.cuda_manager.run_program(
+                kernel,
+                [1],
+                {1: [(n_events,), dtype]},
+                None,
+                None,
+                events, 
+                np.empty(n_events, dtype=dtype), 
+                *shape,
+                n_events,
+                size=n_events,
+                constants=constants,
+                keep_on_device=True
+            )[0]
+            # Exponential background and signal terms, fused with the log 
+            # and the sum into a single pass over the data. Double scalars 
+            # promote single precision inputs, so the log and the sum are
+            # always computed in double precision
+            events_array = self.cuda_manager.array(events)
+            signal = self.cuda_manager.array(signal)
+            LL_events = (
+                log(exp(k*events_array)*coef_b + signal*coef_s) - Nexp
+            ).sum()
+            return np.float64(self.cuda_manager.evaluate(LL_events))
         
         # Declaring FCN
         def fcn(mu, sigma, l, beta, a, n, a2, n2, k, Ns, Nb):
-            # Calling ipatia for mass_bins
-            grid_x = math.ceil(len(mydat) / 512)
-            grid = (grid_x, 1)
-            block = (512, 1, 1)
-            ipatia_bins_out: list = self.cuda_manager.run_program(
-                "Ipatia",
-                [1],
-                {1: [(len(massbins),), np.double]},
-                block,
-                grid,
-                massbins, 
-                np.empty_like(massbins), 
-                mu, 
-                sigma, 
-                l, 
-                beta, 
-                a, 
-                n, 
-                a2, 
-                n2,
-                len(mydat)
-                
+            shape = (mu, sigma, l, beta, a, n, a2, n2)
+            # Kernels specialized for the fixed tail parameters
+            constants = self._tail_constants(
+                {"a": a, "n": n, "a2": a2, "n2": n2}
+            )
+            # Calling ipatia at the quadrature nodes, unless the integral of
+            # this shape is cached
+            def ipatia_nodes(nodes):
+                return self.cuda_manager.run_program(
+                    "Ipatia",
+                    [1],
+                    {1: [(len(nodes),), np.double]},
+                    None,
+                    None,
+                    nodes, 
+                    np.empty_like(nodes), 
+                    *shape,
+                    len(nodes),
+                    size=len(nodes),
+                    constants=constants
+                )[0]
+            integral_ipa = self.normalization.integrate(
+                ipatia_nodes, 
+                self._normalization_breakpoints(mu, sigma, a, a2), 
+                key=tuple(float(value) for value in shape)
             )
-            integral_ipa = np.sum(ipatia_bins_out[0])*d_m
 
             if k!= 0 : 
                 integral_exp = (np.exp(k*m_max)-np.exp(k*m_min))*1./k
@@ -125,46 +255,272 @@ class SignalPeakModel(ModelPlugin):
             Nexp = Ns+Nb
             fs = np.float64(Ns*1./Nexp)
             fb = np.float64(1.-fs)
+            coefficients = (k, invint_b*fb, invint_s*fs, Nexp)
+
+            if precision == SignalPeakModel.Precision.DOUBLE:
+                LL_events = events_ll(
+                    events_f64, "Ipatia", np.double, shape, constants, 
+                    *coefficients
+                )
+            else:
+                LL_events = events_ll(
+                    events_f32, "IpatiaF32", np.float32, shape, 
+                    constants, *coefficients
+                )
+            if precision == SignalPeakModel.Precision.VALIDATE:
+                difference = abs(2*(events_ll(
+                    events_f64, "Ipatia", np.double, shape, constants, 
+                    *coefficients
+                ) - LL_events))
+                logger.debug(f"Mixed precision FCN difference: {difference}")
+                self.precision_difference = max(
+                    self.precision_difference, difference
+                )
 
-            # Calling ipatia for my_dat
-            ipatia_data_out: list = self.cuda_manager.run_program(
-                "Ipatia",
-                [1],
-                {1: [(len(massbins)), np.double]},
-                block,
-                grid,
-                mydat, 
-                np.empty_like(mydat), 
-                mu, 
-                sigma, 
-                l, 
-                beta, 
-                a, 
-                n, 
-                a2, 
-                n2,
-                len(mydat)
-            )
-            # Exponential background
-            bkg_gpu = self.cuda_manager.single_operation("exp",k*mydat)
-            term1 = bkg_gpu * invint_b * fb
-            term2 = ipatia_data_out[0] * invint_s * fs
-            sum_terms = term1 + term2
             # Calculate total likelihood
-            LL_gpu = self.cuda_manager.single_operation(
-                "log", 
-                sum_terms
-            ) - Nexp
             extendLL =  n_dat*math.log(Nexp) -(Nexp)
-            LL = np.float64(
-                self.cuda_manager.reduction_operation("sum",LL_gpu)
-            ) + extendLL
+            LL = LL_events + extendLL
 
             chi2 = -2*LL
             return chi2
 
         return fcn
 
+    def _normalization_breakpoints(self, mu, sigma, a, a2) -> np.ndarray:
+        """
+        Ends of the pieces of the Ipatia shape within the mass range.
+
+        The range is split at the tail boundaries, 'mu - a*sigma' and
+        'mu + a2*sigma', and at the peak. Points outside the range are 
+        clipped to it, giving empty pieces.
+
+        Args:
+            mu (float | np.ndarray): Mean of the peak.
+            sigma (float | np.ndarray): Width of the peak.
+            a (float | np.ndarray): Left tail boundary, in units of sigma.
+            a2 (float | np.ndarray): Right tail boundary, in units of sigma.
+
+        Returns:
+            np.ndarray: Array of shape (..., 5) with the sorted ends of the
+                pieces of each parameter set.
+        """
+        m_min, m_max = self.parameters["m_min"], self.parameters["m_max"]
+        breakpoints = np.stack(np.broadcast_arrays(
+            m_min, mu - a*sigma, mu, mu + a2*sigma, m_max
+        ), axis=-1)
+        return np.sort(np.clip(breakpoints, m_min, m_max), axis=-1)
+
+    def _tail_constants(self, values: Mapping[str, float]) -> dict[str, float]:
+        """
+        Compile-time constants of the Ipatia kernels for the tail parameters
+        currently fixed in 'fit_manager'.
+
+        Args:
+            values (Mapping[str, float]): Values of the tail parameters.
+
+        Returns:
+            dict[str, float]: Value of the macro of each fixed parameter.
+        """
+        fit_manager: Optional[Minuit] = getattr(self, "_fit_manager", None)
+        if fit_manager is None:
+            return {}
+        fixed = fit_manager.fixed
+        return {
+            macro: float(values[name]) 
+            for name, macro in SignalPeakModel.TAIL_MACROS.items() 
+            if fixed[name]
+        }
+
+    def evaluate_batch(self, points: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the FCN for K parameter points in a single pass over data.
+
+        The Ipatia normalizations missing from the cache and the per-event 
+        likelihood of every point are computed by 2D kernel launches 
+        (quadrature nodes or events x parameter sets). 
+        The per-event log-likelihood is reduced on the device, so only one 
+        partial sum per block and point is copied back to the host.
+
+        Args:
+            points (np.ndarray): Array of shape (K, P) with one parameter 
+                point per row, following the order of 
+                'fit_manager.parameters'.
+
+        Returns:
+            np.ndarray: Array of shape (K,) with the FCN value of each point.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        columns = {
+            name: points[:, i] 
+            for i, name in enumerate(self.fit_manager.parameters)
+        }
+        n_points = len(points)
+
+        # Obtaining parameters
+        params = self.parameters
+        m_max = params["m_max"]
+        m_min = params["m_min"]
+        mydat = params["mydat"]
+        n_dat = params["n_dat"]
+
+        shape = np.ascontiguousarray(np.column_stack(
+            [columns[name] for name in SignalPeakModel.SHAPE_PARAMETERS]
+        ))
+
+        # Ipatia normalization for every point, from the cache or from the
+        # quadrature nodes of every missing shape
+        keys = [tuple(row) for row in shape.tolist()]
+        integral_ipa = np.empty(n_points, dtype=np.float64)
+        missing = []
+        for i, key in enumerate(keys):
+            value = self.normalization.lookup(key)
+            if value is None:
+                missing.append(i)
+            else:
+                integral_ipa[i] = value
+        if missing:
+            nodes, weights = self.normalization.nodes(
+                self._normalization_breakpoints(*[
+                    columns[name][missing] 
+                    for name in ("mu", "sigma", "a", "a2")
+                ])
+            )
+            n_nodes = nodes.shape[1]
+            ipatia_nodes_out: list = self.cuda_manager.run_program(
+                "IpatiaBatchNodes",
+                [1],
+                {1: [(nodes.size,), np.double]},
+                None,
+                None,
+                np.ascontiguousarray(nodes).ravel(),
+                np.empty(nodes.size),
+                np.ascontiguousarray(shape[missing]).ravel(),
+                n_nodes,
+                len(missing),
+                size=(n_nodes, len(missing))
+            )
+            integral_ipa[missing] = np.einsum(
+                "ij,ij->i", weights, 
+                ipatia_nodes_out[0].reshape(len(missing), n_nodes)
+            )
+            for i in missing:
+                self.normalization.store(keys[i], integral_ipa[i])
+
+        # Exponential normalization for every point
+        k = columns["k"]
+        integral_exp = np.full(n_points, m_max - m_min, dtype=np.float64)
+        nonzero = k != 0
+        integral_exp[nonzero] = (
+            np.exp(k[nonzero]*m_max) - np.exp(k[nonzero]*m_min)
+        )/k[nonzero]
+
+        Nexp = columns["Ns"] + columns["Nb"]
+        fs = columns["Ns"]/Nexp
+        fb = 1. - fs
+        coefficients = np.ascontiguousarray(np.column_stack(
+            [shape, k, fs/integral_ipa, fb/integral_exp]
+        ))
+
+        # Log-likelihood of the data for every point. The block is fixed, as
+        # the kernel reduces each block in a shared array of 512 elements
+        block = (512, 1, 1)
+        grid_data = (math.ceil(len(mydat) / block[0]), n_points)
+        partial_sums: list = self.cuda_manager.run_program(
+            "logLikelihoodBatch",
+            [1],
+            {1: [(n_points*grid_data[0],), np.double]},
+            block,
+            grid_data,
+            mydat,
+            np.empty(n_points*grid_data[0]),
+            coefficients.ravel(),
+            len(mydat),
+            n_points
+        )
+        log_sum = partial_sums[0].reshape(n_points, grid_data[0]).sum(axis=1)
+
+        LL = log_sum - n_dat*Nexp + n_dat*np.log(Nexp) - Nexp
+        return -2*LL
+
+    def generate_toy(
+            self, 
+            values: Mapping[str, float], 
+            rng: np.random.Generator
+        ) -> dict:
+        """
+        Generates a pseudo-experiment from the signal plus background model.
+
+        Signal and background yields are drawn from Poisson distributions 
+        around 'Ns' and 'Nb'. Signal masses are drawn by inverse-CDF sampling 
+        of the Ipatia shape evaluated on 'massbins', and background masses by
+        analytic sampling of the truncated exponential.
+
+        Args:
+            values (Mapping[str, float]): Parameter values used to generate.
+            rng (np.random.Generator): Random number generator.
+
+        Returns:
+            dict: Copy of 'parameters' with the generated 'mydat' and 'n_dat'.
+        """
+        params = self.parameters
+        massbins = params["massbins"]
+        dtype = params["mydat"].dtype
+
+        n_sig = rng.poisson(values["Ns"])
+        n_bkg = rng.poisson(values["Nb"])
+
+        ipatia_bins_out: list = self.cuda_manager.run_program(
+            "Ipatia",
+            [1],
+            {1: [(len(massbins),), np.double]},
+            None,
+            None,
+            massbins,
+            np.empty_like(massbins),
+            *[values[name] for name in SignalPeakModel.SHAPE_PARAMETERS],
+            len(massbins),
+            size=len(massbins)
+        )
+        signal = sample_from_grid(massbins, ipatia_bins_out[0], n_sig, rng)
+        background = sample_exponential(
+            values["k"], params["m_min"], params["m_max"], n_bkg, rng
+        )
+        mydat = np.concatenate((signal, background)).astype(dtype)
+
+        toy = dict(params)
+        toy["mydat"] = mydat
+        toy["n_dat"] = len(mydat)
+        return toy
+
+    def subsample(self, fraction: float, rng: np.random.Generator) -> dict:
+        """
+        Draws a random subsample of the events in 'mydat'.
+
+        Args:
+            fraction (float): Fraction of events to keep, within (0, 1].
+            rng (np.random.Generator): Random number generator.
+
+        Returns:
+            dict: Copy of 'parameters' with the subsampled 'mydat' and 'n_dat'.
+        """
+        mydat = self.parameters["mydat"]
+        sample = dict(self.parameters)
+        sample["mydat"] = mydat[rng.random(len(mydat)) < fraction]
+        sample["n_dat"] = len(sample["mydat"])
+        return sample
+
+    @property
+    def init_kwargs(self) -> dict:
+        """Backend and precision the model was built with."""
+        return {
+            "backend": self.backend.value, "precision": self.precision.value
+        }
+
+    @property
+    def n_events(self) -> int:
+        """Number of events in 'mydat'."""
+        return int(self.parameters["n_dat"])
+
     @property
     def cuda_manager(self) -> dict:
         """Getter for cuda_manager property."""
@@ -1,5 +1,12 @@
 from abc import ABC, abstractmethod
+import functools
+from time import perf_counter
+from typing import Callable, Mapping, Optional
 from iminuit import Minuit
+import numpy as np
+
+# Observer of FCN calls: (arguments, FCN value, seconds)
+FcnHook = Callable[[tuple, float, float], None]
 
 class ModelPlugin(ABC):
     """
@@ -13,13 +20,19 @@ class ModelPlugin(ABC):
             the fitting process.
         parameters (dict): Dictionary containing the parameters required during 
             'fit_manager' initialization. 
+        extensive_parameters (tuple[str, ...]): Fit parameters proportional 
+            to the number of events (e.g. yields of an extended fit).
     """
 
+    extensive_parameters: tuple[str, ...] = ()
+
     _fit_manager: Minuit
     _parameters: dict
+    _fcn_hooks: list[FcnHook]
 
     def __init__(self, params: dict) -> None:
         self._parameters = params
+        self._fcn_hooks = []
 
     @abstractmethod
     def prepare_fit(self) -> None:
@@ -30,6 +43,148 @@ class ModelPlugin(ABC):
         """
         pass
 
+    def evaluate_batch(self, points: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the FCN for several parameter points.
+
+        Entry point for scans, finite-difference gradients, profile 
+        likelihoods or multi-start seeding. This default implementation calls 
+        the FCN of 'fit_manager' once per point; models able to evaluate many 
+        points in a single pass over their data should override it.
+
+        Args:
+            points (np.ndarray): Array of shape (K, P) with one parameter 
+                point per row, following the order of 
+                'fit_manager.parameters'.
+
+        Returns:
+            np.ndarray: Array of shape (K,) with the FCN value of each point.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        return np.array(
+            [self.fit_manager.fcn(point) for point in points], 
+            dtype=np.float64
+        )
+
+    def generate_toy(
+            self, 
+            values: Mapping[str, float], 
+            rng: np.random.Generator
+        ) -> dict:
+        """
+        Generates a pseudo-experiment from the model.
+
+        Models supporting toy studies return a copy of 'parameters' whose 
+        data has been replaced by a sample drawn from the model evaluated at 
+        'values'. Calling 'prepare_fit' after assigning it to 'parameters' 
+        prepares the fit to the toy.
+
+        Args:
+            values (Mapping[str, float]): Parameter values used to generate.
+            rng (np.random.Generator): Random number generator.
+
+        Returns:
+            dict: Parameters dictionary holding the generated data.
+
+        Raises:
+            NotImplementedError: If the model does not support toy generation.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support toy generation"
+        )
+
+    def subsample(self, fraction: float, rng: np.random.Generator) -> dict:
+        """
+        Draws a random subsample of the model's data.
+
+        Models supporting coarse-to-fine fits return a copy of 'parameters' 
+        restricted to a random 'fraction' of the events, suitable to build a
+        new instance of the same model.
+
+        Args:
+            fraction (float): Fraction of events to keep, within (0, 1].
+            rng (np.random.Generator): Random number generator.
+
+        Returns:
+            dict: Parameters dictionary holding the subsample.
+
+        Raises:
+            NotImplementedError: If the model does not support subsampling.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support subsampling"
+        )
+
+    @property
+    def init_kwargs(self) -> dict:
+        """
+        Keyword arguments rebuilding an equivalent model from the same 
+        parameters (e.g. in worker processes), besides 'params'.
+        """
+        return {}
+
+    @property
+    def n_events(self) -> Optional[int]:
+        """
+        Number of events of the model's data, which 'extensive_parameters' 
+        are proportional to. None if unknown.
+        """
+        return None
+
+    def wrap_fcn(self, fcn: Callable) -> Callable:
+        """
+        Wraps the FCN handed to 'fit_manager' so that its calls can be 
+        observed.
+
+        Models opt into FCN instrumentation by building their fit manager 
+        with 'Minuit(self.wrap_fcn(fcn), ...)'. The wrapper keeps the 
+        signature of 'fcn', and only times the calls while hooks are 
+        registered with 'add_fcn_hook'.
+
+        Args:
+            fcn (Callable): Function to minimize.
+
+        Returns:
+            Callable: Observable version of 'fcn'.
+        """
+        @functools.wraps(fcn)
+        def observed_fcn(*args):
+            hooks = self._fcn_hooks
+            if not hooks:
+                return fcn(*args)
+            start = perf_counter()
+            value = fcn(*args)
+            elapsed = perf_counter() - start
+            for hook in hooks:
+                hook(args, value, elapsed)
+            return value
+
+        return observed_fcn
+
+    def add_fcn_hook(self, hook: FcnHook) -> None:
+        """
+        Registers an observer of the FCN calls.
+
+        Only FCNs wrapped with 'wrap_fcn' are observed.
+
+        Args:
+            hook (FcnHook): Callable receiving the call arguments, the FCN 
+                value and the call duration in seconds.
+        """
+        self._fcn_hooks.append(hook)
+
+    def remove_fcn_hook(self, hook: FcnHook) -> None:
+        """
+        Unregisters an observer of the FCN calls.
+
+        Args:
+            hook (FcnHook): Previously registered observer.
+
+        Raises:
+            ValueError: If the hook is not registered.
+        """
+        self._fcn_hooks.remove(hook)
+
     @property
     def fit_manager(self) -> Minuit:
         """Get the fit_manager."""
@@ -43,4 +198,9 @@ class ModelPlugin(ABC):
     @property
     def parameters(self) -> dict:
         """Get the parameters dictionary."""
-        return self._parameters
\ No newline at end of file
+        return self._parameters
+
+    @parameters.setter
+    def parameters(self, params: dict):
+        """Set the parameters dictionary."""
+        self._parameters = params
\ No newline at end of file
@@ -1,30 +1,30 @@
+from ipanema.fit import FitResult
 from ipanema.model import ModelPlugin
 from ipanema.output import OutputPlugin
 
 class CommandLineOutput(OutputPlugin):
     """
-    Output plugin that performs the fit and displays results via the 
-    command-line interface (CLI).
+    Output plugin that displays fit results via the command-line 
+    interface (CLI).
 
-    This plugin uses the model's fit manager to run the minimization and 
-    then prints the parameter values and errors to the console.
+    This plugin prints the parameter values and errors obtained by the fit 
+    stage to the console.
     """
 
-    def generate_results(self, model: ModelPlugin) -> None:
+    def generate_results(self, model: ModelPlugin, result: FitResult) -> None:
         """
-        Fit the model and print the results to the command line.
+        Print the fit results to the command line.
 
-        This method runs the fit using the model's fit manager (assumed to be 
-        a Minuit instance), then prints the optimized parameter values and 
-        their estimated errors.
+        Prints the optimized parameter values and their estimated errors, 
+        together with any asymmetric errors computed by MINOS.
 
         Args:
-            model (ModelPlugin): The model to be fitted and whose results 
-                will be displayed.
+            model (ModelPlugin): The fitted model.
+            result (FitResult): Immutable result of the model fit.
         """
-        
-        model.fit_manager.migrad()
-        model.fit_manager.hesse()
 
-        print(f"\nFit Manager Values: \n{model.fit_manager.values}\n")
-        print(f"\nFit Manager Error: \n{model.fit_manager.errors}\n")
+        print(f"\nFit Manager Values: \n{dict(result.values)}\n")
+        print(f"\nFit Manager Error: \n{dict(result.errors)}\n")
+        if result.minos_errors:
+            print(f"\nFit Manager Minos Errors: \n"
+                  f"{dict(result.minos_errors)}\n")
@@ -1,20 +1,35 @@
 from abc import ABC, abstractmethod
+from ipanema.fit import FitResult
 from ipanema.model import ModelPlugin
 
 class OutputPlugin(ABC):
     """
     Abstract base class for Ipanema's Output Plugin.
     
-    This type of plugin is responsible for managing model fitting and 
-    presenting results.
+    This type of plugin is responsible for presenting the results of a model 
+    fit. The fit itself is executed once by Ipanema's fit stage before any 
+    output plugin is called.
+
+    Output plugins run concurrently with each other. Plugins that do not set 
+    'thread_safe' are executed one after another on the thread that ran the
+    fit, so they never overlap with each other and may use the CUDA context
+    of the model (e.g. to evaluate it through 'model.cuda_manager').
+
+    Attributes:
+        thread_safe (bool): Whether the plugin may run at the same time as 
+            other plugins of the same kind, on a worker thread without the 
+            CUDA context of the model. Defaults to False.
     """
 
+    thread_safe: bool = False
+
     @abstractmethod
-    def generate_results(self, model: ModelPlugin) -> None:
+    def generate_results(self, model: ModelPlugin, result: FitResult) -> None:
         """
         Generate and present results for a fitted model.
 
         Args:
             model (ModelPlugin): The fitted model to process results from.
+            result (FitResult): Immutable result of the model fit.
         """
         pass
\ No newline at end of file
@@ -1,16 +1,65 @@
 from abc import ABC, abstractmethod
+import math
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping, Optional
 from sdk.cuda_manager.cuda_program import  CudaProgram
+from sdk.cuda_manager.expression import ArrayInput, Expression, Reduction
+from sdk.cuda_manager.instrumentation import (
+    EventKind,
+    InstrumentationListener,
+    KernelEvent
+)
+from sdk.cuda_manager.launch_tuning import LaunchTuningCache
 
 class CudaManager(ABC):
-    """Abstraction of a generic CUDA handler for Python."""
+    """
+    Abstraction of a generic CUDA handler for Python.
+
+    Implementations report their compilations, transfers, allocations and
+    kernel launches to the listeners registered with 'add_listener'. When
+    no listener is registered nothing is measured.
+
+    Each kernel is compiled with the sources of the fragment exporting it
+    and of the fragments it depends on (see 'kernel_source'), so adding
+    fragments does not increase the cost of compiling the others. Launches
+    given 'constants' run a variant of the kernel compiled with them defined
+    as macros, so kernels can bake fixed parameters in.
+
+    Element-wise expressions built lazily from 'array' leaves (see 
+    'sdk.cuda_manager.expression') are fused into a single pass by 
+    'evaluate', with the generated code cached by expression signature.
+
+    Data-parallel primitives (map-reduce, weighted sums, fixed-bin 
+    histograms, prefix scans and sorts) are provided by every backend.
+
+    Launches given a problem 'size' get their grid derived from the block
+    dimensions. If autotuning is enabled, launches without block dimensions
+    time 'BLOCK_CANDIDATES' on first use and reuse the fastest one.
+
+    Attributes:
+        DEFAULT_BLOCK (tuple[int, int, int]): Block dimensions used when none
+            are given and autotuning is disabled.
+        BLOCK_CANDIDATES (tuple[int, ...]): Block sizes tried by autotuning.
+        tuning_cache (LaunchTuningCache, optional): Store of the tuned 
+            blocks, or None if autotuning is disabled.
+    """
+
+    DEFAULT_BLOCK: tuple[int, int, int] = (256, 1, 1)
+    BLOCK_CANDIDATES: tuple[int, ...] = (64, 128, 256, 512)
 
     __src_code: dict[str, CudaProgram]
+    __listeners: list[InstrumentationListener]
+    __kernel_sources: dict[
+        tuple[str, tuple[tuple[str, float], ...]], 
+        tuple[tuple[str, ...], str]
+    ]
 
     def __init__(self)-> None:
         """Initializes a CUDA program handler."""
         self.__src_code: dict[str, CudaProgram] = {}
+        self.__listeners: list[InstrumentationListener] = []
+        self.__kernel_sources = {}
+        self.tuning_cache: Optional[LaunchTuningCache] = None
 
     @abstractmethod
     def run_program(self,
@@ -19,9 +68,12 @@ class CudaManager(ABC):
             outputs_details: dict[
                 int, tuple[tuple[int, ...], Any]
             ],
-            block: tuple[int, int, int],
+            block: Optional[tuple[int, int, int]],
             grid: tuple[int, int],
-            *args
+            *args,
+            size: Optional[int | tuple[int, int]] = None,
+            constants: Optional[Mapping[str, float]] = None,
+            keep_on_device: bool = False
     ) -> list:
         """
         Executes a registered CUDA kernel with the given arguments and 
@@ -29,7 +81,8 @@ class CudaManager(ABC):
 
         This method runs a compiled CUDA function by name, sending all 
         arguments to the GPU, and returning a list of output buffers as host 
-        copies based on 'outputs_idx' and 'outputs_details'.
+        copies based on 'outputs_idx' and 'outputs_details'. Device arrays 
+        of the backend (see 'to_device') are passed without transfers.
 
         Args:
             func_name (str): Name of the CUDA function to execute.
@@ -39,10 +92,21 @@ class CudaManager(ABC):
                 description of each argument following the structure
                 'output_idx : (shape, dtype)'.
             block (tuple[int, int, int], optional): CUDA block dimensions. 
-                Defaults to (256,1,1).
-            grid (tuple[int, int], optional): CUDA grid dimensions. 
-                Defaults to (1,1).
+                None autotunes them (see 'enable_autotuning') or uses 
+                'DEFAULT_BLOCK'. Defaults to (256,1,1).
+            grid (tuple[int, int], optional): CUDA grid dimensions, ignored
+                if 'size' is given. Defaults to (1,1).
             *args: Parameters for the CUDA function.
+            size (int | tuple[int, int], optional): Number of threads needed
+                along x, optionally with the number of blocks along y. The 
+                grid is derived from it with 'grid_for'.
+            constants (Mapping[str, float], optional): Macros defined when
+                compiling the kernel (see 'kernel_source'). Values must be
+                consistent with the arguments they replace.
+            keep_on_device (bool, optional): Whether the outputs are 
+                returned as device arrays of the backend, usable by later 
+                launches and expressions without transfers. Defaults to 
+                host copies.
 
         Returns:
             list: List with each one of the outputs from the CUDA function.
@@ -106,7 +170,225 @@ class CudaManager(ABC):
         """
         pass
 
-    def add_code_fragment(self, name: str, function: str | Path) -> None:
+    @abstractmethod
+    def to_device(self, array: Any) -> Any:
+        """
+        Copies a host array to the memory of the backend.
+
+        The copy can be passed to any number of launches and expressions 
+        without further transfers.
+
+        Args:
+            array (Any): Host array.
+
+        Returns:
+            Any: Device array of the backend.
+        """
+        pass
+
+    @abstractmethod
+    def evaluate(self, expression: Expression) -> Any:
+        """
+        Evaluates a lazy expression as a single fused pass over the data.
+
+        The code generated for an expression is cached by its signature 
+        (operations, input dtypes and reduction), so evaluating expressions
+        of the same shape with other arrays or scalars reuses it.
+
+        Args:
+            expression (Expression): Element-wise expression, optionally 
+                closed by a reduction.
+
+        Returns:
+            Any: Host array with the element-wise result, or the reduced 
+                value as a float.
+
+        Raises:
+            ValueError: If the expression is not valid (see 
+                'expression.lower').
+
+        Example:
+            >>> x = manager.array(np.arange(1., 4.))
+            >>> manager.evaluate((2*log(x) + 1).sum())
+        """
+        pass
+
+    @abstractmethod
+    def histogram(
+            self,
+            data: Any,
+            n_bins: int,
+            low: float,
+            high: float,
+            weights: Optional[Any] = None
+        ) -> Any:
+        """
+        Fixed-bin histogram of an array.
+
+        Bins are 'n_bins' equal intervals of [low, high), the last one also
+        including 'high', as in 'numpy.histogram'. Values outside the range
+        are ignored.
+
+        Args:
+            data (Any): One-dimensional data array.
+            n_bins (int): Number of bins.
+            low (float): Lower edge of the first bin.
+            high (float): Upper edge of the last bin.
+            weights (Any, optional): Weight of each value. Defaults to 1.
+
+        Returns:
+            Any: Host array of shape (n_bins,) with the (weighted) count of
+                each bin, in float64.
+
+        Raises:
+            ValueError: If the number of bins or the range are not valid.
+        """
+        pass
+
+    @abstractmethod
+    def scan(self, array: Any, exclusive: bool = False) -> Any:
+        """
+        Prefix sum of an array.
+
+        Args:
+            array (Any): One-dimensional data array.
+            exclusive (bool, optional): Whether element 'i' of the result 
+                excludes 'array[i]' (starting at 0). Defaults to an 
+                inclusive scan.
+
+        Returns:
+            Any: Host array with the prefix sums, of the dtype of 'array'.
+        """
+        pass
+
+    @abstractmethod
+    def sort(self, array: Any) -> Any:
+        """
+        Sorts an array in ascending order.
+
+        Args:
+            array (Any): One-dimensional data array.
+
+        Returns:
+            Any: Host array with the sorted values.
+        """
+        pass
+
+    def map_reduce(
+            self, 
+            expression: Expression, 
+            reduction: str = Reduction.Kind.SUM.value
+        ) -> float:
+        """
+        Reduces an element-wise expression in a single fused pass.
+
+        Args:
+            expression (Expression): Element-wise expression (e.g. built 
+                from 'array' leaves).
+            reduction (str, optional): "sum", "max" or "min". Defaults to 
+                "sum".
+
+        Returns:
+            float: Reduced value.
+
+        Raises:
+            ValueError: If the expression or the reduction are not valid.
+
+        Example:
+            >>> x = manager.array(data)
+            >>> manager.map_reduce((x - 1)**2, "max")
+        """
+        return self.evaluate(Reduction(Reduction.Kind(reduction), expression))
+
+    def weighted_sum(self, values: Any, weights: Any) -> float:
+        """
+        Sum of the element-wise products of two arrays.
+
+        Args:
+            values (Any): One-dimensional data array.
+            weights (Any): Weight of each value.
+
+        Returns:
+            float: Weighted sum.
+
+        Raises:
+            ValueError: If the arrays have different lengths.
+        """
+        return self.map_reduce(self.array(values)*self.array(weights))
+
+    @staticmethod
+    def _check_histogram(n_bins: int, low: float, high: float) -> None:
+        """
+        Validates the binning of 'histogram'.
+
+        Raises:
+            ValueError: If the number of bins or the range are not valid.
+        """
+        if n_bins < 1:
+            raise ValueError("'n_bins' must be positive")
+        if not low < high:
+            raise ValueError(f"Invalid histogram range [{low}, {high}]")
+
+    @staticmethod
+    def array(data: Any) -> ArrayInput:
+        """
+        Wraps an array as the leaf of a lazy expression.
+
+        Args:
+            data (Any): One-dimensional host array, or device array of the 
+                backend.
+
+        Returns:
+            ArrayInput: Expression leaf.
+        """
+        return ArrayInput(data)
+
+    def enable_autotuning(
+            self, 
+            cache: Optional[LaunchTuningCache | str | Path] = None
+        ) -> None:
+        """
+        Enables block size autotuning for launches without block dimensions.
+
+        Args:
+            cache (LaunchTuningCache | str | Path, optional): Store of the 
+                tuned blocks, or path of its JSON file. Defaults to an 
+                in-memory store.
+        """
+        if not isinstance(cache, LaunchTuningCache):
+            cache = LaunchTuningCache(cache)
+        self.tuning_cache = cache
+
+    @staticmethod
+    def grid_for(
+            size: int | tuple[int, int],
+            block: tuple[int, int, int]
+        ) -> tuple[int, int]:
+        """
+        Smallest grid covering a problem size.
+
+        Args:
+            size (int | tuple[int, int]): Number of threads needed along x,
+                optionally with the number of blocks along y.
+            block (tuple[int, int, int]): CUDA block dimensions.
+
+        Returns:
+            tuple[int, int]: CUDA grid dimensions.
+
+        Example:
+            >>> CudaManager.grid_for((1000, 4), (256, 1, 1))
+            (4, 4)
+        """
+        size_x, size_y = size if isinstance(size, tuple) else (size, 1)
+        return (max(math.ceil(size_x / block[0]), 1), size_y)
+
+    def add_code_fragment(
+            self, 
+            name: str, 
+            function: str | Path,
+            exports: Optional[list[str]] = None,
+            depends: Optional[list[str]] = None
+        ) -> None:
         """
         Registers a new CUDA code fragment by name.
 
@@ -114,8 +396,13 @@ class CudaManager(ABC):
             name (str): Identifier for the code fragment.
             function (str | Path): CUDA source code string or path 
                 to the file.
+            exports (list[str], optional): Kernels defined by the fragment.
+                Defaults to the '__global__' functions found in the source.
+            depends (list[str], optional): Names of the fragments whose 
+                sources the fragment needs.
         """
-        self.__src_code[name] = CudaProgram(function)
+        self.__src_code[name] = CudaProgram(function, exports, depends)
+        self.__kernel_sources.clear()
 
     def pop_code_fragment(self, name: str) -> str:
         """
@@ -128,8 +415,145 @@ class CudaManager(ABC):
             str: The combined CUDA source code for the removed fragment.
         """
         program = self.__src_code.pop(name)
-        program.includes.append(program.functions)
-        return "\n".join(program.includes)
+        self.__kernel_sources.clear()
+        return "\n".join(program.includes + [program.functions])
+
+    def kernel_source(
+            self, 
+            func_name: str,
+            constants: Optional[Mapping[str, float]] = None
+        ) -> tuple[tuple[str, ...], str]:
+        """
+        Minimal source needed to compile a kernel.
+
+        The source joins the fragment exporting the kernel with the 
+        fragments it depends on, transitively, placing dependencies first.
+        Kernels not exported by any fragment get the source of every 
+        fragment. Each set of 'constants' gives a different variant of the
+        source, with the constants defined as macros at its top.
+
+        Args:
+            func_name (str): Name of the kernel.
+            constants (Mapping[str, float], optional): Macros defined for 
+                the kernel.
+
+        Returns:
+            tuple[tuple[str, ...], str]: Names of the fragments in the group
+                and their joined source.
+
+        Raises:
+            LookupError: If a dependency is not registered.
+            ValueError: If the dependencies are circular or a constant is 
+                not valid.
+        """
+        key = (func_name, tuple(sorted((constants or {}).items())))
+        cached = self.__kernel_sources.get(key)
+        if cached is not None:
+            return cached
+
+        owner = next(
+            (
+                name for name, program in self.__src_code.items()
+                if func_name in program.exports
+            ), 
+            None
+        )
+        if owner is None:
+            group = list(self.__src_code)
+        else:
+            group = []
+            self.__collect_dependencies(owner, group, [])
+
+        programs = [self.__src_code[name] for name in group]
+        # Repeated includes are kept once, in order of appearance
+        includes = dict.fromkeys(
+            include for program in programs for include in program.includes
+        )
+        source = "\n".join(
+            CudaProgram.defines(constants or {}) + list(includes) 
+            + [program.functions for program in programs]
+        )
+        self.__kernel_sources[key] = (tuple(group), source)
+        return self.__kernel_sources[key]
+
+    def __collect_dependencies(
+            self, 
+            name: str, 
+            group: list[str], 
+            path: list[str]
+        ) -> None:
+        """
+        Appends a fragment to 'group' after its dependencies.
+
+        Args:
+            name (str): Name of the fragment.
+            group (list[str]): Fragments collected so far.
+            path (list[str]): Fragments being collected, to detect cycles.
+
+        Raises:
+            LookupError: If a dependency is not registered.
+            ValueError: If the dependencies are circular.
+        """
+        if name in group:
+            return
+        if name in path:
+            raise ValueError(
+                f"Circular fragment dependencies: {path + [name]}"
+            )
+        if name not in self.__src_code:
+            raise LookupError(f"Fragment '{name}' is not registered")
+        for dependency in self.__src_code[name].depends:
+            self.__collect_dependencies(dependency, group, path + [name])
+        group.append(name)
+
+    def add_listener(self, listener: InstrumentationListener) -> None:
+        """
+        Registers a listener for the operations of this manager.
+
+        Args:
+            listener (InstrumentationListener): Listener to register.
+        """
+        self.__listeners.append(listener)
+
+    def remove_listener(self, listener: InstrumentationListener) -> None:
+        """
+        Unregisters a listener.
+
+        Args:
+            listener (InstrumentationListener): Listener to unregister.
+
+        Raises:
+            ValueError: If the listener is not registered.
+        """
+        self.__listeners.remove(listener)
+
+    def _emit(
+            self,
+            kind: EventKind,
+            name: str,
+            seconds: float = 0.,
+            nbytes: int = 0
+        ) -> None:
+        """
+        Reports an operation to the registered listeners.
+
+        Implementations should check 'instrumented' before measuring, so
+        that disabled instrumentation costs a single attribute lookup.
+
+        Args:
+            kind (EventKind): Type of operation.
+            name (str): Kernel or operation name.
+            seconds (float, optional): Duration of the operation.
+            nbytes (int, optional): Bytes transferred or allocated.
+        """
+        event = KernelEvent(kind, name, seconds, nbytes)
+        for listener in self.__listeners:
+            listener.on_event(event)
+
+    @property
+    def instrumented(self) -> bool:
+        """Whether any listener is registered."""
+        return bool(self.__listeners)
 
     # Getter for src_code
     @property
@@ -1,6 +1,13 @@
 from functools import singledispatchmethod
 from pathlib import Path
 from re import compile
+from math import isfinite
+from typing import Mapping, Optional
+
+# Names of the kernels defined in a CUDA source
+KERNEL_PATTERN = compile(r"__global__\s+void\s+(\w+)\s*\(")
+# Valid names of preprocessor macros
+MACRO_PATTERN = compile(r"[A-Za-z_]\w*")
 
 class CudaProgram():
     """
@@ -10,19 +17,42 @@ class CudaProgram():
     instructions from the body of the code. Allows initialization using the
     source code as a string or the file path of the program.
 
+    A program also declares the kernels it exports and the programs it 
+    depends on, so that a kernel can be compiled with only the sources it 
+    needs. Unless declared, exports are parsed from the '__global__' 
+    functions of the source.
+
     Attributes:
         functions (str): Body of the CUDA program without include directives.
         includes (list[str]): List of include directives of the CUDA program.
+        exports (list[str]): Kernels defined by the program.
+        depends (list[str]): Names of the programs whose sources the program
+            needs, as registered on a CudaManager.
     """
 
     __functions: str
     __includes: list[str]
+    __exports: list[str]
+    __depends: list[str]
 
     @singledispatchmethod
-    def __init__(self, function) -> None:
+    def __init__(
+            self, 
+            function, 
+            exports: Optional[list[str]] = None, 
+            depends: Optional[list[str]] = None
+        ) -> None:
         """
         Base constructor for CudaProgram (singledispatch).
 
+        Args:
+            function (str | Path): CUDA source code string or path to the 
+                file.
+            exports (list[str], optional): Kernels defined by the program. 
+                Defaults to the '__global__' functions found in the source.
+            depends (list[str], optional): Names of the programs it depends
+                on. Defaults to none.
+
         Raises:
             TypeError: If the provided input type is not supported.
         """
@@ -31,21 +61,39 @@ class CudaProgram():
         )
 
     @__init__.register(str)
-    def _(self, function: str) -> None:
-        self.__save_src_code(function)
+    def _(
+            self, 
+            function: str, 
+            exports: Optional[list[str]] = None, 
+            depends: Optional[list[str]] = None
+        ) -> None:
+        self.__save_src_code(function, exports, depends)
 
     @__init__.register(Path)
-    def _(self, function: Path) -> None:
+    def _(
+            self, 
+            function: Path, 
+            exports: Optional[list[str]] = None, 
+            depends: Optional[list[str]] = None
+        ) -> None:
         with open(function, 'r', encoding='UTF-8') as file:
-            self.__save_src_code(file.read())
+            self.__save_src_code(file.read(), exports, depends)
 
-    def __save_src_code(self, src_code: str) -> None:
+    def __save_src_code(
+            self, 
+            src_code: str,
+            exports: Optional[list[str]] = None, 
+            depends: Optional[list[str]] = None
+        ) -> None:
         """
         Parses the CUDA source code and separates the include directives
         from the main function body.
 
         Args:
             src_code (str): Complete CUDA program as a string.
+            exports (list[str], optional): Kernels defined by the program.
+            depends (list[str], optional): Names of the programs it depends
+                on.
         """
         include_list: list[str] = []
         function_list: list[str] = []
@@ -61,6 +109,39 @@ class CudaProgram():
                 function_list.append(line)  
         self.__includes = include_list
         self.__functions = "\n".join(function_list)
+        if exports is None:
+            exports = KERNEL_PATTERN.findall(self.__functions)
+        self.__exports = list(exports)
+        self.__depends = list(depends or [])
+
+    @staticmethod
+    def defines(constants: Mapping[str, float]) -> list[str]:
+        """
+        Preprocessor directives defining compile-time constants.
+
+        Args:
+            constants (Mapping[str, float]): Value of each macro.
+
+        Returns:
+            list[str]: '#define' directives, sorted by name.
+
+        Raises:
+            ValueError: If a name is not a valid macro name or a value is 
+                not finite.
+
+        Example:
+            >>> CudaProgram.defines({"IPATIA_FIXED_N": 1})
+            ['#define IPATIA_FIXED_N 1.0']
+        """
+        directives = []
+        for name, value in sorted(constants.items()):
+            if not MACRO_PATTERN.fullmatch(name):
+                raise ValueError(f"Invalid macro name: '{name}'")
+            if not isfinite(value):
+                raise ValueError(f"Value of '{name}' is not finite: {value}")
+            # repr keeps every digit of the double
+            directives.append(f"#define {name} {float(value)!r}")
+        return directives
 
     @property
     def functions(self) -> str:
@@ -70,4 +151,14 @@ class CudaProgram():
     @property
     def includes(self) -> list[str]:
         """Getter for includes property"""
-        return self.__includes
\ No newline at end of file
+        return self.__includes
+
+    @property
+    def exports(self) -> list[str]:
+        """Getter for exports property"""
+        return self.__exports
+
+    @property
+    def depends(self) -> list[str]:
+        """Getter for depends property"""
+        return self.__depends
\ No newline at end of file
@@ -0,0 +1,314 @@
+from dataclasses import dataclass
+from enum import Enum
+from numbers import Real
+from typing import Any, Callable, Optional
+import numpy as np
+
+class Expression():
+    """
+    Node of a lazy element-wise array expression.
+
+    Expressions are built from 'ArrayInput' leaves (see
+    'CudaManager.array') with the arithmetic operators and the functions of
+    this module (e.g. 'exp', 'log'), optionally closed by a reduction
+    ('sum', 'max' or 'min'). Nothing is computed until the expression is
+    passed to 'CudaManager.evaluate', which runs the whole graph as a single
+    fused pass over the data.
+
+    Python and NumPy scalars become parameters of the generated code, so an
+    expression evaluated again with other scalar values reuses it.
+    """
+
+    def __add__(self, other: Any) -> "Expression":
+        return Binary("+", self, wrap(other))
+
+    def __radd__(self, other: Any) -> "Expression":
+        return Binary("+", wrap(other), self)
+
+    def __sub__(self, other: Any) -> "Expression":
+        return Binary("-", self, wrap(other))
+
+    def __rsub__(self, other: Any) -> "Expression":
+        return Binary("-", wrap(other), self)
+
+    def __mul__(self, other: Any) -> "Expression":
+        return Binary("*", self, wrap(other))
+
+    def __rmul__(self, other: Any) -> "Expression":
+        return Binary("*", wrap(other), self)
+
+    def __truediv__(self, other: Any) -> "Expression":
+        return Binary("/", self, wrap(other))
+
+    def __rtruediv__(self, other: Any) -> "Expression":
+        return Binary("/", wrap(other), self)
+
+    def __pow__(self, other: Any) -> "Expression":
+        return Binary("**", self, wrap(other))
+
+    def __rpow__(self, other: Any) -> "Expression":
+        return Binary("**", wrap(other), self)
+
+    def __neg__(self) -> "Expression":
+        return Unary("neg", self)
+
+    def sum(self) -> "Reduction":
+        """Lazy sum of the elements of the expression."""
+        return Reduction(Reduction.Kind.SUM, self)
+
+    def max(self) -> "Reduction":
+        """Lazy maximum of the elements of the expression."""
+        return Reduction(Reduction.Kind.MAX, self)
+
+    def min(self) -> "Reduction":
+        """Lazy minimum of the elements of the expression."""
+        return Reduction(Reduction.Kind.MIN, self)
+
+class ArrayInput(Expression):
+    """
+    Leaf holding an input array.
+
+    Attributes:
+        data (Any): Host array, or device array of the backend.
+    """
+
+    def __init__(self, data: Any) -> None:
+        """
+        Initializes the leaf.
+
+        Args:
+            data (Any): Host array, or device array of the backend.
+
+        Raises:
+            ValueError: If the array is not one-dimensional.
+        """
+        if isinstance(data, (list, tuple)):
+            data = np.asarray(data)
+        if len(data.shape) != 1:
+            raise ValueError("Expression inputs must be one-dimensional")
+        self.data = data
+
+class Scalar(Expression):
+    """
+    Leaf holding a scalar parameter.
+
+    Attributes:
+        value (float): Value of the parameter.
+    """
+
+    def __init__(self, value: float) -> None:
+        self.value = float(value)
+
+class Unary(Expression):
+    """
+    Element-wise function of an expression.
+
+    Attributes:
+        op (str): Name of the function (see 'UNARY_FUNCTIONS').
+        operand (Expression): Argument.
+    """
+
+    def __init__(self, op: str, operand: Expression) -> None:
+        self.op = op
+        self.operand = operand
+
+class Binary(Expression):
+    """
+    Element-wise arithmetic between two expressions.
+
+    Attributes:
+        op (str): Operator ("+", "-", "*", "/" or "**").
+        lhs (Expression): Left operand.
+        rhs (Expression): Right operand.
+    """
+
+    def __init__(self, op: str, lhs: Expression, rhs: Expression) -> None:
+        self.op = op
+        self.lhs = lhs
+        self.rhs = rhs
+
+class Reduction(Expression):
+    """
+    Reduction of an element-wise expression to a scalar.
+
+    Reductions can only be the root of an expression.
+
+    Attributes:
+        kind (Reduction.Kind): Type of reduction.
+        operand (Expression): Reduced expression.
+    """
+
+    class Kind(Enum):
+        SUM: str = "sum"
+        MAX: str = "max"
+        MIN: str = "min"
+
+    def __init__(self, kind: "Reduction.Kind", operand: Expression) -> None:
+        self.kind = kind
+        self.operand = operand
+
+# Element-wise functions: name -> (CUDA code, NumPy code)
+UNARY_FUNCTIONS: dict[str, tuple[str, str]] = {
+    "neg": ("(-{0})", "np.negative({0})"),
+    "exp": ("exp({0})", "np.exp({0})"),
+    "log": ("log({0})", "np.log({0})"),
+    "sqrt": ("sqrt({0})", "np.sqrt({0})"),
+    "sin": ("sin({0})", "np.sin({0})"),
+    "cos": ("cos({0})", "np.cos({0})"),
+    "abs": ("fabs({0})", "np.abs({0})"),
+}
+
+# Reductions: kind -> (neutral element, CUDA reduce expression, NumPy ufunc)
+REDUCTIONS: dict[Reduction.Kind, tuple[str, str, np.ufunc]] = {
+    Reduction.Kind.SUM: ("0", "a+b", np.add),
+    Reduction.Kind.MAX: ("-INFINITY", "fmax(a,b)", np.maximum),
+    Reduction.Kind.MIN: ("INFINITY", "fmin(a,b)", np.minimum),
+}
+
+def wrap(value: Any) -> Expression:
+    """
+    Converts an operand to an expression.
+
+    Args:
+        value (Any): Expression or real scalar.
+
+    Returns:
+        Expression: The expression, or a Scalar leaf.
+
+    Raises:
+        TypeError: If the operand is not supported.
+    """
+    if isinstance(value, Expression):
+        return value
+    if isinstance(value, (Real, np.number)):
+        return Scalar(value)
+    raise TypeError(
+        f"Type {type(value)} not admitted in an expression; arrays must be "
+        "wrapped with 'CudaManager.array'"
+    )
+
+def _unary(op: str) -> Callable[[Any], Expression]:
+    """Builds the lazy version of an element-wise function."""
+    def function(x: Any) -> Expression:
+        return Unary(op, wrap(x))
+    function.__name__ = op
+    function.__doc__ = f"Lazy element-wise '{op}' of an expression."
+    return function
+
+exp = _unary("exp")
+log = _unary("log")
+sqrt = _unary("sqrt")
+sin = _unary("sin")
+cos = _unary("cos")
+absolute = _unary("abs")
+
+# CUDA types of the supported input dtypes
+C_TYPES: dict[np.dtype, str] = {
+    np.dtype(np.float32): "float",
+    np.dtype(np.float64): "double",
+    np.dtype(np.int32): "int",
+    np.dtype(np.int64): "long long",
+}
+
+@dataclass(frozen=True)
+class LoweredExpression():
+    """
+    Code generated for an expression, shared by every evaluation with the
+    same signature.
+
+    Arrays are named 'a0', 'a1', ... and scalars 's0', 's1', ... in order of
+    first appearance.
+
+    Attributes:
+        signature (str): Key of the generated code: the CUDA code, the
+            input dtypes and the reduction.
+        cuda_code (str): CUDA expression of one element, indexed by 'i'.
+        numpy_code (str): NumPy expression over whole arrays.
+        arrays (tuple[Any, ...]): Input arrays.
+        scalars (tuple[float, ...]): Scalar parameters.
+        reduction (Reduction.Kind, optional): Final reduction, if any.
+    """
+
+    signature: str
+    cuda_code: str
+    numpy_code: str
+    arrays: tuple[Any, ...]
+    scalars: tuple[float, ...]
+    reduction: Optional[Reduction.Kind]
+
+    @property
+    def size(self) -> int:
+        """Number of elements of the inputs."""
+        return self.arrays[0].shape[0]
+
+    def cuda_arguments(self) -> str:
+        """Argument declarations of the inputs in generated CUDA code."""
+        return ", ".join(
+            [
+                f"const {C_TYPES[np.dtype(array.dtype)]} *a{i}"
+                for i, array in enumerate(self.arrays)
+            ] + [f"double s{i}" for i in range(len(self.scalars))]
+        )
+
+def lower(expression: Expression) -> LoweredExpression:
+    """
+    Generates the code of an expression.
+
+    Args:
+        expression (Expression): Root of the expression.
+
+    Returns:
+        LoweredExpression: Generated code and inputs.
+
+    Raises:
+        ValueError: If the expression has no arrays, arrays of different
+            lengths, reductions below its root or unsupported dtypes.
+    """
+    reduction = None
+    if isinstance(expression, Reduction):
+        reduction = expression.kind
+        expression = expression.operand
+
+    arrays: dict[int, tuple[int, Any]] = {}
+    scalars: list[float] = []
+
+    def render(node: Expression) -> tuple[str, str]:
+        if isinstance(node, ArrayInput):
+            index, _ = arrays.setdefault(id(node), (len(arrays), node.data))
+            return f"a{index}[i]", f"a{index}"
+        if isinstance(node, Scalar):
+            scalars.append(node.value)
+            return f"s{len(scalars) - 1}", f"s{len(scalars) - 1}"
+        if isinstance(node, Unary):
+            cuda_code, numpy_code = UNARY_FUNCTIONS[node.op]
+            cuda_arg, numpy_arg = render(node.operand)
+            return cuda_code.format(cuda_arg), numpy_code.format(numpy_arg)
+        if isinstance(node, Binary):
+            cuda_lhs, numpy_lhs = render(node.lhs)
+            cuda_rhs, numpy_rhs = render(node.rhs)
+            if node.op == "**":
+                cuda_code = f"pow((double){cuda_lhs}, (double){cuda_rhs})"
+            else:
+                cuda_code = f"({cuda_lhs} {node.op} {cuda_rhs})"
+            return cuda_code, f"({numpy_lhs} {node.op} {numpy_rhs})"
+        raise ValueError("Reductions can only be the root of an expression")
+
+    cuda_code, numpy_code = render(expression)
+    # Indices follow the insertion order of 'arrays'
+    inputs = tuple(data for _, data in arrays.values())
+    if not inputs:
+        raise ValueError("Expressions need at least one array")
+    if len({array.shape[0] for array in inputs}) > 1:
+        raise ValueError("Arrays of an expression must have the same length")
+    dtypes = [np.dtype(array.dtype) for array in inputs]
+    unsupported = [dtype for dtype in dtypes if dtype not in C_TYPES]
+    if unsupported:
+        raise ValueError(f"Unsupported dtypes in expression: {unsupported}")
+
+    signature = "|".join([
+        cuda_code, ",".join(dtype.str for dtype in dtypes),
+        reduction.value if reduction is not None else ""
+    ])
+    return LoweredExpression(
+        signature, cuda_code, numpy_code, inputs, tuple(scalars), reduction
+    )
@@ -0,0 +1,81 @@
+// Device primitives of PyCudaManager (histogram and sort).
+
+// Bins counted in shared memory by each block before being merged
+#define HISTOGRAM_SHARED_BINS 2048
+
+// Atomic addition of doubles. It is native from compute capability 6.0;
+// older devices use a compare-and-swap loop over the 64-bit pattern.
+__device__ double atomicAddF64(double *address, double value)
+  {
+#if __CUDA_ARCH__ >= 600
+    return atomicAdd(address, value);
+#else
+    unsigned long long int *bits = (unsigned long long int *)address;
+    unsigned long long int old = *bits, assumed;
+    do {
+        assumed = old;
+        old = atomicCAS(bits, assumed, __double_as_longlong(
+            value + __longlong_as_double(assumed)
+        ));
+    } while (assumed != old);
+    return __longlong_as_double(old);
+#endif
+  }
+
+// Fixed-bin histogram of N values over [low, high], 'high' included in the
+// last bin. Blocks accumulate privately in shared memory when the bins fit,
+// so global atomics are only issued once per bin and block. 'counts' must
+// be zeroed. Weights are ignored unless 'weighted' is set.
+#define HISTOGRAM(NAME, TYPE)                                                \
+__global__ void NAME(const TYPE *x, const double *w, double *counts,         \
+                     double low, double high, int n_bins, int N, int weighted) \
+  {                                                                          \
+    __shared__ double local[HISTOGRAM_SHARED_BINS];                          \
+    const bool privatized = n_bins <= HISTOGRAM_SHARED_BINS;                 \
+    if (privatized) {                                                        \
+        for (int b = threadIdx.x; b < n_bins; b += blockDim.x) local[b] = 0.; \
+    }                                                                        \
+    __syncthreads();                                                         \
+    double *target = privatized ? local : counts;                            \
+    double scale = n_bins/(high - low);                                      \
+    for (int i = threadIdx.x + blockDim.x*blockIdx.x; i < N;                 \
+         i += blockDim.x*gridDim.x) {                                        \
+        double value = x[i];                                                 \
+        if (value >= low && value <= high) {                                 \
+            int b = min((int)((value - low)*scale), n_bins - 1);             \
+            atomicAddF64(target + b, weighted ? w[i] : 1.);                  \
+        }                                                                    \
+    }                                                                        \
+    if (privatized) {                                                        \
+        __syncthreads();                                                     \
+        for (int b = threadIdx.x; b < n_bins; b += blockDim.x) {             \
+            if (local[b] != 0.) atomicAddF64(counts + b, local[b]);          \
+        }                                                                    \
+    }                                                                        \
+  }
+
+HISTOGRAM(histogram_f32, float)
+HISTOGRAM(histogram_f64, double)
+
+// One compare-and-swap step of a bitonic sort over N (a power of two)
+// values, for the stage 'k' and distance 'j'.
+#define BITONIC_STEP(NAME, TYPE)                                             \
+__global__ void NAME(TYPE *v, int j, int k, int N)                           \
+  {                                                                          \
+    unsigned int i = threadIdx.x + blockDim.x*blockIdx.x;                    \
+    if (i >= N) return;                                                      \
+    unsigned int ixj = i ^ j;                                                \
+    if (ixj > i) {                                                           \
+        bool ascending = (i & k) == 0;                                       \
+        TYPE a = v[i], b = v[ixj];                                           \
+        if ((a > b) == ascending) {                                          \
+            v[i] = b;                                                        \
+            v[ixj] = a;                                                      \
+        }                                                                    \
+    }                                                                        \
+  }
+
+BITONIC_STEP(bitonic_step_f32, float)
+BITONIC_STEP(bitonic_step_f64, double)
+BITONIC_STEP(bitonic_step_i32, int)
+BITONIC_STEP(bitonic_step_i64, long long)
@@ -0,0 +1,325 @@
+import math
+from time import perf_counter
+from typing import Any, Callable, Mapping, Optional
+import numpy as np
+from sdk.cuda_manager.abstract_cuda_manager import CudaManager
+from sdk.cuda_manager.expression import REDUCTIONS, Expression, lower
+from sdk.cuda_manager.instrumentation import EventKind
+
+class NumpyCudaManager(CudaManager):
+    """
+    CPU handler implementing the CudaManager interface with NumPy.
+
+    Allows models and algorithms written against CudaManager to run on
+    machines without GPUs (e.g. CI runners). CUDA code fragments can still
+    be registered, but they are not compiled: every kernel launched with
+    'run_program' needs a host implementation registered with
+    'add_host_kernel'. Element-wise and reduction operations are resolved
+    from NumPy. Lazy expressions are evaluated by a generated NumPy 
+    function applied over cache-sized chunks, so their temporaries stay 
+    small whatever the size of the inputs. Sums are accumulated in double
+    precision, pairwise within chunks and exactly across them.
+
+    When instrumented, kernel launches are timed with the wall clock.
+
+    Attributes:
+        EXPRESSION_CHUNK (int): Elements evaluated at once by 'evaluate'.
+    """
+
+    EXPRESSION_CHUNK: int = 1 << 14
+
+    __host_kernels: dict[str, Callable]
+    __fused: dict[str, Callable]
+
+    def __init__(self) -> None:
+        """Initializes a NumPy program handler."""
+        super().__init__()
+        self.__host_kernels = {}
+        self.__fused = {}
+
+    def add_host_kernel(self, name: str, function: Callable) -> None:
+        """
+        Registers the host implementation of a CUDA kernel.
+
+        The function receives the kernel arguments in the same order as the
+        CUDA kernel, with output buffers already allocated, and must fill
+        the output buffers in place over the whole launch domain. Launch
+        dimensions are not passed.
+
+        Args:
+            name (str): Name of the CUDA kernel.
+            function (Callable): Host implementation of the kernel.
+        """
+        self.__host_kernels[name] = function
+
+    def run_program(self,
+            func_name: str,
+            outputs_idx: list[int],
+            outputs_details: dict[
+                int, tuple[tuple[int, ...], Any]
+            ],
+            block: Optional[tuple[int, int, int]] = (256,1,1),
+            grid: tuple[int, int] = (1,1),
+            *args,
+            size: Optional[int | tuple[int, int]] = None,
+            constants: Optional[Mapping[str, float]] = None,
+            keep_on_device: bool = False
+    ) -> list:
+        """
+        Executes the host implementation of a registered kernel.
+
+        Args:
+            func_name (str): Name of the called function.
+            outputs_idx (list[int]): Indices of the arguments that are
+                output buffers.
+            outputs_details (dict[int, tuple[tuple[int, ...], Any]): Formal
+                description of each argument following the structure
+                'output_idx : (shape, dtype)'.
+            block (tuple[int, int, int], optional): Ignored.
+            grid (tuple[int, int], optional): Ignored.
+            *args: Parameters for the function.
+            size (int | tuple[int, int], optional): Ignored.
+            constants (Mapping[str, float], optional): Ignored, as the 
+                runtime arguments hold the same values.
+            keep_on_device (bool, optional): Ignored, as outputs already 
+                live in host memory.
+
+        Returns:
+            list: List with each one of the outputs from the function.
+
+        Raises:
+            AttributeError: If 'func_name' has no host implementation.
+        """
+        if func_name not in self.__host_kernels:
+            raise AttributeError(
+                f"Kernel '{func_name}' has no host implementation."
+            )
+        kernel = self.__host_kernels[func_name]
+        instrumented: bool = self.instrumented
+
+        host_args: list = []
+        output_results: list[np.ndarray] = []
+        for i, argument in enumerate(args):
+            if i in outputs_idx:
+                shape, dtype = outputs_details[i]
+                out = np.empty(shape, dtype)
+                host_args.append(out)
+                output_results.append(out)
+                if instrumented:
+                    self._emit(EventKind.ALLOC, func_name, 0., out.nbytes)
+            elif isinstance(argument, list):
+                host_args.append(np.array(argument))
+            else:
+                host_args.append(argument)
+
+        if not instrumented:
+            kernel(*host_args)
+            return output_results
+        start = perf_counter()
+        kernel(*host_args)
+        self._emit(EventKind.LAUNCH, func_name, perf_counter() - start)
+        return output_results
+
+    def to_device(self, array: Any) -> np.ndarray:
+        """
+        Host memory is the memory of this backend, so arrays are only made
+        contiguous.
+
+        Args:
+            array (Any): Host array.
+
+        Returns:
+            np.ndarray: Contiguous version of the array.
+        """
+        return np.ascontiguousarray(array)
+
+    def single_operation(self, func_name: str, *args) -> Any:
+        """
+        Performs a simple element-wise operation using NumPy.
+
+        Args:
+            func_name (str): Name of the NumPy function (e.g. "exp").
+            *args: Arguments of the operation.
+
+        Returns:
+            Any: Result of the operation.
+
+        Raises:
+            AttributeError: If 'func_name' does not exist in NumPy.
+        """
+        if not hasattr(np, func_name):
+            raise AttributeError(
+                f"Operation '{func_name}' not implemented by numpy."
+            )
+        func = getattr(np, func_name)
+        if not self.instrumented:
+            return func(*args)
+        start = perf_counter()
+        result = func(*args)
+        self._emit(EventKind.LAUNCH, func_name, perf_counter() - start)
+        return result
+
+    def reduction_operation(self, op_name: str, array: Any) -> Any:
+        """
+        Performs a reduction operation for an array using NumPy.
+
+        Args:
+            op_name (str): Name of the NumPy reduction (e.g. "sum", "max").
+            array (Any): Data array to be reduced.
+
+        Returns:
+            Any: Result of the reduction operation.
+
+        Raises:
+            AttributeError: If 'op_name' does not exist in NumPy.
+        """
+        return self.single_operation(op_name, np.asarray(array))
+
+    def evaluate(self, expression: Expression) -> Any:
+        """
+        Evaluates a lazy expression chunk by chunk with NumPy.
+
+        Args:
+            expression (Expression): Element-wise expression, optionally 
+                closed by a reduction.
+
+        Returns:
+            Any: Array with the element-wise result, or the reduced value as
+                a float.
+
+        Raises:
+            ValueError: If the expression is not valid.
+        """
+        lowered = lower(expression)
+        function = self.__fused.get(lowered.signature)
+        if function is None:
+            names = [f"a{i}" for i in range(len(lowered.arrays))] + [
+                f"s{i}" for i in range(len(lowered.scalars))
+            ]
+            function = eval(
+                f"lambda {', '.join(names)}: {lowered.numpy_code}", 
+                {"np": np}
+            )
+            self.__fused[lowered.signature] = function
+        start = perf_counter() if self.instrumented else 0.
+        # Double scalars promote float32 inputs to double, as in CUDA code
+        scalars = [np.float64(value) for value in lowered.scalars]
+
+        size, chunk = lowered.size, self.EXPRESSION_CHUNK
+        if lowered.reduction is None:
+            result = np.empty(size, dtype=np.float64)
+            for i in range(0, size, chunk):
+                result[i:i + chunk] = function(
+                    *[array[i:i + chunk] for array in lowered.arrays],
+                    *scalars
+                )
+        else:
+            ufunc = REDUCTIONS[lowered.reduction][2]
+            partials = [
+                ufunc.reduce(function(
+                    *[array[i:i + chunk] for array in lowered.arrays],
+                    *scalars
+                ), dtype=np.float64)
+                for i in range(0, size, chunk)
+            ]
+            if ufunc is np.add:
+                # Chunks are summed pairwise and combined exactly
+                result = math.fsum(partials)
+            else:
+                result = float(ufunc.reduce(np.asarray(partials)))
+
+        if self.instrumented:
+            self._emit(
+                EventKind.LAUNCH, f"fused[{lowered.signature}]", 
+                perf_counter() - start
+            )
+        return result
+
+    def histogram(
+            self,
+            data: Any,
+            n_bins: int,
+            low: float,
+            high: float,
+            weights: Optional[Any] = None
+        ) -> np.ndarray:
+        """
+        Fixed-bin histogram of an array, computed with 'numpy.bincount'.
+
+        Args:
+            data (Any): One-dimensional data array.
+            n_bins (int): Number of bins.
+            low (float): Lower edge of the first bin.
+            high (float): Upper edge of the last bin.
+            weights (Any, optional): Weight of each value. Defaults to 1.
+
+        Returns:
+            np.ndarray: (Weighted) count of each bin, in float64.
+
+        Raises:
+            ValueError: If the number of bins or the range are not valid.
+        """
+        self._check_histogram(n_bins, low, high)
+        start = perf_counter() if self.instrumented else 0.
+        data = np.asarray(data)
+        counts = np.zeros(n_bins, dtype=np.float64)
+        scale = n_bins/(high - low)
+        # Chunks large enough to amortize the bins added per chunk
+        size = max(self.EXPRESSION_CHUNK, 16*n_bins)
+        for i in range(0, len(data), size):
+            chunk = data[i:i + size]
+            inside = (chunk >= low) & (chunk <= high)
+            # 'high' belongs to the last bin
+            bins = np.minimum(
+                ((chunk[inside] - low)*scale).astype(np.int64), n_bins - 1
+            )
+            counts += np.bincount(
+                bins, 
+                None if weights is None 
+                else np.asarray(weights[i:i + size])[inside],
+                minlength=n_bins
+            )
+        if self.instrumented:
+            self._emit(EventKind.LAUNCH, "histogram", perf_counter() - start)
+        return counts
+
+    def scan(self, array: Any, exclusive: bool = False) -> np.ndarray:
+        """
+        Prefix sum of an array, computed with 'numpy.cumsum'.
+
+        Args:
+            array (Any): One-dimensional data array.
+            exclusive (bool, optional): Whether element 'i' of the result 
+                excludes 'array[i]'. Defaults to an inclusive scan.
+
+        Returns:
+            np.ndarray: Prefix sums, of the dtype of 'array'.
+        """
+        start = perf_counter() if self.instrumented else 0.
+        array = np.asarray(array)
+        result = np.empty_like(array)
+        if exclusive:
+            if len(array):
+                result[0] = 0
+                np.cumsum(array[:-1], out=result[1:])
+        else:
+            np.cumsum(array, out=result)
+        if self.instrumented:
+            self._emit(EventKind.LAUNCH, "scan", perf_counter() - start)
+        return result
+
+    def sort(self, array: Any) -> np.ndarray:
+        """
+        Sorts an array in ascending order with 'numpy.sort'.
+
+        Args:
+            array (Any): One-dimensional data array.
+
+        Returns:
+            np.ndarray: Sorted copy of the array.
+        """
+        start = perf_counter() if self.instrumented else 0.
+        result = np.sort(array)
+        if self.instrumented:
+            self._emit(EventKind.LAUNCH, "sort", perf_counter() - start)
+        return result
@@ -1,16 +1,66 @@
 from abc import ABC, abstractmethod
 from functools import singledispatchmethod
-from typing import Any
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Mapping, Optional
 import numpy as np
 import pycuda.cumath
+import pycuda.driver as cuda
 import pycuda.gpuarray
 import pycuda.gpuarray as gpuarray
 from pycuda.compiler import SourceModule
+from pycuda.elementwise import ElementwiseKernel
+from pycuda.reduction import ReductionKernel
+from pycuda.scan import ExclusiveScanKernel, InclusiveScanKernel
 from sdk.cuda_manager.abstract_cuda_manager import CudaManager
+from sdk.cuda_manager.expression import REDUCTIONS, Expression, lower
+from sdk.cuda_manager.instrumentation import EventKind
 
 
 class PyCudaManager(CudaManager, ABC):
-    """Cuda Handler for PyCuda."""
+    """
+    Cuda Handler for PyCuda.
+
+    Kernels are compiled on first use with the minimal source of their
+    fragment group (see 'kernel_source'), and the compiled modules are 
+    reused by later launches of any kernel of the same source. Lazy 
+    expressions are fused into a generated 'ElementwiseKernel' or 
+    'ReductionKernel', cached by expression signature. Histograms and sorts
+    run the kernels of '_support_files/primitives.cu' (histograms fall back
+    to compare-and-swap double atomics below compute capability 6.0), and 
+    prefix scans use PyCuda's scan kernels.
+
+    When instrumented, kernel launches are timed with CUDA events and
+    transfers with the wall clock.
+
+    Attributes:
+        TUNING_REPEAT (int): Timed launches per candidate when autotuning.
+        PRIMITIVES_PATH (Path): CUDA source of the primitive kernels.
+        PRIMITIVE_SUFFIXES (dict[np.dtype, str]): Suffix of the primitive 
+            kernels of each supported dtype.
+    """
+
+    TUNING_REPEAT: int = 3
+    PRIMITIVES_PATH: Path = (
+        Path(__file__).parent / "_support_files" / "primitives.cu"
+    )
+    PRIMITIVE_SUFFIXES: dict[np.dtype, str] = {
+        np.dtype(np.float32): "f32", np.dtype(np.float64): "f64",
+        np.dtype(np.int32): "i32", np.dtype(np.int64): "i64"
+    }
+
+    __modules: dict[str, SourceModule]
+    __fused: dict[str, ElementwiseKernel | ReductionKernel]
+    __scans: dict[tuple[np.dtype, bool], Any]
+    __primitives: Optional[SourceModule]
+
+    def __init__(self) -> None:
+        """Initializes a PyCuda program handler."""
+        super().__init__()
+        self.__modules = {}
+        self.__fused = {}
+        self.__scans = {}
+        self.__primitives = None
 
     @abstractmethod
     def _initialize_context(self) -> None:
@@ -28,9 +78,12 @@ class PyCudaManager(CudaManager, ABC):
             outputs_details: dict[
                 int, tuple[tuple[int, ...], Any]
             ],
-            block: tuple[int, int, int] = (256,1,1),
+            block: Optional[tuple[int, int, int]] = (256,1,1),
             grid: tuple[int, int] = (1,1),
-            *args
+            *args,
+            size: Optional[int | tuple[int, int]] = None,
+            constants: Optional[Mapping[str, float]] = None,
+            keep_on_device: bool = False
     ) -> list:
         """
         Executes a registered CUDA kernel with the given arguments and 
@@ -48,10 +101,17 @@ class PyCudaManager(CudaManager, ABC):
                 description of each argument following the structure
                 'output_idx : (shape, dtype)'.
             block (tuple[int, int, int], optional): CUDA block dimensions. 
-                Defaults to (256,1,1).
-            grid (tuple[int, int], optional): CUDA grid dimensions. 
-                Defaults to (1,1).
+                None autotunes them if enabled and 'size' is given, or uses 
+                'DEFAULT_BLOCK'. Defaults to (256,1,1).
+            grid (tuple[int, int], optional): CUDA grid dimensions, ignored
+                if 'size' is given. Defaults to (1,1).
             *args: Parameters for the CUDA function.
+            size (int | tuple[int, int], optional): Number of threads needed
+                along x, optionally with the number of blocks along y.
+            constants (Mapping[str, float], optional): Macros defined when
+                compiling the kernel. Each set of values is compiled once.
+            keep_on_device (bool, optional): Whether the outputs are 
+                returned as 'GPUArray's instead of host copies.
 
         Returns:
             list: List with each one of the outputs from the CUDA function
@@ -72,41 +132,90 @@ class PyCudaManager(CudaManager, ABC):
         processed_args: list[np.generic | np.ndarray] = []
         gpu_args: list[np.generic | np.ndarray] = []
         output_results: list = []
-        # CUDA source code collecting all device and global functions 
-        includes: set[str] = {
-            include for program in self.src_code.values() 
-            for include in program.includes
-        }
-        funcs: list[str] = [
-            program.functions for program in self.src_code.values()
-        ]
-        source = "\n".join(list(includes) + funcs)
-        
-        module = SourceModule(source)
-        
-        kernel = module.get_function(func_name)
+        instrumented: bool = self.instrumented
+        kernel = self._module(
+            func_name, instrumented, constants
+        ).get_function(func_name)
         for i, argument in enumerate(args):
+            start = perf_counter() if instrumented else 0.
             # Prepare Kernel Outputs
             if i in outputs_idx: 
                 shape, dtype = outputs_details[i]
                 out = gpuarray.empty(shape, dtype)
                 processed_args.append(out)
                 output_results.append(out)
+                if instrumented:
+                    self._emit(
+                        EventKind.ALLOC, func_name, 
+                        perf_counter() - start, out.nbytes
+                    )
             # Prepare Input Parameters
+            elif isinstance(argument, gpuarray.GPUArray):
+                processed_args.append(argument)
             else:
                 self._process_argument(argument, processed_args)
+                if instrumented and isinstance(
+                        processed_args[-1], gpuarray.GPUArray
+                    ):
+                    self._emit(
+                        EventKind.HTOD, func_name,
+                        perf_counter() - start, processed_args[-1].nbytes
+                    )
 
         gpu_args = [
             arg.gpudata if isinstance(arg, gpuarray.GPUArray) 
             else arg for arg in processed_args
         ]
 
+        # Launch configuration
+        if block is None:
+            if self.tuning_cache is not None and size is not None:
+                block = self._tuned_block(func_name, kernel, gpu_args, size)
+            else:
+                block = self.DEFAULT_BLOCK
+        if size is not None:
+            grid = self.grid_for(size, block)
+
         # PyCUDA execution
-        kernel(*gpu_args, block=block, grid=grid)
-        
+        if instrumented:
+            start_event, end_event = cuda.Event(), cuda.Event()
+            start_event.record()
+            kernel(*gpu_args, block=block, grid=grid)
+            end_event.record()
+            end_event.synchronize()
+            self._emit(
+                EventKind.LAUNCH, func_name,
+                start_event.time_till(end_event)*1e-3
+            )
+        else:
+            kernel(*gpu_args, block=block, grid=grid)
  
-        return [output.get() for output in output_results]
+        if keep_on_device:
+            return output_results
+        return [
+            self._download(output, func_name, instrumented)
+            for output in output_results
+        ]
         
+    def to_device(self, array: Any) -> gpuarray.GPUArray:
+        """
+        Copies a host array to the GPU.
+
+        Args:
+            array (Any): Host array.
+
+        Returns:
+            gpuarray.GPUArray: Device copy of the array.
+        """
+        if not self.instrumented:
+            return gpuarray.to_gpu(np.ascontiguousarray(array))
+        start = perf_counter()
+        device = gpuarray.to_gpu(np.ascontiguousarray(array))
+        self._emit(
+            EventKind.HTOD, "to_device", perf_counter() - start, device.nbytes
+        )
+        return device
+
     def single_operation(self, func_name: str, *args) -> Any:
         """
         Performs a simple operation using CUDA.
@@ -132,7 +241,13 @@ class PyCudaManager(CudaManager, ABC):
             gpu_args: list = []
             for arg in args:
                 self._process_argument(arg, gpu_args)
-            return func(*gpu_args).get()
+            if not self.instrumented:
+                return func(*gpu_args).get()
+            start = perf_counter()
+            result = func(*gpu_args)
+            cuda.Context.synchronize()
+            self._emit(EventKind.LAUNCH, func_name, perf_counter() - start)
+            return self._download(result, func_name, True)
         else:
             raise AttributeError(
                 f"Operation '{func_name}' not implemented by pycuda.cumath."
@@ -162,16 +277,355 @@ class PyCudaManager(CudaManager, ABC):
 
         if hasattr(pycuda.gpuarray, op_name):
             reduct = getattr(pycuda.gpuarray, op_name)
+            start = perf_counter() if self.instrumented else 0.
             try:
                 result = reduct(array)
             except TypeError:
                 result = reduct()(array)
-            return result.get()
+            if not self.instrumented:
+                return result.get()
+            cuda.Context.synchronize()
+            self._emit(EventKind.LAUNCH, op_name, perf_counter() - start)
+            return self._download(result, op_name, True)
         else:
             raise AttributeError(
                 f"Operation '{op_name}' not implemented by pycuda.gpuarray."
             )
 
+    def evaluate(self, expression: Expression) -> Any:
+        """
+        Evaluates a lazy expression as a single fused CUDA kernel.
+
+        Host inputs are copied to the device; 'GPUArray' inputs are used in
+        place. Reductions are computed in double precision.
+
+        Args:
+            expression (Expression): Element-wise expression, optionally 
+                closed by a reduction.
+
+        Returns:
+            Any: A host copy of the element-wise result, or the reduced 
+                value as a float.
+
+        Raises:
+            ValueError: If the expression is not valid.
+        """
+        lowered = lower(expression)
+        instrumented: bool = self.instrumented
+        name = f"fused[{lowered.signature}]"
+
+        kernel = self.__fused.get(lowered.signature)
+        if kernel is None:
+            start = perf_counter() if instrumented else 0.
+            if lowered.reduction is None:
+                kernel = ElementwiseKernel(
+                    f"double *out, {lowered.cuda_arguments()}",
+                    f"out[i] = {lowered.cuda_code}",
+                    "fused_elementwise"
+                )
+            else:
+                neutral, reduce_expr, _ = REDUCTIONS[lowered.reduction]
+                kernel = ReductionKernel(
+                    np.float64, neutral=neutral, reduce_expr=reduce_expr,
+                    map_expr=lowered.cuda_code, 
+                    arguments=lowered.cuda_arguments(),
+                    name="fused_reduction", preamble="#include <math.h>"
+                )
+            if instrumented:
+                self._emit(EventKind.COMPILE, name, perf_counter() - start)
+            self.__fused[lowered.signature] = kernel
+
+        arrays: list[gpuarray.GPUArray] = []
+        for array in lowered.arrays:
+            if isinstance(array, gpuarray.GPUArray):
+                arrays.append(array)
+                continue
+            start = perf_counter() if instrumented else 0.
+            arrays.append(gpuarray.to_gpu(np.ascontiguousarray(array)))
+            if instrumented:
+                self._emit(
+                    EventKind.HTOD, name, perf_counter() - start, 
+                    arrays[-1].nbytes
+                )
+        scalars = [np.float64(value) for value in lowered.scalars]
+
+        start = perf_counter() if instrumented else 0.
+        if lowered.reduction is None:
+            result = gpuarray.empty(lowered.size, np.float64)
+            kernel(result, *arrays, *scalars)
+        else:
+            result = kernel(*arrays, *scalars)
+        if instrumented:
+            cuda.Context.synchronize()
+            self._emit(EventKind.LAUNCH, name, perf_counter() - start)
+        host = self._download(result, name, instrumented)
+        return host if lowered.reduction is None else float(host)
+
+    def histogram(
+            self,
+            data: Any,
+            n_bins: int,
+            low: float,
+            high: float,
+            weights: Optional[Any] = None
+        ) -> np.ndarray:
+        """
+        Fixed-bin histogram of an array, accumulated with atomics in shared
+        memory.
+
+        Args:
+            data (Any): One-dimensional float32 or float64 data array.
+            n_bins (int): Number of bins.
+            low (float): Lower edge of the first bin.
+            high (float): Upper edge of the last bin.
+            weights (Any, optional): Weight of each value. Defaults to 1.
+
+        Returns:
+            np.ndarray: A host copy of the (weighted) count of each bin.
+
+        Raises:
+            ValueError: If the number of bins or the range are not valid.
+            TypeError: If the dtype of 'data' is not supported.
+        """
+        self._check_histogram(n_bins, low, high)
+        data = self.__to_device(data)
+        if data.dtype not in (np.float32, np.float64):
+            raise TypeError(f"Histograms of {data.dtype} not supported")
+        kernel = self.__primitive("histogram", data.dtype)
+        counts = gpuarray.zeros(n_bins, np.float64)
+        weighted = weights is not None
+        if weighted:
+            weights = self.__to_device(weights).astype(np.float64)
+
+        block = self.DEFAULT_BLOCK
+        # Grid-stride loop, with enough blocks to fill the device
+        grid = (min(self.grid_for(data.size, block)[0], 1024), 1)
+        start = perf_counter() if self.instrumented else 0.
+        kernel(
+            data.gpudata, weights.gpudata if weighted else np.intp(0),
+            counts.gpudata, np.float64(low), np.float64(high), 
+            np.int32(n_bins), np.int32(data.size), np.int32(weighted),
+            block=block, grid=grid
+        )
+        if self.instrumented:
+            cuda.Context.synchronize()
+            self._emit(EventKind.LAUNCH, "histogram", perf_counter() - start)
+        return self._download(counts, "histogram", self.instrumented)
+
+    def scan(self, array: Any, exclusive: bool = False) -> np.ndarray:
+        """
+        Prefix sum of an array using 'pycuda.scan'.
+
+        Args:
+            array (Any): One-dimensional data array.
+            exclusive (bool, optional): Whether element 'i' of the result 
+                excludes 'array[i]'. Defaults to an inclusive scan.
+
+        Returns:
+            np.ndarray: A host copy of the prefix sums.
+        """
+        array = self.__to_device(array).copy()
+        key = (array.dtype, exclusive)
+        kernel = self.__scans.get(key)
+        if kernel is None:
+            kernel = (
+                ExclusiveScanKernel(array.dtype, "a+b", "0") if exclusive
+                else InclusiveScanKernel(array.dtype, "a+b")
+            )
+            self.__scans[key] = kernel
+        start = perf_counter() if self.instrumented else 0.
+        if array.size:
+            kernel(array)
+        if self.instrumented:
+            cuda.Context.synchronize()
+            self._emit(EventKind.LAUNCH, "scan", perf_counter() - start)
+        return self._download(array, "scan", self.instrumented)
+
+    def sort(self, array: Any) -> np.ndarray:
+        """
+        Sorts an array in ascending order with a bitonic sort.
+
+        The array is padded to a power of two with the largest value of its
+        dtype, and sorted in O(log^2 N) launches.
+
+        Args:
+            array (Any): One-dimensional float32, float64, int32 or int64 
+                data array.
+
+        Returns:
+            np.ndarray: A host copy of the sorted values.
+
+        Raises:
+            TypeError: If the dtype of 'array' is not supported.
+        """
+        array = self.__to_device(array)
+        if not array.size:
+            # Empty arrays have no device memory to copy or sort
+            return np.empty(0, array.dtype)
+        kernel = self.__primitive("bitonic_step", array.dtype)
+        size = array.size
+        padded_size = 1 << max(size - 1, 0).bit_length()
+        fill = (
+            np.inf if array.dtype.kind == "f" else np.iinfo(array.dtype).max
+        )
+        values = gpuarray.empty(padded_size, array.dtype)
+        values.fill(fill)
+        cuda.memcpy_dtod(values.gpudata, array.gpudata, array.nbytes)
+
+        block = self.DEFAULT_BLOCK
+        grid = self.grid_for(padded_size, block)
+        start = perf_counter() if self.instrumented else 0.
+        k = 2
+        while k <= padded_size:
+            j = k // 2
+            while j > 0:
+                kernel(
+                    values.gpudata, np.int32(j), np.int32(k), 
+                    np.int32(padded_size), block=block, grid=grid
+                )
+                j //= 2
+            k *= 2
+        if self.instrumented:
+            cuda.Context.synchronize()
+            self._emit(EventKind.LAUNCH, "sort", perf_counter() - start)
+        return self._download(values[:size], "sort", self.instrumented)
+
+    def __primitive(self, name: str, dtype: np.dtype) -> Any:
+        """
+        Kernel of a primitive for a dtype, compiling the primitives on first
+        use.
+
+        Raises:
+            TypeError: If the dtype is not supported.
+        """
+        if np.dtype(dtype) not in self.PRIMITIVE_SUFFIXES:
+            raise TypeError(f"Primitive '{name}' of {dtype} not supported")
+        if self.__primitives is None:
+            start = perf_counter() if self.instrumented else 0.
+            with open(self.PRIMITIVES_PATH, encoding="UTF-8") as file:
+                self.__primitives = SourceModule(file.read())
+            if self.instrumented:
+                self._emit(
+                    EventKind.COMPILE, "primitives", perf_counter() - start
+                )
+        return self.__primitives.get_function(
+            f"{name}_{self.PRIMITIVE_SUFFIXES[np.dtype(dtype)]}"
+        )
+
+    def __to_device(self, array: Any) -> gpuarray.GPUArray:
+        """Device version of an array, copied from the host if needed."""
+        if isinstance(array, gpuarray.GPUArray):
+            return array
+        return gpuarray.to_gpu(np.ascontiguousarray(array))
+
+    def _module(
+            self, 
+            func_name: str, 
+            instrumented: bool,
+            constants: Optional[Mapping[str, float]] = None
+        ) -> SourceModule:
+        """
+        Compiled module defining a kernel, compiling it if needed.
+
+        Args:
+            func_name (str): Name of the kernel.
+            instrumented (bool): Whether to report the compilation.
+            constants (Mapping[str, float], optional): Macros defined for
+                the kernel.
+
+        Returns:
+            SourceModule: Module of the fragment group of the kernel.
+        """
+        _, source = self.kernel_source(func_name, constants)
+        module = self.__modules.get(source)
+        if module is None:
+            start = perf_counter() if instrumented else 0.
+            module = SourceModule(source)
+            if instrumented:
+                self._emit(
+                    EventKind.COMPILE, func_name, perf_counter() - start
+                )
+            self.__modules[source] = module
+        return module
+
+    def _tuned_block(
+            self,
+            func_name: str,
+            kernel: Any,
+            gpu_args: list,
+            size: int | tuple[int, int]
+        ) -> tuple[int, int, int]:
+        """
+        Block dimensions of a kernel, autotuned on first use.
+
+        Every candidate block supported by the kernel is timed with CUDA 
+        events over the actual launch arguments, and the fastest one is 
+        stored in 'tuning_cache'. Kernels must therefore be safe to run 
+        several times over the same arguments.
+
+        Args:
+            func_name (str): Name of the kernel.
+            kernel (Any): Compiled kernel.
+            gpu_args (list): Launch arguments.
+            size (int | tuple[int, int]): Problem size of the launch.
+
+        Returns:
+            tuple[int, int, int]: Best block dimensions.
+        """
+        size_x = size[0] if isinstance(size, tuple) else size
+        key = self.tuning_cache.key(
+            cuda.Context.get_device().name(), func_name, size_x
+        )
+        block = self.tuning_cache.get(key)
+        if block is not None:
+            return block
+
+        max_threads = kernel.get_attribute(
+            cuda.function_attribute.MAX_THREADS_PER_BLOCK
+        )
+        timings: dict[tuple[int, int, int], float] = {}
+        start_event, end_event = cuda.Event(), cuda.Event()
+        for threads in self.BLOCK_CANDIDATES:
+            if threads > max_threads:
+                continue
+            candidate = (threads, 1, 1)
+            grid = self.grid_for(size, candidate)
+            # Warm-up launch
+            kernel(*gpu_args, block=candidate, grid=grid)
+            start_event.record()
+            for _ in range(self.TUNING_REPEAT):
+                kernel(*gpu_args, block=candidate, grid=grid)
+            end_event.record()
+            end_event.synchronize()
+            timings[candidate] = start_event.time_till(end_event)
+        block = min(timings, key=timings.get)
+        self.tuning_cache.store(key, block)
+        return block
+
+    def _download(
+            self, 
+            array: gpuarray.GPUArray, 
+            name: str, 
+            instrumented: bool
+        ) -> np.ndarray:
+        """
+        Copies a device array to the host, reporting the transfer if needed.
+
+        Args:
+            array (gpuarray.GPUArray): Device array.
+            name (str): Kernel or operation the transfer belongs to.
+            instrumented (bool): Whether to report the transfer.
+
+        Returns:
+            np.ndarray: Host copy of the array.
+        """
+        if not instrumented:
+            return array.get()
+        start = perf_counter()
+        host = array.get()
+        self._emit(EventKind.DTOH, name, perf_counter() - start, host.nbytes)
+        return host
+
     @singledispatchmethod
     def _process_argument(self, arg, gpu_args: list) -> None:
         """
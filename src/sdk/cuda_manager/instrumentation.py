@@ -0,0 +1,143 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+
+class EventKind(Enum):
+    """Operations reported by an instrumented CudaManager."""
+    COMPILE: str = "compile"
+    HTOD: str = "htod"
+    DTOH: str = "dtoh"
+    LAUNCH: str = "launch"
+    ALLOC: str = "alloc"
+
+
+@dataclass(frozen=True)
+class KernelEvent():
+    """
+    Single operation reported by a CudaManager.
+
+    Attributes:
+        kind (EventKind): Type of operation.
+        name (str): Kernel or operation the event belongs to.
+        seconds (float): Duration of the operation. Kernel launches are
+            timed with CUDA events on GPU backends and with the wall clock
+            on CPU backends.
+        nbytes (int): Bytes transferred or allocated, if any.
+    """
+
+    kind: EventKind
+    name: str
+    seconds: float = 0.
+    nbytes: int = 0
+
+
+class InstrumentationListener(ABC):
+    """
+    Receiver of the events reported by a CudaManager.
+
+    Listeners are registered with 'CudaManager.add_listener'. They are
+    called synchronously from the thread running the operation, so they
+    should be cheap.
+    """
+
+    @abstractmethod
+    def on_event(self, event: KernelEvent) -> None:
+        """
+        Handles an event reported by a CudaManager.
+
+        Args:
+            event (KernelEvent): Reported operation.
+        """
+        pass
+
+
+@dataclass
+class KernelStats():
+    """
+    Accumulated statistics of one operation kind of a kernel.
+
+    Attributes:
+        calls (int): Number of events.
+        seconds (float): Total duration of the events.
+        nbytes (int): Total bytes of the events.
+    """
+
+    calls: int = 0
+    seconds: float = 0.
+    nbytes: int = 0
+
+
+class StatsCollector(InstrumentationListener):
+    """
+    Listener which aggregates events per kernel and operation kind.
+
+    Attributes:
+        stats (dict[tuple[str, EventKind], KernelStats]): Statistics keyed
+            on kernel name and operation kind.
+    """
+
+    __lock: Lock
+    __stats: dict[tuple[str, EventKind], KernelStats]
+
+    def __init__(self) -> None:
+        """Initializes an empty collector."""
+        self.__lock = Lock()
+        self.__stats = {}
+
+    def on_event(self, event: KernelEvent) -> None:
+        """
+        Accumulates an event into the statistics of its kernel.
+
+        Args:
+            event (KernelEvent): Reported operation.
+        """
+        with self.__lock:
+            stats = self.__stats.setdefault(
+                (event.name, event.kind), KernelStats()
+            )
+            stats.calls += 1
+            stats.seconds += event.seconds
+            stats.nbytes += event.nbytes
+
+    def reset(self) -> None:
+        """Discards the accumulated statistics."""
+        with self.__lock:
+            self.__stats.clear()
+
+    def summary(self) -> str:
+        """
+        Builds a table with the accumulated statistics.
+
+        Rows are sorted by total time, slowest first.
+
+        Returns:
+            str: Human readable table.
+        """
+        header = (
+            f"{'name':<24}{'kind':<9}{'calls':>9}"
+            f"{'total [ms]':>13}{'mean [us]':>12}{'MiB':>10}"
+        )
+        lines = [header, "-"*len(header)]
+        with self.__lock:
+            rows = sorted(
+                self.__stats.items(), key=lambda row: row[1].seconds,
+                reverse=True
+            )
+            for (name, kind), stats in rows:
+                lines.append(
+                    f"{name:<24.24}{kind.value:<9}{stats.calls:>9}"
+                    f"{stats.seconds*1e3:>13.3f}"
+                    f"{stats.seconds*1e6/stats.calls:>12.1f}"
+                    f"{stats.nbytes/2**20:>10.2f}"
+                )
+        return "\n".join(lines)
+
+    @property
+    def stats(self) -> dict[tuple[str, EventKind], KernelStats]:
+        """Getter for stats property (copy)."""
+        with self.__lock:
+            return {
+                key: KernelStats(value.calls, value.seconds, value.nbytes)
+                for key, value in self.__stats.items()
+            }
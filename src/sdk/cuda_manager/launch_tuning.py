@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+class LaunchTuningCache():
+    """
+    Persistent store of the best block dimensions found by autotuning.
+
+    Entries are keyed on device, kernel and problem size bucket (the number
+    of bits of the size, so sizes within a factor of two share an entry)
+    and kept in a JSON file, so kernels are only tuned once per machine.
+
+    Attributes:
+        path (Path, optional): JSON file backing the cache. None keeps the
+            cache in memory.
+    """
+
+    __entries: dict[str, list[int]]
+    __lock: Lock
+
+    def __init__(self, path: Optional[str | Path] = None) -> None:
+        """
+        Initializes the cache, loading the entries stored at 'path'.
+
+        Args:
+            path (str | Path, optional): JSON file backing the cache.
+        """
+        self.path = Path(path).expanduser() if path is not None else None
+        self.__lock = Lock()
+        self.__entries = {}
+        if self.path is not None and self.path.exists():
+            with open(self.path, encoding="UTF-8") as file:
+                self.__entries = json.load(file)
+
+    @staticmethod
+    def key(device: str, kernel: str, size: int) -> str:
+        """
+        Key of a tuning entry.
+
+        Args:
+            device (str): Name of the device.
+            kernel (str): Name of the kernel.
+            size (int): Problem size of the launch.
+
+        Returns:
+            str: Entry key.
+        """
+        return f"{device}|{kernel}|{int(size).bit_length()}"
+
+    def get(self, key: str) -> Optional[tuple[int, int, int]]:
+        """
+        Looks up the block dimensions of an entry.
+
+        Args:
+            key (str): Entry key.
+
+        Returns:
+            tuple[int, int, int], optional: Stored block, or None.
+        """
+        with self.__lock:
+            block = self.__entries.get(key)
+        return tuple(block) if block is not None else None
+
+    def store(self, key: str, block: tuple[int, int, int]) -> None:
+        """
+        Stores the block dimensions of an entry and persists the cache.
+
+        Args:
+            key (str): Entry key.
+            block (tuple[int, int, int]): Best block dimensions.
+        """
+        with self.__lock:
+            self.__entries[key] = list(block)
+            if self.path is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Written aside and renamed, so readers never see partial files
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="UTF-8") as file:
+                json.dump(self.__entries, file, indent=2)
+            tmp_path.replace(self.path)
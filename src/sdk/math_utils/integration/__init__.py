@@ -0,0 +1,5 @@
+from .gauss_legendre import GaussLegendreQuadrature
+
+__all__ = [
+    "GaussLegendreQuadrature"
+]
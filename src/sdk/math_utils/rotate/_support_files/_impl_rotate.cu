@@ -2,16 +2,50 @@
 // Licensed under the GNU Affero General Public License v3.0
 // Modifications Copyright (C) 2025 Gabriel Alejandro Fernandez Fernandez
 
-__global__ void transform_f32(float *in, float *out, float *T, int N)
+// Largest dimension whose transformation matrix is cached in shared memory
+#define ROTATE_MAX_N 32
+
+// Applies T to each one of the M rows of length N of 'in'. Each thread
+// computes one output element, so consecutive threads write (and mostly
+// read) consecutive addresses. T is staged in shared memory by the whole
+// block when it fits, and read from global memory otherwise.
+__global__ void transform_f32(const float *in, float *out, const float *T, int N, int M)
   {
-    int el = threadIdx.x + blockDim.x * blockIdx.x;
-    int i0 = el*N;
-    int i, j;
-    for (i = 0; i <N; i+=1){
-        out[i0 + i] = 0;
-        for (j = 0; j<N; j+=1) {
-           out[i0 + i]  +=  T[j + i*N]  *in[i0 +j];
+    __shared__ float Ts[ROTATE_MAX_N*ROTATE_MAX_N];
+    const bool cached = N <= ROTATE_MAX_N;
+    if (cached) {
+        for (int k = threadIdx.x; k < N*N; k += blockDim.x) {
+            Ts[k] = T[k];
         }
     }
-    
-  }
\ No newline at end of file
+    __syncthreads();
+
+    long long el = threadIdx.x + (long long)blockDim.x * blockIdx.x;
+    if (el >= (long long)M*N) return;
+    long long i0 = el - el % N;
+    const float *t_row = (cached ? Ts : T) + (el % N)*N;
+    float acc = 0.f;
+    for (int j = 0; j < N; j += 1) {
+        acc += t_row[j]*in[i0 + j];
+    }
+    out[el] = acc;
+  }
+
+// Applies T[m] (N x N, row-major) to row m of 'in' for each one of the M rows.
+// As in 'transform_f32', each thread computes one output element.
+#define TRANSFORM_BATCH(NAME, TYPE)                                        \
+__global__ void NAME(const TYPE *in, TYPE *out, const TYPE *T, int N, int M) \
+  {                                                                        \
+    long long el = threadIdx.x + (long long)blockDim.x * blockIdx.x;      \
+    if (el >= (long long)M*N) return;                                      \
+    long long i0 = el - el % N;                                            \
+    const TYPE *t_row = T + el*N;                                          \
+    TYPE acc = 0;                                                          \
+    for (int j = 0; j < N; j += 1) {                                       \
+        acc += t_row[j]*in[i0 + j];                                        \
+    }                                                                      \
+    out[el] = acc;                                                         \
+  }
+
+TRANSFORM_BATCH(transform_batch_f32, float)
+TRANSFORM_BATCH(transform_batch_f64, double)
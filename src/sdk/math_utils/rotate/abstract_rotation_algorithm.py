@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
 import numpy as np
 
 class AbstractRotationAlgorithm(ABC):
@@ -7,26 +10,235 @@ class AbstractRotationAlgorithm(ABC):
 
     This class defines the required method for implementing transformations 
     of float32 vectors or matrices using a transformation matrix 'T'.
+
+    Matrices larger than memory are rotated tile by tile with 'stream_f32',
+    on top of the 'transform_f32' of each implementation.
+
+    Attributes:
+        STREAM_TILE_ROWS (int): Default number of rows of the tiles of 
+            'stream_f32'.
     """
+
+    STREAM_TILE_ROWS: int = 1 << 20
     @abstractmethod
     def transform_f32(
         self,
         in_matrix: np.ndarray, 
         t_matrix: np.ndarray,
         n: int
-    ) -> np.array[np.double]:
+    ) -> np.ndarray:
         """
         Applies a float32 transformation using the selected strategy.
 
         Args:
             in_matrix (np.ndarray): Input matrix of shape (M, N) containing 
-                float32 values.
+                float32 values. Flattened matrices of shape (M*N,) are also 
+                accepted.
             t_matrix (np.ndarray): Transformation matrix of shape (N, N) 
                 containing float32 values.
             n (int): Dimension size used in the transformation computation.
 
         Returns:
-            np.ndarray: Output matrix of shape (M, N) resulting from applying 
-                the transformation.
+            np.ndarray: Float32 output matrix of shape (M, N) resulting from 
+                applying the transformation to each row.
         """
         pass
+
+    @abstractmethod
+    def transform_batch(
+        self,
+        in_matrix: np.ndarray,
+        t_matrices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Applies a different transformation to each row of a matrix.
+
+        Row 'm' of the output is 't_matrices[m] @ in_matrix[m]'. Float32 
+        operands are transformed in float32; any other operands in float64.
+
+        Args:
+            in_matrix (np.ndarray): Input matrix of shape (M, N).
+            t_matrices (np.ndarray): Transformation matrices of shape 
+                (M, N, N).
+
+        Returns:
+            np.ndarray: Output matrix of shape (M, N), in float32 if both
+                operands are float32 and in float64 otherwise.
+        """
+        pass
+
+    def stream_f32(
+        self,
+        in_matrix: np.ndarray | str | Path,
+        out_matrix: np.ndarray | str | Path,
+        t_matrix: np.ndarray,
+        n: int,
+        tile_rows: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Applies the float32 transformation tile by tile, out of core.
+
+        Tiles are double buffered: while a tile is transformed, the next one
+        is read from 'in_matrix' and the previous one is written to 
+        'out_matrix' by background threads, so reading, transforming and 
+        writing overlap. Only a few tiles are held in memory at once, so 
+        memory-mapped matrices larger than the host or device memory can be
+        rotated.
+
+        Args:
+            in_matrix (np.ndarray | str | Path): Input matrix of shape (M, N)
+                or (M*N,) (e.g. a memory map), or path of a '.npy' file 
+                holding it.
+            out_matrix (np.ndarray | str | Path): Buffer of M*N elements 
+                where the float32 output is written (e.g. a memory map), or 
+                path of the '.npy' file to create for it.
+            t_matrix (np.ndarray): Transformation matrix of shape (N, N) 
+                containing float32 values.
+            n (int): Dimension size used in the transformation computation.
+            tile_rows (int, optional): Rows per tile. Defaults to 
+                'STREAM_TILE_ROWS'.
+
+        Returns:
+            np.ndarray: Output matrix of shape (M, N), as a view of 
+                'out_matrix' (a read-only memory map if a path was given).
+
+        Raises:
+            ValueError: If the shapes of the operands do not match 'n', the
+                output buffer is not C-contiguous or 'tile_rows' is not 
+                positive.
+        """
+        n = int(n)
+        if tile_rows is None:
+            tile_rows = self.STREAM_TILE_ROWS
+        if tile_rows < 1:
+            raise ValueError("'tile_rows' must be positive")
+        if isinstance(in_matrix, (str, Path)):
+            in_matrix = np.load(in_matrix, mmap_mode="r")
+        if n < 1 or np.size(in_matrix) % n != 0:
+            raise ValueError(
+                f"Input of size {np.size(in_matrix)} is not formed by rows "
+                f"of length {n}"
+            )
+        rows = np.reshape(in_matrix, (-1, n))
+        out_path = None
+        if isinstance(out_matrix, (str, Path)):
+            out_path = out_matrix
+            out_matrix = np.lib.format.open_memmap(
+                out_path, mode="w+", dtype=np.float32, shape=rows.shape
+            )
+        if np.size(out_matrix) != rows.size:
+            raise ValueError(
+                f"Output of shape {np.shape(out_matrix)} does not match "
+                f"{rows.shape}"
+            )
+        if not out_matrix.flags.c_contiguous:
+            raise ValueError("Output buffer must be C-contiguous")
+        out_rows = out_matrix.reshape(-1, n)
+
+        def read(start: int) -> np.ndarray:
+            # Copying forces the tile to be read from disk in the reader
+            return np.array(rows[start:start + tile_rows], dtype=np.float32)
+
+        starts = range(0, len(rows), tile_rows)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            next_tile: Optional[Future] = (
+                executor.submit(read, starts[0]) if starts else None
+            )
+            pending_write: Optional[Future] = None
+            for i, start in enumerate(starts):
+                tile = next_tile.result()
+                if i + 1 < len(starts):
+                    next_tile = executor.submit(read, starts[i + 1])
+                out_tile = self.transform_f32(tile, t_matrix, n)
+                if pending_write is not None:
+                    pending_write.result()
+                pending_write = executor.submit(
+                    out_rows.__setitem__, 
+                    slice(start, start + len(out_tile)), 
+                    out_tile
+                )
+            if pending_write is not None:
+                pending_write.result()
+
+        if out_path is not None:
+            out_matrix.flush()
+            del out_matrix, out_rows
+            return np.load(out_path, mmap_mode="r").reshape(-1, n)
+        return out_rows
+
+    @staticmethod
+    def _prepare_f32(
+        in_matrix: np.ndarray,
+        t_matrix: np.ndarray,
+        n: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Validates the operands of 'transform_f32' and converts them to 
+        C-contiguous float32 arrays, copying them only if needed.
+
+        Args:
+            in_matrix (np.ndarray): Input matrix of shape (M, N) or (M*N,).
+            t_matrix (np.ndarray): Transformation matrix of shape (N, N).
+            n (int): Dimension size.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Input matrix of shape (M, N) and 
+                transformation matrix of shape (N, N).
+
+        Raises:
+            ValueError: If the shapes of the operands do not match 'n'.
+        """
+        n = int(n)
+        in_matrix = np.ascontiguousarray(in_matrix, dtype=np.float32)
+        t_matrix = np.ascontiguousarray(t_matrix, dtype=np.float32)
+        if n < 1 or in_matrix.size % n != 0:
+            raise ValueError(
+                f"Input of size {in_matrix.size} is not formed by rows of "
+                f"length {n}"
+            )
+        if t_matrix.shape != (n, n):
+            raise ValueError(
+                f"Transformation matrix of shape {t_matrix.shape} does not "
+                f"match ({n}, {n})"
+            )
+        return in_matrix.reshape(-1, n), t_matrix
+
+    @staticmethod
+    def _prepare_batch(
+        in_matrix: np.ndarray,
+        t_matrices: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Validates the operands of 'transform_batch' and converts them to 
+        C-contiguous arrays of their common precision, copying them only if 
+        needed.
+
+        Args:
+            in_matrix (np.ndarray): Input matrix of shape (M, N).
+            t_matrices (np.ndarray): Transformation matrices of shape 
+                (M, N, N).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Input matrix and transformation 
+                matrices, both float32 or both float64.
+
+        Raises:
+            ValueError: If the shapes of the operands do not match.
+        """
+        in_matrix = np.asarray(in_matrix)
+        t_matrices = np.asarray(t_matrices)
+        if in_matrix.dtype == t_matrices.dtype == np.float32:
+            dtype = np.float32
+        else:
+            dtype = np.float64
+        in_matrix = np.ascontiguousarray(in_matrix, dtype=dtype)
+        t_matrices = np.ascontiguousarray(t_matrices, dtype=dtype)
+        if (
+            in_matrix.ndim != 2 
+            or t_matrices.shape != in_matrix.shape + in_matrix.shape[1:]
+        ):
+            raise ValueError(
+                f"Transformation matrices of shape {t_matrices.shape} do not "
+                f"match an input of shape {in_matrix.shape}"
+            )
+        return in_matrix, t_matrices
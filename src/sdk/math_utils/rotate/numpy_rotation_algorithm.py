@@ -0,0 +1,98 @@
+import numpy as np
+from sdk.math_utils.rotate.abstract_rotation_algorithm import (
+    AbstractRotationAlgorithm
+)
+
+class NumpyRotationAlgorithm(AbstractRotationAlgorithm):
+    """
+    CPU implementation of the float32 matrix rotation algorithm.
+
+    Rows are transformed with single vectorized products written straight
+    into the output buffer, so no temporaries of the size of the input are 
+    allocated. Rotations of large inputs are spread over the threads of the
+    BLAS library NumPy is linked against.
+    """
+
+    def transform_f32(
+        self,
+        in_matrix: np.ndarray, 
+        t_matrix: np.ndarray,
+        n: int
+    ) -> np.ndarray:
+        """
+        Applies the rotation transformation on the CPU using float32 inputs.
+
+        Args:
+            in_matrix (np.ndarray): Input matrix of shape (M, N) or (M*N,)
+                containing float32 values.
+            t_matrix (np.ndarray): Transformation matrix of shape (N, N) 
+                containing float32 values.
+            n (int): Dimension size used in the transformation computation.
+
+        Returns:
+            np.ndarray: Float32 output matrix of shape (M, N).
+
+        Raises:
+            ValueError: If the shapes of the operands do not match 'n'.
+        """
+        rows, t_matrix = self._prepare_f32(in_matrix, t_matrix, n)
+        out = np.empty_like(rows)
+        rotate_rows(rows, t_matrix, out)
+        return out
+
+    def transform_batch(
+        self,
+        in_matrix: np.ndarray,
+        t_matrices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Applies a different transformation to each row on the CPU.
+
+        Args:
+            in_matrix (np.ndarray): Input matrix of shape (M, N).
+            t_matrices (np.ndarray): Transformation matrices of shape 
+                (M, N, N).
+
+        Returns:
+            np.ndarray: Output matrix of shape (M, N), in float32 if both
+                operands are float32 and in float64 otherwise.
+
+        Raises:
+            ValueError: If the shapes of the operands do not match.
+        """
+        rows, t_matrices = self._prepare_batch(in_matrix, t_matrices)
+        out = np.empty_like(rows)
+        rotate_rows_batch(rows, t_matrices, out)
+        return out
+
+def rotate_rows(
+        rows: np.ndarray,
+        t_matrix: np.ndarray,
+        out: np.ndarray
+    ) -> None:
+    """
+    Writes 'rows @ t_matrix.T' into 'out' (i.e. out[m, i] = T[i, j]*in[m, j]).
+
+    Args:
+        rows (np.ndarray): Float32 matrix of shape (M, N).
+        t_matrix (np.ndarray): Float32 matrix of shape (N, N).
+        out (np.ndarray): Float32 buffer of shape (M, N).
+    """
+    np.matmul(rows, t_matrix.T, out=out)
+
+def rotate_rows_batch(
+        rows: np.ndarray,
+        t_matrices: np.ndarray,
+        out: np.ndarray
+    ) -> None:
+    """
+    Writes 't_matrices[m] @ rows[m]' into 'out[m]' for every row 'm'.
+
+    Args:
+        rows (np.ndarray): Matrix of shape (M, N).
+        t_matrices (np.ndarray): Matrices of shape (M, N, N), of the same
+            dtype as 'rows'.
+        out (np.ndarray): Buffer of shape (M, N).
+    """
+    # Faster than a stacked matmul for the small N of frame transforms
+    np.einsum("mij,mj->mi", t_matrices, rows, out=out)
@@ -1,10 +1,35 @@
 from pathlib import Path
+from typing import Optional
 import numpy as np
 from sdk.cuda_manager.abstract_cuda_manager import CudaManager
-from sdk.cuda_manager.implementations.auto_cuda_manager import AutoCudaManager
+from sdk.cuda_manager.implementations.numpy_cuda_manager import (
+    NumpyCudaManager
+)
 from sdk.math_utils.rotate.abstract_rotation_algorithm import (
     AbstractRotationAlgorithm
 )
+from sdk.math_utils.rotate.numpy_rotation_algorithm import (
+    rotate_rows,
+    rotate_rows_batch
+)
+
+def _transform_f32_host(in_matrix, out, t_matrix, n, m) -> None:
+    """Host version of the 'transform_f32' kernel, for flattened inputs."""
+    n, m = int(n), int(m)
+    rotate_rows(
+        np.reshape(in_matrix, (-1, n))[:m], 
+        np.reshape(t_matrix, (n, n)), 
+        np.reshape(out, (-1, n))[:m]
+    )
+
+def _transform_batch_host(in_matrix, out, t_matrices, n, m) -> None:
+    """Host version of the 'transform_batch' kernels, for flattened inputs."""
+    n, m = int(n), int(m)
+    rotate_rows_batch(
+        np.reshape(in_matrix, (-1, n))[:m],
+        np.reshape(t_matrices, (-1, n, n))[:m],
+        np.reshape(out, (-1, n))[:m]
+    )
 
 class RotationAlgorithm(AbstractRotationAlgorithm):
     """
@@ -16,51 +41,127 @@ class RotationAlgorithm(AbstractRotationAlgorithm):
 
     The transformation applies a linear operation to each row of the input
     matrix using a transformation matrix, effectively performing a rotation
-    or projection in float32 precision.
+    or projection in float32 precision. Each thread computes one element of
+    the output, so memory accesses of neighbouring threads are coalesced, 
+    and the transformation matrix is cached in shared memory for dimensions
+    up to 32 ('ROTATE_MAX_N' in the kernel).
     """
 
     cuda_manager: CudaManager
 
-    def __init__(self):
+    def __init__(self, cuda_manager: Optional[CudaManager] = None):
+        """
+        Initializes the algorithm.
+
+        Args:
+            cuda_manager (CudaManager, optional): CUDA handler executing the
+                kernel. Defaults to an AutoCudaManager. A NumpyCudaManager 
+                runs the transformation on CPU.
+        """
         super().__init__()
-        self.cuda_manager = AutoCudaManager()
+        if cuda_manager is None:
+            # Imported on demand, so CPU-only machines do not need PyCUDA
+            from sdk.cuda_manager.implementations.auto_cuda_manager import (
+                AutoCudaManager
+            )
+            cuda_manager = AutoCudaManager()
+        self.cuda_manager = cuda_manager
 
+        # Declared, as the batched kernels are generated by a macro
         self.cuda_manager.add_code_fragment(
             "rotate",
-            Path(
-                r"src\sdk\math_utils\rotate\_support_files\_impl_rotate.cu"
-            )
+            Path(__file__).parent / "_support_files" / "_impl_rotate.cu",
+            exports=[
+                "transform_f32", "transform_batch_f32", "transform_batch_f64"
+            ]
         )
+        if isinstance(self.cuda_manager, NumpyCudaManager):
+            self.cuda_manager.add_host_kernel(
+                "transform_f32", _transform_f32_host
+            )
+            for kernel in ("transform_batch_f32", "transform_batch_f64"):
+                self.cuda_manager.add_host_kernel(
+                    kernel, _transform_batch_host
+                )
 
     def transform_f32(
         self,
         in_matrix: np.ndarray, 
         t_matrix: np.ndarray,
         n: int
-    ) -> np.array[np.double]:
+    ) -> np.ndarray:
         """
         Applies the rotation transformation on the GPU using float32 inputs.
 
         Args:
-            in_matrix (np.ndarray): Input matrix of shape (M, N) containing 
-                float32 values.
+            in_matrix (np.ndarray): Input matrix of shape (M, N) or (M*N,)
+                containing float32 values.
             t_matrix (np.ndarray): Transformation matrix of shape (N, N) 
                 containing float32 values.
             n (int): Dimension size used in the transformation computation.
 
         Returns:
-            np.ndarray: Output matrix of shape (M, N) resulting from applying 
-                the transformation.
+            np.ndarray: Float32 output matrix of shape (M, N) resulting from
+                applying the transformation.
+
+        Raises:
+            ValueError: If the shapes of the operands do not match 'n'.
         """
+        rows, t_matrix = self._prepare_f32(in_matrix, t_matrix, n)
         transform_f32_out: list = self.cuda_manager.run_program(
             "transform_f32",
             [1],
-            {1: [(len(in_matrix),), np.double]},
-            (1, 1, 1),
-            (int(n), 1, 1),
-            in_matrix, 
-            np.empty_like(in_matrix),
-            t_matrix, 
-            n
+            {1: [rows.shape, np.float32]},
+            None,
+            None,
+            rows.ravel(), 
+            None,
+            t_matrix.ravel(), 
+            rows.shape[1],
+            rows.shape[0],
+            size=rows.size
         )
         return transform_f32_out[0]
+
+    def transform_batch(
+        self,
+        in_matrix: np.ndarray,
+        t_matrices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Applies a different transformation to each row on the GPU.
+
+        All rows are transformed by a single kernel launch, with one thread
+        per output element.
+
+        Args:
+            in_matrix (np.ndarray): Input matrix of shape (M, N).
+            t_matrices (np.ndarray): Transformation matrices of shape 
+                (M, N, N).
+
+        Returns:
+            np.ndarray: Output matrix of shape (M, N), in float32 if both
+                operands are float32 and in float64 otherwise.
+
+        Raises:
+            ValueError: If the shapes of the operands do not match.
+        """
+        rows, t_matrices = self._prepare_batch(in_matrix, t_matrices)
+        kernel = (
+            "transform_batch_f32" if rows.dtype == np.float32 
+            else "transform_batch_f64"
+        )
+        transform_batch_out: list = self.cuda_manager.run_program(
+            kernel,
+            [1],
+            {1: [rows.shape, rows.dtype]},
+            None,
+            None,
+            rows.ravel(),
+            None,
+            t_matrices.ravel(),
+            rows.shape[1],
+            rows.shape[0],
+            size=rows.size
+        )
+        return transform_batch_out[0]
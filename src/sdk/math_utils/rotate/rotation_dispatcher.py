@@ -0,0 +1,249 @@
+import json
+from pathlib import Path
+import platform
+from threading import Lock
+from time import perf_counter
+from typing import Optional
+from venv import logger
+import numpy as np
+from sdk.math_utils.rotate.abstract_rotation_algorithm import (
+    AbstractRotationAlgorithm
+)
+from sdk.math_utils.rotate.numpy_rotation_algorithm import (
+    NumpyRotationAlgorithm
+)
+from sdk.math_utils.rotate.rotation_algorithm import RotationAlgorithm
+
+class RotationDispatcher(AbstractRotationAlgorithm):
+    """
+    Rotation algorithm choosing a CPU or GPU implementation per call.
+
+    Small problems are dominated by the GPU launch and transfer overheads,
+    so each operation is run on the CPU below a crossover number of rows
+    and on the GPU from it on. Crossovers are calibrated on first use by
+    timing both implementations over 'CALIBRATION_ROWS', and are kept per
+    machine in a JSON file, so calibration only runs once.
+
+    Without a GPU implementation (e.g. PyCUDA or a GPU are not available)
+    every call runs on the CPU.
+
+    Attributes:
+        OPERATIONS (tuple[str, ...]): Dispatched operations.
+        CALIBRATION_ROWS (tuple[int, ...]): Numbers of rows timed by the
+            calibration, in increasing order.
+        CALIBRATION_N (int): Row length used by the calibration.
+        cpu (AbstractRotationAlgorithm): CPU implementation.
+        gpu (AbstractRotationAlgorithm, optional): GPU implementation.
+        path (Path, optional): JSON file where the crossovers are kept.
+    """
+
+    OPERATIONS: tuple[str, ...] = ("transform_f32", "transform_batch")
+    CALIBRATION_ROWS: tuple[int, ...] = tuple(1 << p for p in range(8, 23, 2))
+    CALIBRATION_N: int = 3
+
+    __thresholds: Optional[dict[str, Optional[int]]]
+    __lock: Lock
+
+    def __init__(
+        self,
+        cpu: Optional[AbstractRotationAlgorithm] = None,
+        gpu: Optional[AbstractRotationAlgorithm] = None,
+        path: Optional[str | Path] = None,
+        thresholds: Optional[dict[str, Optional[int]]] = None
+    ) -> None:
+        """
+        Initializes the dispatcher.
+
+        Args:
+            cpu (AbstractRotationAlgorithm, optional): CPU implementation.
+                Defaults to a NumpyRotationAlgorithm.
+            gpu (AbstractRotationAlgorithm, optional): GPU implementation.
+                Defaults to a RotationAlgorithm if a GPU is available.
+            path (str | Path, optional): JSON file where the crossovers are
+                kept. None keeps them in memory.
+            thresholds (dict[str, int | None], optional): Crossover number
+                of rows of each operation (None never uses the GPU). Skips
+                the calibration if given.
+        """
+        super().__init__()
+        self.cpu = cpu if cpu is not None else NumpyRotationAlgorithm()
+        self.gpu = gpu if gpu is not None else self.__default_gpu()
+        self.path = Path(path).expanduser() if path is not None else None
+        self.__lock = Lock()
+        self.__thresholds = dict(thresholds) if thresholds else None
+        if self.__thresholds is None and self.path is not None:
+            self.__thresholds = self.__load().get(self.machine())
+
+    @staticmethod
+    def machine() -> str:
+        """
+        Key of the current machine in the crossover file.
+
+        Returns:
+            str: Node name and architecture of the machine.
+        """
+        return f"{platform.node()}|{platform.machine()}"
+
+    @property
+    def thresholds(self) -> dict[str, Optional[int]]:
+        """Crossover number of rows of each operation, calibrated if needed."""
+        with self.__lock:
+            if self.__thresholds is None:
+                self.__thresholds = self.__calibrate()
+            return dict(self.__thresholds)
+
+    def calibrate(self) -> dict[str, Optional[int]]:
+        """
+        Measures the crossovers of this machine and stores them.
+
+        Returns:
+            dict[str, int | None]: Crossover number of rows of each
+                operation, or None if the GPU is never faster.
+        """
+        with self.__lock:
+            self.__thresholds = self.__calibrate()
+            return dict(self.__thresholds)
+
+    def select(self, operation: str, rows: int) -> AbstractRotationAlgorithm:
+        """
+        Implementation running an operation over a number of rows.
+
+        Args:
+            operation (str): Name of the operation (see 'OPERATIONS').
+            rows (int): Number of rows of the problem.
+
+        Returns:
+            AbstractRotationAlgorithm: Fastest implementation.
+        """
+        if self.gpu is None:
+            return self.cpu
+        threshold = self.thresholds.get(operation)
+        if threshold is None or rows < threshold:
+            return self.cpu
+        return self.gpu
+
+    def transform_f32(
+        self,
+        in_matrix: np.ndarray,
+        t_matrix: np.ndarray,
+        n: int
+    ) -> np.ndarray:
+        """
+        Applies the rotation transformation with the fastest implementation.
+
+        Args:
+            in_matrix (np.ndarray): Input matrix of shape (M, N) or (M*N,)
+                containing float32 values.
+            t_matrix (np.ndarray): Transformation matrix of shape (N, N)
+                containing float32 values.
+            n (int): Dimension size used in the transformation computation.
+
+        Returns:
+            np.ndarray: Float32 output matrix of shape (M, N).
+        """
+        rows = np.size(in_matrix) // max(int(n), 1)
+        return self.select("transform_f32", rows).transform_f32(
+            in_matrix, t_matrix, n
+        )
+
+    def transform_batch(
+        self,
+        in_matrix: np.ndarray,
+        t_matrices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Applies a different transformation to each row with the fastest
+        implementation.
+
+        Args:
+            in_matrix (np.ndarray): Input matrix of shape (M, N).
+            t_matrices (np.ndarray): Transformation matrices of shape
+                (M, N, N).
+
+        Returns:
+            np.ndarray: Output matrix of shape (M, N), in float32 if both
+                operands are float32 and in float64 otherwise.
+        """
+        return self.select("transform_batch", len(in_matrix)).transform_batch(
+            in_matrix, t_matrices
+        )
+
+    def _measure(
+        self,
+        algorithm: AbstractRotationAlgorithm,
+        operation: str,
+        rows: int
+    ) -> float:
+        """
+        Time of an operation over a number of rows, after a warm-up call.
+
+        Args:
+            algorithm (AbstractRotationAlgorithm): Timed implementation.
+            operation (str): Name of the operation.
+            rows (int): Number of rows.
+
+        Returns:
+            float: Best time of a few calls, in seconds.
+        """
+        n = self.CALIBRATION_N
+        rng = np.random.default_rng(0)
+        in_matrix = rng.random((rows, n), dtype=np.float32)
+        if operation == "transform_f32":
+            t_matrix = rng.random((n, n), dtype=np.float32)
+            call = lambda: algorithm.transform_f32(in_matrix, t_matrix, n)
+        else:
+            t_matrices = rng.random((rows, n, n), dtype=np.float32)
+            call = lambda: algorithm.transform_batch(in_matrix, t_matrices)
+        call()
+        timings = []
+        for _ in range(3):
+            start = perf_counter()
+            call()
+            timings.append(perf_counter() - start)
+        return min(timings)
+
+    def __calibrate(self) -> dict[str, Optional[int]]:
+        """Measures the crossovers and persists them. Needs the lock."""
+        thresholds: dict[str, Optional[int]] = dict.fromkeys(self.OPERATIONS)
+        if self.gpu is None:
+            return thresholds
+        for operation in self.OPERATIONS:
+            # Smallest size from which the GPU stays faster
+            for rows in reversed(self.CALIBRATION_ROWS):
+                if (
+                    self._measure(self.gpu, operation, rows)
+                    >= self._measure(self.cpu, operation, rows)
+                ):
+                    break
+                thresholds[operation] = rows
+        logger.info(f"Rotation crossovers (rows): {thresholds}")
+        if self.path is not None:
+            entries = self.__load()
+            entries[self.machine()] = thresholds
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Written aside and renamed, so readers never see partial files
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="UTF-8") as file:
+                json.dump(entries, file, indent=2)
+            tmp_path.replace(self.path)
+        return thresholds
+
+    def __load(self) -> dict[str, dict[str, Optional[int]]]:
+        """Entries of the crossover file, empty if it does not exist."""
+        if not self.path.exists():
+            return {}
+        with open(self.path, encoding="UTF-8") as file:
+            return json.load(file)
+
+    @staticmethod
+    def __default_gpu() -> Optional[AbstractRotationAlgorithm]:
+        """RotationAlgorithm on the default GPU, or None if unavailable."""
+        try:
+            # Imported on demand, so CPU-only machines do not need PyCUDA
+            from sdk.cuda_manager.implementations.auto_cuda_manager import (
+                AutoCudaManager
+            )
+            return RotationAlgorithm(AutoCudaManager())
+        except Exception as e:
+            logger.warning(f"GPU rotations not available, using CPU: {e}")
+            return None
@@ -0,0 +1,9 @@
+from .inverse_cdf import sample_exponential, sample_from_grid
+from .space_filling import latin_hypercube, sobol
+
+__all__ = [
+    "latin_hypercube",
+    "sample_exponential",
+    "sample_from_grid",
+    "sobol"
+]
@@ -0,0 +1,67 @@
+import numpy as np
+
+def sample_from_grid(
+        grid: np.ndarray,
+        density: np.ndarray,
+        size: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+    """
+    Draws samples from a density tabulated on a grid using inverse-CDF.
+
+    The density is linearly interpolated between grid points, so the 
+    cumulative distribution is built with the trapezoidal rule and inverted 
+    by interpolation. The density does not need to be normalized.
+
+    Args:
+        grid (np.ndarray): Increasing points where the density is tabulated.
+        density (np.ndarray): Non-negative density values at 'grid'.
+        size (int): Number of samples to draw.
+        rng (np.random.Generator): Random number generator.
+
+    Returns:
+        np.ndarray: Array of shape (size,) with samples within the grid range.
+
+    Raises:
+        ValueError: If the density is not positive over the grid.
+    """
+    grid = np.asarray(grid, dtype=np.float64)
+    density = np.asarray(density, dtype=np.float64)
+    cdf = np.concatenate((
+        [0.], 
+        np.cumsum(0.5*(density[1:] + density[:-1])*np.diff(grid))
+    ))
+    if not cdf[-1] > 0:
+        raise ValueError("Density must be positive over the grid")
+    cdf /= cdf[-1]
+    return np.interp(rng.random(size), cdf, grid)
+
+def sample_exponential(
+        k: float,
+        low: float,
+        high: float,
+        size: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+    """
+    Draws samples from exp(k*x) truncated to [low, high].
+
+    Uses the analytic inverse of the truncated exponential CDF; a uniform 
+    distribution is used when 'k' is zero.
+
+    Args:
+        k (float): Slope of the exponential.
+        low (float): Lower bound of the range.
+        high (float): Upper bound of the range.
+        size (int): Number of samples to draw.
+        rng (np.random.Generator): Random number generator.
+
+    Returns:
+        np.ndarray: Array of shape (size,) with samples within [low, high].
+    """
+    u = rng.random(size)
+    if k == 0:
+        return low + u*(high - low)
+    # Shifted by 'low' so large |k*x| does not overflow
+    span = np.expm1(k*(high - low))
+    return low + np.log1p(u*span)/k
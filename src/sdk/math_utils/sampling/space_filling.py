@@ -0,0 +1,56 @@
+from typing import Optional
+import numpy as np
+
+def latin_hypercube(
+        size: int,
+        dimension: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+    """
+    Draws a Latin hypercube sample over the unit hypercube.
+
+    Each dimension is split in 'size' equal strata and every stratum holds 
+    exactly one point, randomly placed inside it.
+
+    Args:
+        size (int): Number of points.
+        dimension (int): Number of dimensions.
+        rng (np.random.Generator): Random number generator.
+
+    Returns:
+        np.ndarray: Array of shape (size, dimension) with values in [0, 1).
+    """
+    strata = np.argsort(rng.random((dimension, size)), axis=1).T
+    return (strata + rng.random((size, dimension))) / size
+
+def sobol(
+        size: int,
+        dimension: int,
+        seed: Optional[int] = None
+    ) -> np.ndarray:
+    """
+    Draws a scrambled Sobol sequence over the unit hypercube.
+
+    Requires SciPy, which is an optional dependency (the "sobol" extra of
+    the package).
+
+    Args:
+        size (int): Number of points. Powers of two keep the balance 
+            properties of the sequence.
+        dimension (int): Number of dimensions.
+        seed (int, optional): Seed of the scrambling.
+
+    Returns:
+        np.ndarray: Array of shape (size, dimension) with values in [0, 1).
+
+    Raises:
+        ImportError: If SciPy is not installed.
+    """
+    try:
+        from scipy.stats import qmc
+    except ImportError as e:
+        raise ImportError(
+            "Sobol sampling requires scipy, install it with "
+            "'pip install ipanema[sobol]'"
+        ) from e
+    return qmc.Sobol(d=dimension, scramble=True, seed=seed).random(size)
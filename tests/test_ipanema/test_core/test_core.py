@@ -4,8 +4,12 @@ from unittest import mock
 from unittest.mock import patch, MagicMock
 import tempfile
 import shutil
+import threading
+import time
 import importlib
 from pathlib import Path
+from iminuit import Minuit
+from ipanema.config.config import CONFIG
 from ipanema.core import Core 
 from ipanema.input.input_plugin import InputPlugin
 from ipanema.model.model_plugin import ModelPlugin
@@ -129,10 +133,10 @@ class FakeModelPlugin:
         self.params = params
 
     def prepare_fit(self):
-        pass
+        self.fit_manager = Minuit(lambda x: (x - 3)**2, x=1)
 
 class FakeOutputPlugin:
-    def generate_results(self, model):
+    def generate_results(self, model, result):
         pass
 
 
@@ -279,9 +283,127 @@ def test_run_ipanema_model_error(plugin_loader):
     with pytest.raises(IpanemaFittingError):
         plugin_loader.run_ipanema()
 
+def test_run_ipanema_fit_error(plugin_loader):
+    class UnfittableModel(FakeModelPlugin):
+        def prepare_fit(self):
+            self.fit_manager = mock.Mock()
+            self.fit_manager.migrad.side_effect = RuntimeError("Fit Error")
+
+    plugin_loader._resolve_plugins.return_value = (
+        FakeInputPlugin, 
+        UnfittableModel, 
+        [FakeOutputPlugin]
+    )
+
+    with pytest.raises(IpanemaFittingError):
+        plugin_loader.run_ipanema()
+
+def test_run_ipanema_fits_once_for_all_outputs(plugin_loader):
+    results = []
+
+    class RecordingOutput:
+        def generate_results(self, model, result):
+            results.append(result)
+
+    plugin_loader._resolve_plugins.return_value = (
+        FakeInputPlugin, 
+        FakeModelPlugin, 
+        [RecordingOutput, RecordingOutput]
+    )
+    plugin_loader.run_ipanema()
+
+    assert len(results) == 2
+    assert results[0] is results[1]
+    assert results[0].values["x"] == pytest.approx(3)
+
+def test_run_ipanema_records_stage_metrics(plugin_loader, monkeypatch, 
+                                           tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    monkeypatch.setitem(
+        CONFIG, "metrics", {"path": str(path), "format": "jsonl"}
+    )
+    plugin_loader.run_ipanema()
+
+    stages = plugin_loader.metrics.stages
+    assert {
+        "resolve_plugins", "input", "prepare_fit", "fit", "fit.migrad",
+        "fit.hesse", "outputs", "output.FakeOutputPlugin"
+    } <= set(stages)
+    assert path.exists()
+
+def test_run_ipanema_exports_metrics_of_failed_fits(plugin_loader, 
+                                                    monkeypatch, tmp_path):
+    class UnfittableModel(FakeModelPlugin):
+        def prepare_fit(self):
+            self.fit_manager = mock.Mock()
+            self.fit_manager.migrad.side_effect = RuntimeError("Fit Error")
+
+    path = tmp_path / "metrics.jsonl"
+    monkeypatch.setitem(
+        CONFIG, "metrics", {"path": str(path), "format": "jsonl"}
+    )
+    plugin_loader._resolve_plugins.return_value = (
+        FakeInputPlugin, 
+        UnfittableModel, 
+        [FakeOutputPlugin]
+    )
+
+    with pytest.raises(IpanemaFittingError):
+        plugin_loader.run_ipanema()
+    assert path.exists()
+    assert "prepare_fit" in plugin_loader.metrics.stages
+
+def test_run_ipanema_wraps_fcn_hook_errors(plugin_loader):
+    class UnobservableModel(FakeModelPlugin):
+        def add_fcn_hook(self, hook):
+            raise RuntimeError("Hook Error")
+
+    plugin_loader._resolve_plugins.return_value = (
+        FakeInputPlugin, 
+        UnobservableModel, 
+        [FakeOutputPlugin]
+    )
+
+    with pytest.raises(IpanemaFittingError):
+        plugin_loader.run_ipanema()
+
+def test_run_ipanema_records_fcn_latencies(plugin_loader):
+    class ObservableModel(ModelPlugin):
+        def prepare_fit(self):
+            self.fit_manager = Minuit(
+                self.wrap_fcn(lambda x: (x - 3)**2), x=1
+            )
+
+    plugin_loader._resolve_plugins.return_value = (
+        FakeInputPlugin, 
+        ObservableModel, 
+        [FakeOutputPlugin]
+    )
+    plugin_loader.run_ipanema()
+
+    assert plugin_loader.metrics.summary()["fcn"]["calls"] > 0
+
+def test_run_ipanema_saves_fcn_trace(plugin_loader, monkeypatch, tmp_path):
+    class ObservableModel(ModelPlugin):
+        def prepare_fit(self):
+            self.fit_manager = Minuit(
+                self.wrap_fcn(lambda x: (x - 3)**2), x=1
+            )
+
+    path = tmp_path / "trace.npz"
+    monkeypatch.setitem(CONFIG, "metrics", {"fcn_trace": str(path)})
+    plugin_loader._resolve_plugins.return_value = (
+        FakeInputPlugin, 
+        ObservableModel, 
+        [FakeOutputPlugin]
+    )
+    plugin_loader.run_ipanema()
+
+    assert path.exists()
+
 def test_run_ipanema_output_error(plugin_loader):
     class FailingOutput:
-        def generate_results(self, model):
+        def generate_results(self, model, result):
             raise Exception("Fail in output")
 
     plugin_loader._resolve_plugins.return_value = (
@@ -291,4 +413,86 @@ def test_run_ipanema_output_error(plugin_loader):
     )
 
     with pytest.raises(IpanemaOutputError):
-        plugin_loader.run_ipanema()
\ No newline at end of file
+        plugin_loader.run_ipanema()
+
+###############
+# _run_outputs
+###############
+
+
+class SleepingOutput:
+    thread_safe = True
+
+    def generate_results(self, model, result):
+        time.sleep(0.2)
+
+def test_run_outputs_thread_safe_plugins_overlap(plugin_loader):
+    start = time.perf_counter()
+    plugin_loader._run_outputs(
+        FakeModelPlugin({}), 
+        mock.Mock(), 
+        [SleepingOutput, SleepingOutput, SleepingOutput]
+    )
+    assert time.perf_counter() - start < 0.5
+
+def test_run_outputs_unsafe_plugins_never_overlap(plugin_loader):
+    running = []
+    overlaps = []
+
+    class UnsafeOutput:
+        thread_safe = False
+
+        def generate_results(self, model, result):
+            if running:
+                overlaps.append(True)
+            running.append(self)
+            time.sleep(0.05)
+            running.remove(self)
+
+    plugin_loader._run_outputs(
+        FakeModelPlugin({}), 
+        mock.Mock(), 
+        [UnsafeOutput, UnsafeOutput, SleepingOutput]
+    )
+    assert not overlaps
+
+def test_run_outputs_unsafe_plugins_run_on_calling_thread(plugin_loader):
+    threads = []
+
+    class UnsafeOutput:
+        thread_safe = False
+
+        def generate_results(self, model, result):
+            threads.append(threading.get_ident())
+
+    plugin_loader._run_outputs(
+        FakeModelPlugin({}), 
+        mock.Mock(), 
+        [UnsafeOutput, SleepingOutput, UnsafeOutput]
+    )
+    assert threads == 2*[threading.get_ident()]
+
+def test_run_outputs_isolates_failures(plugin_loader):
+    finished = []
+
+    class FailingOutput:
+        thread_safe = True
+
+        def generate_results(self, model, result):
+            raise Exception("Fail in output")
+
+    class RecordingOutput:
+        thread_safe = False
+
+        def generate_results(self, model, result):
+            finished.append(result)
+
+    with pytest.raises(IpanemaOutputError) as exc_info:
+        plugin_loader._run_outputs(
+            FakeModelPlugin({}), 
+            mock.Mock(), 
+            [FailingOutput, RecordingOutput]
+        )
+
+    assert len(finished) == 1
+    assert "FailingOutput" in str(exc_info.value)
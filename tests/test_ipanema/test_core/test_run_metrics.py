@@ -0,0 +1,59 @@
+import json
+import pytest
+from ipanema.core.run_metrics import RunMetrics
+
+@pytest.fixture
+def metrics():
+    metrics = RunMetrics()
+    metrics.record("input", 0.5)
+    metrics.record("fit", 1.)
+    metrics.record("fit", 1.)
+    for seconds in (0.001, 0.002, 0.003, 0.004):
+        metrics.record_fcn((1.,), 0., seconds)
+    return metrics
+
+def test_stage_context_records_duration():
+    metrics = RunMetrics()
+    with pytest.raises(RuntimeError):
+        with metrics.stage("failing"):
+            raise RuntimeError
+
+    assert list(metrics.stages) == ["failing"]
+    assert metrics.stages["failing"] >= 0
+
+def test_summary(metrics):
+    summary = metrics.summary()
+
+    assert summary["stages"] == {"input": 0.5, "fit": 2.}
+    assert summary["fcn"]["calls"] == 4
+    assert summary["fcn"]["mean"] == pytest.approx(0.0025)
+    assert summary["fcn"]["p50"] == pytest.approx(0.0025)
+    assert set(summary["fcn"]) == {"calls", "mean", "p50", "p90", "p99"}
+
+def test_summary_without_fcn_calls():
+    assert RunMetrics().summary()["fcn"] == {"calls": 0}
+
+def test_export_json_lines_appends(metrics, tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    metrics.export(path)
+    metrics.export(path, "jsonl")
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    record = json.loads(lines[0])
+    assert record["stages"]["fit"] == 2.
+    assert {"timestamp", "host", "fcn"} <= set(record)
+
+def test_export_prometheus(metrics, tmp_path):
+    path = tmp_path / "ipanema.prom"
+    metrics.export(path, "prometheus")
+
+    text = path.read_text()
+    assert 'ipanema_stage_seconds{stage="fit"} 2' in text
+    assert "ipanema_fcn_calls 4" in text
+    assert 'ipanema_fcn_latency_seconds{quantile="0.99"}' in text
+    assert not (tmp_path / "ipanema.prom.tmp").exists()
+
+def test_export_unsupported_format(metrics, tmp_path):
+    with pytest.raises(ValueError):
+        metrics.export(tmp_path / "metrics.csv", "csv")
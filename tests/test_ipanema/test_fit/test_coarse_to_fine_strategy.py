@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+from iminuit import Minuit
+from ipanema.config.config import CONFIG
+from ipanema.fit import FitStage
+from ipanema.fit.strategies import CoarseToFineStrategy
+from ipanema.model import ModelPlugin
+from ipanema.model.implementations.signal_peak_model import SignalPeakModel
+
+class ExtendedGaussianModel(ModelPlugin):
+    """Extended unit-width Gaussian fit of a mean and a yield."""
+
+    extensive_parameters = ("N",)
+
+    def prepare_fit(self):
+        data = self.parameters["data"]
+        n_dat = len(data)
+
+        def fcn(mu, N):
+            return N - n_dat*np.log(N) + 0.5*np.sum((data - mu)**2)
+
+        self.fit_manager = Minuit(fcn, mu=0., N=0.5*n_dat)
+        self.fit_manager.limits["N"] = (0.1*n_dat, 2*n_dat)
+        self.fit_manager.errordef = Minuit.LIKELIHOOD
+
+    def subsample(self, fraction, rng):
+        data = self.parameters["data"]
+        return {"data": data[rng.random(len(data)) < fraction]}
+
+class NoSubsampleModel(ExtendedGaussianModel):
+
+    def subsample(self, fraction, rng):
+        return ModelPlugin.subsample(self, fraction, rng)
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).normal(3., 1., 20_000)
+
+def test_invalid_fraction_raises():
+    with pytest.raises(ValueError):
+        CoarseToFineStrategy([{"fraction": 0., "tolerance": 1.}])
+
+def test_prepare_moves_close_to_minimum(data):
+    model = ExtendedGaussianModel({"data": data})
+    model.prepare_fit()
+
+    strategy = CoarseToFineStrategy(
+        [{"fraction": 0.01, "tolerance": 1.}, 
+         {"fraction": 0.1, "tolerance": 0.5}],
+        seed=1
+    )
+    strategy.prepare(model)
+
+    assert model.fit_manager.values["mu"] == pytest.approx(3., abs=0.1)
+    # The yield is scaled back to the full dataset
+    assert model.fit_manager.values["N"] == pytest.approx(len(data), rel=0.1)
+    assert model.fit_manager.nfcn == 0
+
+def test_full_fit_needs_fewer_calls(data):
+    cold = ExtendedGaussianModel({"data": data})
+    cold.prepare_fit()
+    cold_result = FitStage(["migrad"]).run(cold)
+
+    warm = ExtendedGaussianModel({"data": data})
+    warm.prepare_fit()
+    warm_result = FitStage(
+        ["migrad"], strategy=CoarseToFineStrategy(seed=1)
+    ).run(warm)
+
+    assert warm_result.values["mu"] == pytest.approx(
+        cold_result.values["mu"], abs=1e-3
+    )
+    assert warm_result.nfcn < cold_result.nfcn
+
+def test_prepare_keeps_model_settings(monkeypatch):
+    # The default backend needs a GPU, so the coarse models must be built
+    # with the backend of the model
+    monkeypatch.setitem(CONFIG, "backend", "pycuda")
+    rng = np.random.default_rng(0)
+    massbins = np.linspace(5180., 5380., 2000)
+    mydat = np.concatenate((
+        rng.normal(5365., 7., 3000), rng.uniform(5180., 5380., 7000)
+    ))
+    model = SignalPeakModel({
+        "mydat": mydat,
+        "n_dat": len(mydat),
+        "d_m": massbins[1] - massbins[0],
+        "m_max": massbins[-1],
+        "m_min": massbins[0],
+        "massbins": massbins
+    }, backend="numpy", precision="mixed")
+    model.prepare_fit()
+
+    CoarseToFineStrategy(
+        [{"fraction": 0.1, "tolerance": 1.}], seed=1
+    ).prepare(model)
+
+    assert model.fit_manager.values["mu"] == pytest.approx(5365., abs=2.)
+    assert model.fit_manager.nfcn == 0
+
+def test_model_without_subsample_is_untouched(data):
+    model = NoSubsampleModel({"data": data})
+    model.prepare_fit()
+    CoarseToFineStrategy().prepare(model)
+
+    assert model.fit_manager.values["mu"] == 0.
+
+def test_fit_stage_from_config(tmp_path):
+    stage = FitStage.from_config({
+        "steps": ["migrad"],
+        "cache": tmp_path,
+        "strategy": {
+            "name": "coarse_to_fine", 
+            "stages": [{"fraction": 0.05, "tolerance": 1.}],
+            "seed": 3
+        }
+    })
+
+    assert stage.steps == ("migrad",)
+    assert stage.cache.path == tmp_path
+    assert isinstance(stage.strategy, CoarseToFineStrategy)
+    assert stage.strategy.seed == 3
+
+def test_fit_stage_from_config_unknown_strategy():
+    with pytest.raises(ValueError):
+        FitStage.from_config({"strategy": {"name": "unknown"}})
@@ -0,0 +1,185 @@
+import pickle
+import numpy as np
+import pytest
+from iminuit import Minuit
+from ipanema.config.config import CONFIG
+from ipanema.fit import FitCache, FitResult, FitStage
+from ipanema.model import ModelPlugin
+from ipanema.model.implementations.signal_peak_model import SignalPeakModel
+
+class MeanModel(ModelPlugin):
+
+    def prepare_fit(self):
+        data = self.parameters["data"]
+        self.calls = []
+
+        def fcn(mu):
+            self.calls.append(mu)
+            return np.sum((data - mu)**2)
+
+        self.fit_manager = Minuit(fcn, mu=0.)
+        self.fit_manager.errordef = Minuit.LEAST_SQUARES
+
+class YieldModel(MeanModel):
+
+    extensive_parameters = ("N",)
+
+    def prepare_fit(self):
+        data = self.parameters["data"]
+        n_dat = len(data)
+        self.calls = []
+
+        def fcn(mu, N):
+            self.calls.append((mu, N))
+            return N - n_dat*np.log(N) + 0.5*np.sum((data - mu)**2)
+
+        self.fit_manager = Minuit(fcn, mu=0., N=0.5*n_dat)
+        self.fit_manager.limits["N"] = (0.1*n_dat, 2*n_dat)
+        self.fit_manager.errordef = Minuit.LIKELIHOOD
+
+    @property
+    def n_events(self):
+        return len(self.parameters["data"])
+
+def prepared_yield(data):
+    model = YieldModel({"data": data})
+    model.prepare_fit()
+    return model
+
+def signal_peak_model(n_dat):
+    rng = np.random.default_rng(n_dat)
+    massbins = np.linspace(5180., 5380., 2000)
+    mydat = np.concatenate((
+        rng.normal(5365., 7., int(0.3*n_dat)), 
+        rng.uniform(5180., 5380., n_dat - int(0.3*n_dat))
+    ))
+    model = SignalPeakModel({
+        "mydat": mydat,
+        "n_dat": len(mydat),
+        "d_m": massbins[1] - massbins[0],
+        "m_max": massbins[-1],
+        "m_min": massbins[0],
+        "massbins": massbins
+    }, backend="numpy")
+    model.prepare_fit()
+    return model
+
+def prepared(data):
+    model = MeanModel({"data": data})
+    model.prepare_fit()
+    return model
+
+@pytest.fixture
+def cache(tmp_path):
+    return FitCache(tmp_path / "cache")
+
+def test_fit_result_pickle_roundtrip():
+    model = prepared(np.array([1., 2., 3.]))
+    result = FitStage().run(model)
+    restored = pickle.loads(pickle.dumps(result))
+
+    assert restored.values == result.values
+    assert np.array_equal(restored.covariance, result.covariance)
+    with pytest.raises(TypeError):
+        restored.values["mu"] = 0.
+
+def test_dataset_fingerprint():
+    a = {"data": np.arange(10.), "n": 10}
+    assert FitCache.dataset_fingerprint(a) == FitCache.dataset_fingerprint(
+        {"n": 10, "data": np.arange(10.)}
+    )
+    assert FitCache.dataset_fingerprint(a) != FitCache.dataset_fingerprint(
+        {"data": np.arange(10.) + 1e-9, "n": 10}
+    )
+    assert FitCache.dataset_fingerprint(a) != FitCache.dataset_fingerprint(
+        {"data": np.arange(10, dtype=np.float32), "n": 10}
+    )
+
+def test_model_fingerprint_depends_on_configuration():
+    model = prepared(np.arange(3.))
+    key = FitCache.model_fingerprint(MeanModel, model.fit_manager, ("migrad",))
+
+    assert key != FitCache.model_fingerprint(
+        MeanModel, model.fit_manager, ("migrad", "hesse")
+    )
+    model.fit_manager.limits["mu"] = (-5., 5.)
+    assert key != FitCache.model_fingerprint(
+        MeanModel, model.fit_manager, ("migrad",)
+    )
+
+def test_model_fingerprint_depends_on_settings(monkeypatch):
+    model = prepared(np.arange(3.))
+    key = FitCache.model_fingerprint(MeanModel, model.fit_manager, ("migrad",))
+
+    assert key != FitCache.model_fingerprint(
+        MeanModel, model.fit_manager, ("migrad",), {"precision": "mixed"}
+    )
+    monkeypatch.setitem(CONFIG, "backend", "numpy")
+    assert key != FitCache.model_fingerprint(
+        MeanModel, model.fit_manager, ("migrad",)
+    )
+
+def test_exact_match_skips_fit(cache):
+    data = np.array([1., 2., 3.])
+    first = FitStage(cache=cache).run(prepared(data))
+
+    model = prepared(data)
+    second = FitStage(cache=cache).run(model)
+
+    assert second.values == first.values
+    assert model.fit_manager.nfcn == 0
+    assert model.fit_manager.values["mu"] == pytest.approx(2.)
+
+def test_other_model_settings_refit(cache, monkeypatch):
+    data = np.array([1., 2., 3.])
+    FitStage(cache=cache).run(prepared(data))
+
+    model = prepared(data)
+    monkeypatch.setattr(
+        MeanModel, "init_kwargs", property(lambda self: {"precision": "mixed"})
+    )
+    FitStage(cache=cache).run(model)
+
+    assert model.fit_manager.nfcn > 0
+
+def test_near_match_warm_starts(cache):
+    FitStage(cache=cache).run(prepared(np.array([1., 2., 3.])))
+
+    model = prepared(np.array([1., 2., 3.1]))
+    result = FitStage(cache=cache).run(model)
+
+    assert model.calls[0] == pytest.approx(2.)
+    assert result.values["mu"] == pytest.approx(6.1/3)
+    assert len(list(cache.path.glob("*/*.pkl"))) == 2
+
+def test_model_fingerprint_ignores_extensive_parameters():
+    small, large = signal_peak_model(2000), signal_peak_model(2001)
+
+    assert FitCache.model_fingerprint(
+        SignalPeakModel, small.fit_manager, ("migrad",)
+    ) == FitCache.model_fingerprint(
+        SignalPeakModel, large.fit_manager, ("migrad",)
+    )
+
+def test_near_match_rescales_extensive_parameters(cache):
+    rng = np.random.default_rng(0)
+    first = FitStage(cache=cache).run(prepared_yield(rng.normal(3., 1., 1000)))
+
+    model = prepared_yield(rng.normal(3., 1., 1500))
+    result = FitStage(cache=cache).run(model)
+
+    assert result.n_events == 1500
+    assert model.calls[0][1] == pytest.approx(first.values["N"]*1.5)
+    assert result.values["N"] == pytest.approx(1500., rel=1e-3)
+
+def test_signal_peak_fit_warm_starts_on_new_data(cache):
+    FitStage(["migrad"], cache=cache).run(signal_peak_model(2000))
+    cold = FitStage(["migrad"]).run(signal_peak_model(2001))
+
+    warm = FitStage(["migrad"], cache=cache).run(signal_peak_model(2001))
+
+    assert warm.fval == pytest.approx(cold.fval)
+    assert warm.nfcn < cold.nfcn
+
+def test_lookup_empty(cache):
+    assert cache.lookup("model", "data") == (None, None)
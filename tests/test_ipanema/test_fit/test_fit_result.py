@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from iminuit import Minuit
+from ipanema.fit import FitResult
+
+@pytest.fixture
+def minuit():
+    manager = Minuit(lambda x, y: (x - 3)**2 + (y + 1)**2, x=1, y=0)
+    manager.fixed["y"] = True
+    manager.migrad()
+    manager.hesse()
+    return manager
+
+def test_from_minuit_copies_state(minuit):
+    result = FitResult.from_minuit(minuit, ("migrad", "hesse"))
+
+    assert result.parameters == ("x", "y")
+    assert result.values["x"] == pytest.approx(3)
+    assert result.values["y"] == 0
+    assert result.fixed["y"] is True
+    assert result.valid
+    assert result.nfcn == minuit.nfcn
+    assert result.steps == ("migrad", "hesse")
+    assert result.covariance.shape == (2, 2)
+    assert result.minos_errors == {}
+
+def test_result_is_immutable(minuit):
+    result = FitResult.from_minuit(minuit)
+
+    with pytest.raises(AttributeError):
+        result.fval = 0.
+    with pytest.raises(TypeError):
+        result.values["x"] = 0.
+    with pytest.raises(ValueError):
+        result.covariance[0, 0] = 0.
+
+def test_result_independent_from_minuit(minuit):
+    result = FitResult.from_minuit(minuit)
+    minuit.values["x"] = 10.
+
+    assert result.values["x"] == pytest.approx(3)
+
+def test_minos_errors(minuit):
+    minuit.minos("x")
+    result = FitResult.from_minuit(minuit)
+
+    lower, upper = result.minos_errors["x"]
+    assert lower < 0 < upper
+    assert np.isclose(-lower, upper)
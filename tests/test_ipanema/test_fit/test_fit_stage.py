@@ -0,0 +1,33 @@
+import pytest
+from unittest import mock
+from iminuit import Minuit
+from ipanema.fit import FitResult, FitStage
+
+class QuadraticModel:
+    def __init__(self):
+        self.fit_manager = Minuit(lambda x: (x - 3)**2, x=1)
+
+def test_default_steps():
+    assert FitStage().steps == ("migrad", "hesse")
+
+def test_unsupported_step_raises():
+    with pytest.raises(ValueError):
+        FitStage(["migrad", "simplex_typo"])
+
+def test_run_returns_fit_result():
+    result = FitStage(["migrad", "hesse", "minos"]).run(QuadraticModel())
+
+    assert isinstance(result, FitResult)
+    assert result.values["x"] == pytest.approx(3)
+    assert result.steps == ("migrad", "hesse", "minos")
+    assert "x" in result.minos_errors
+
+def test_run_executes_steps_in_order():
+    model = mock.Mock()
+    model.fit_manager = mock.MagicMock(Minuit)
+
+    with mock.patch.object(FitResult, "from_minuit"):
+        FitStage(["hesse", "migrad"]).run(model)
+
+    called = [call[0] for call in model.fit_manager.method_calls]
+    assert called == ["hesse", "migrad"]
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from iminuit import Minuit
+from ipanema.config.config import CONFIG
+from ipanema.fit import FitStage
+from ipanema.fit.strategies import MultiStartStrategy
+from ipanema.model import ModelPlugin
+from ipanema.model.implementations.signal_peak_model import SignalPeakModel
+import ipanema.fit.strategies.multi_start_strategy as multi_start_strategy
+
+class DoubleWellModel(ModelPlugin):
+    """Global minimum near x = -1, local minimum near x = 1."""
+
+    def prepare_fit(self):
+        def fcn(x, y):
+            return (x**2 - 1)**2 + 0.3*x + y**2
+
+        self.fit_manager = Minuit(fcn, x=1.5, y=0.5)
+        self.fit_manager.limits["x"] = (-2., 2.)
+        self.fit_manager.errordef = Minuit.LEAST_SQUARES
+
+@pytest.fixture
+def model():
+    model = DoubleWellModel({})
+    model.prepare_fit()
+    return model
+
+@pytest.mark.parametrize("kwargs", [
+    {"sampling": "grid"},
+    {"n_starts": 4, "n_best": 5},
+    {"n_best": 0},
+])
+def test_invalid_options_raise(kwargs):
+    with pytest.raises(ValueError):
+        MultiStartStrategy(**kwargs)
+
+def test_sobol_without_scipy_raises(monkeypatch):
+    monkeypatch.setattr(multi_start_strategy, "find_spec", lambda name: None)
+    with pytest.raises(ImportError):
+        MultiStartStrategy(sampling="sobol")
+
+def test_single_start_lands_in_local_minimum(model):
+    result = FitStage(["migrad"]).run(model)
+    assert result.values["x"] == pytest.approx(1., abs=0.1)
+
+def test_multi_start_finds_global_minimum(model):
+    strategy = MultiStartStrategy(n_starts=16, n_best=2, seed=0, max_workers=2)
+    result = FitStage(["migrad"], strategy=strategy).run(model)
+
+    assert result.values["x"] == pytest.approx(-1., abs=0.1)
+    # Only bounded parameters are sampled, the others keep their value
+    assert result.values["y"] == pytest.approx(0., abs=1e-3)
+
+def test_no_bounded_parameters_is_noop():
+    model = DoubleWellModel({})
+    model.prepare_fit()
+    model.fit_manager.limits["x"] = (-np.inf, np.inf)
+
+    MultiStartStrategy(n_starts=4, n_best=1).prepare(model)
+    assert model.fit_manager.values["x"] == 1.5
+
+def test_multi_start_with_signal_peak_model_on_cpu(monkeypatch):
+    monkeypatch.setitem(CONFIG, "backend", "numpy")
+    rng = np.random.default_rng(0)
+    massbins = np.linspace(5180., 5380., 2000)
+    mydat = np.concatenate((
+        rng.normal(5365., 7., 300), rng.uniform(5180., 5380., 700)
+    ))
+    model = SignalPeakModel({
+        "mydat": mydat,
+        "n_dat": len(mydat),
+        "d_m": massbins[1] - massbins[0],
+        "m_max": massbins[-1],
+        "m_min": massbins[0],
+        "massbins": massbins
+    })
+    model.prepare_fit()
+
+    strategy = MultiStartStrategy(n_starts=4, n_best=2, seed=0, max_workers=2)
+    result = FitStage(["migrad"], strategy=strategy).run(model)
+
+    assert np.isfinite(result.fval)
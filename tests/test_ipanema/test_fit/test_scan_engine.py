@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from iminuit import Minuit
+from ipanema.fit import FitStage, ScanEngine
+from ipanema.model import ModelPlugin
+
+class ParabolaModel(ModelPlugin):
+    """chi2 = ((x - cx)/2)**2 + (y - cy)**2, with errors 2 and 1."""
+
+    def prepare_fit(self):
+        cx, cy = self.parameters["center"]
+
+        def fcn(x, y):
+            return ((x - cx)/2)**2 + (y - cy)**2
+
+        self.fit_manager = Minuit(fcn, x=0., y=0.)
+        self.fit_manager.errordef = Minuit.LEAST_SQUARES
+
+@pytest.fixture(scope="module")
+def engine():
+    parameters = {"center": (1., -2.)}
+    model = ParabolaModel(parameters)
+    model.prepare_fit()
+    result = FitStage().run(model)
+    return ScanEngine(parameters, result, ParabolaModel, max_workers=2)
+
+def test_profile_default_points(engine):
+    profile = engine.profile("x", size=5, bound=2.)
+
+    assert profile.shape == (5,)
+    assert np.allclose(profile["value"], [-3., -1., 1., 3., 5.])
+    assert np.allclose(profile["fval"], [4., 1., 0., 1., 4.], atol=1e-6)
+    assert profile["valid"].all()
+
+def test_profiles_several_parameters(engine):
+    profiles = engine.profiles(["x", "y"], values=np.array([0., 1.]))
+
+    assert set(profiles) == {"x", "y"}
+    assert np.allclose(profiles["x"]["fval"], [0.25, 0.], atol=1e-6)
+    assert np.allclose(profiles["y"]["fval"], [4., 9.], atol=1e-6)
+
+def test_profiles_without_points(engine):
+    assert engine.profiles([]) == {}
+    assert engine.profiles(["x"], values=np.array([]))["x"].shape == (0,)
+
+def test_grid(engine):
+    scan = engine.grid("x", "y", np.array([1., 3.]), np.array([-2., 0., 1.]))
+
+    assert scan.shape == (2, 3)
+    expected = ((scan["x"] - 1)/2)**2 + (scan["y"] + 2)**2
+    assert np.allclose(scan["fval"], expected, atol=1e-6)
+
+def test_minos(engine):
+    errors = engine.minos()
+
+    assert list(errors["parameter"]) == ["x", "y"]
+    assert np.allclose(errors["lower"], [-2., -1.], rtol=1e-3)
+    assert np.allclose(errors["upper"], [2., 1.], rtol=1e-3)
+    assert errors["valid"].all()
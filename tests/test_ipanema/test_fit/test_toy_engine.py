@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from iminuit import Minuit
+from ipanema.fit import FitStage, ToyEngine
+from ipanema.model import ModelPlugin
+from ipanema.model.implementations.signal_peak_model import SignalPeakModel
+
+class GaussianMeanModel(ModelPlugin):
+    """Unit-width Gaussian whose mean is fitted."""
+
+    def prepare_fit(self):
+        data = self.parameters["data"]
+
+        def fcn(mu):
+            return 0.5*np.sum((data - mu)**2)
+
+        self.fit_manager = Minuit(fcn, mu=0.)
+        self.fit_manager.errordef = Minuit.LIKELIHOOD
+
+    def generate_toy(self, values, rng):
+        toy = dict(self.parameters)
+        toy["data"] = rng.normal(values["mu"], 1., len(self.parameters["data"]))
+        return toy
+
+@pytest.fixture(scope="module")
+def engine():
+    parameters = {"data": np.random.default_rng(0).normal(2., 1., 100)}
+    model = GaussianMeanModel(parameters)
+    model.prepare_fit()
+    result = FitStage().run(model)
+    return ToyEngine(parameters, result, GaussianMeanModel, max_workers=2)
+
+def test_dtype():
+    assert ToyEngine.dtype(["mu"]).names == (
+        "toy", "fval", "valid", "mu", "mu_err", "mu_pull"
+    )
+
+def test_run_columns(engine):
+    toys = engine.run(40, seed=1)
+
+    assert toys.shape == (40,)
+    assert list(toys["toy"]) == list(range(40))
+    assert toys["valid"].all()
+    assert np.allclose(toys["mu_err"], 0.1, rtol=1e-3)
+
+def test_run_pulls(engine):
+    toys = engine.run(40, seed=1)
+    truth = engine.result.values["mu"]
+
+    assert np.allclose(toys["mu_pull"], (toys["mu"] - truth)/toys["mu_err"])
+    assert abs(toys["mu_pull"].mean()) < 0.5
+    assert 0.6 < toys["mu_pull"].std() < 1.4
+
+def test_run_is_reproducible(engine):
+    assert np.array_equal(engine.run(4, seed=3), engine.run(4, seed=3))
+
+def test_run_with_signal_peak_model_on_cpu():
+    rng = np.random.default_rng(0)
+    massbins = np.linspace(5180., 5380., 2000)
+    mydat = np.concatenate((
+        rng.normal(5365., 7., 300), rng.uniform(5180., 5380., 700)
+    ))
+    parameters = {
+        "mydat": mydat,
+        "n_dat": len(mydat),
+        "d_m": massbins[1] - massbins[0],
+        "m_max": massbins[-1],
+        "m_min": massbins[0],
+        "massbins": massbins
+    }
+    model = SignalPeakModel(parameters, backend="numpy")
+    model.prepare_fit()
+    result = FitStage().run(model)
+
+    toys = ToyEngine(
+        parameters, result, SignalPeakModel, max_workers=2, 
+        model_kwargs=model.init_kwargs
+    ).run(2, seed=0)
+
+    assert toys.shape == (2,)
+    assert np.isfinite(toys["fval"]).all()
+    assert np.isfinite(toys["Ns_pull"]).all()
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from ipanema.config.config import CONFIG
+from ipanema.fit.worker_pool import ModelWorkerPool, worker_model
+from ipanema.model.implementations.signal_peak_model import SignalPeakModel
+
+def signal_peak_parameters():
+    rng = np.random.default_rng(0)
+    massbins = np.linspace(5180., 5380., 2000)
+    mydat = np.concatenate((
+        rng.normal(5365., 7., 300), rng.uniform(5180., 5380., 700)
+    ))
+    return {
+        "mydat": mydat,
+        "n_dat": len(mydat),
+        "d_m": massbins[1] - massbins[0],
+        "m_max": massbins[-1],
+        "m_min": massbins[0],
+        "massbins": massbins
+    }
+
+def _describe_worker_model(_):
+    model = worker_model()
+    return (
+        model.init_kwargs, 
+        model.fit_manager.fcn(np.array(model.fit_manager.values))
+    )
+
+def run_in_pool(model, **kwargs):
+    values = {
+        name: float(model.fit_manager.values[name]) 
+        for name in model.fit_manager.parameters
+    }
+    with ModelWorkerPool(
+        model.parameters, values, SignalPeakModel, 1, **kwargs
+    ) as pool:
+        return pool.map(_describe_worker_model, [0])[0]
+
+def test_workers_rebuild_model_with_its_kwargs():
+    model = SignalPeakModel(
+        signal_peak_parameters(), backend="numpy", precision="mixed"
+    )
+    model.prepare_fit()
+
+    kwargs, fval = run_in_pool(model, model_kwargs=model.init_kwargs)
+
+    assert kwargs == {"backend": "numpy", "precision": "mixed"}
+    assert fval == pytest.approx(
+        model.fit_manager.fcn(np.array(model.fit_manager.values))
+    )
+
+def test_workers_see_runtime_config(monkeypatch):
+    monkeypatch.setitem(CONFIG, "backend", "numpy")
+    model = SignalPeakModel(signal_peak_parameters())
+    model.prepare_fit()
+
+    kwargs, _ = run_in_pool(model)
+
+    assert kwargs["backend"] == "numpy"
@@ -0,0 +1,67 @@
+import gc
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import pickle
+import numpy as np
+import pytest
+
+from ipanema.input import SharedDataset
+
+@pytest.fixture
+def dataset():
+    shared = SharedDataset({
+        "mydat": np.arange(100_000, dtype=np.float64),
+        "massbins": np.linspace(0., 1., 11, dtype=np.float32),
+        "n_dat": 100_000,
+        "label": "test"
+    })
+    yield shared
+    shared.unlink()
+
+def _sum_in_worker(shared):
+    return float(shared["mydat"].sum()), shared["n_dat"]
+
+def test_behaves_as_parameters_dict(dataset):
+    assert set(dataset) == {"mydat", "massbins", "n_dat", "label"}
+    assert len(dataset) == 4
+    assert dataset["n_dat"] == 100_000
+    assert dataset["massbins"].dtype == np.float32
+    assert np.array_equal(dataset["mydat"], np.arange(100_000))
+    assert dict(dataset)["label"] == "test"
+
+def test_arrays_are_read_only(dataset):
+    with pytest.raises(ValueError):
+        dataset["mydat"][0] = 1.
+
+def test_pickle_does_not_copy_data(dataset):
+    payload = pickle.dumps(dataset)
+    assert len(payload) < 1024
+
+    attached = pickle.loads(payload)
+    assert not attached.owner
+    assert np.array_equal(attached["mydat"], dataset["mydat"])
+    attached.close()
+
+def test_worker_processes_attach(dataset):
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(2) as pool:
+        results = pool.map(_sum_in_worker, [dataset] * 2)
+
+    assert results == [(float(np.arange(100_000).sum()), 100_000)] * 2
+
+def test_unlink_only_by_owner(dataset):
+    attached = pickle.loads(pickle.dumps(dataset))
+    attached.unlink()
+
+    assert dataset.owner
+    assert dataset["mydat"][10] == 10.
+    attached.close()
+
+def test_unreferenced_dataset_is_released():
+    shared = SharedDataset({"mydat": np.arange(10.)})
+    name = shared.__reduce__()[1][0]["mydat"][0]
+    del shared
+    gc.collect()
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from ipanema.config.config import CONFIG
+from ipanema.input.implementations.synthetic_peak_input import (
+    SyntheticPeakInput
+)
+
+def test_generate_schema():
+    params = SyntheticPeakInput.generate(1000, seed=1)
+
+    assert set(params) == {
+        "mydat", "n_dat", "d_m", "m_max", "m_min", "massbins"
+    }
+    assert params["n_dat"] == len(params["mydat"]) == 1000
+    assert params["d_m"] == pytest.approx(
+        params["massbins"][1] - params["massbins"][0]
+    )
+    assert params["m_min"] <= params["mydat"].min()
+    assert params["mydat"].max() <= params["m_max"]
+
+def test_generate_is_reproducible():
+    first = SyntheticPeakInput.generate(5000, seed=3, chunk_size=1000)
+    second = SyntheticPeakInput.generate(5000, seed=3, chunk_size=1000)
+
+    assert np.array_equal(first["mydat"], second["mydat"])
+
+def test_signal_fraction():
+    mydat = SyntheticPeakInput.generate(
+        200_000, signal_fraction=0.4, seed=0, chunk_size=30_000
+    )["mydat"]
+    # Background is nearly flat, so the peak window holds mostly signal
+    mu, sigma = 5365., 7.
+    in_peak = np.mean(np.abs(mydat - mu) < 3*sigma)
+    assert 0.4 < in_peak < 0.5
+
+def test_generate_streams_to_memmap(tmp_path):
+    path = tmp_path / "events.npy"
+    params = SyntheticPeakInput.generate(
+        2500, seed=2, chunk_size=1000, path=path
+    )
+    in_memory = SyntheticPeakInput.generate(2500, seed=2, chunk_size=1000)
+
+    assert isinstance(params["mydat"], np.memmap)
+    assert np.array_equal(params["mydat"], in_memory["mydat"])
+    assert np.array_equal(np.load(path), in_memory["mydat"])
+
+@pytest.mark.parametrize("kwargs", [
+    {"n_events": 0},
+    {"chunk_size": 0},
+    {"signal_fraction": 1.5},
+])
+def test_generate_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        SyntheticPeakInput.generate(**kwargs)
+
+def test_get_params_reads_config(monkeypatch):
+    monkeypatch.setitem(CONFIG, "synthetic_input", {"n_events": 123, "seed": 0})
+    assert SyntheticPeakInput.get_params()["n_dat"] == 123
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from iminuit import Minuit
+from ipanema.model import FcnProfiler, ModelPlugin
+
+class QuadraticModel(ModelPlugin):
+    def prepare_fit(self):
+        self.fit_manager = Minuit(
+            self.wrap_fcn(lambda x, y: (x - 1)**2 + (y + 2)**2), x=0, y=0
+        )
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        FcnProfiler(0)
+
+def test_ring_buffer_keeps_last_calls():
+    profiler = FcnProfiler(capacity=3)
+    for i in range(5):
+        profiler((float(i), 0.), float(i), 1e-3)
+
+    trace = profiler.trace()
+    assert profiler.calls == 5
+    assert np.array_equal(trace["values"], [2., 3., 4.])
+    assert np.array_equal(trace["parameters"][:, 0], [2., 3., 4.])
+
+def test_array_call_arguments():
+    profiler = FcnProfiler()
+    profiler((np.array([1., 2., 3.]),), 0., 1e-3)
+
+    assert profiler.trace()["parameters"].shape == (1, 3)
+
+def test_call_pattern():
+    profiler = FcnProfiler(names=["x", "y"])
+    for point in [(0., 0.), (0., 0.), (1., 0.), (1., 1.), (2., 2.)]:
+        profiler(point, 0., 1e-3)
+
+    pattern = profiler.call_pattern()
+    assert pattern["calls"] == 4
+    assert pattern["repeated"] == 1
+    assert pattern["single_parameter"] == 2
+    assert pattern["multi_parameter"] == 1
+    assert pattern["single_moves"] == {"x": 1, "y": 1}
+
+def test_latency_histogram_counts_every_call():
+    profiler = FcnProfiler()
+    for seconds in (1e-4, 1e-3, 1e-2):
+        profiler((0.,), 0., seconds)
+
+    counts, edges = profiler.latency_histogram(bins=10)
+    assert counts.sum() == 3
+    assert len(edges) == 11
+
+def test_profiles_a_fit_and_saves_trace(tmp_path):
+    model = QuadraticModel({})
+    model.prepare_fit()
+    profiler = FcnProfiler(names=model.fit_manager.parameters)
+    model.add_fcn_hook(profiler)
+    model.fit_manager.migrad()
+
+    assert profiler.calls == model.fit_manager.nfcn
+    assert profiler.call_pattern()["single_parameter"] > 0
+
+    path = tmp_path / "trace.npz"
+    profiler.save(path)
+    with np.load(path) as trace:
+        assert list(trace["names"]) == ["x", "y"]
+        assert trace["parameters"].shape == (profiler.calls, 2)
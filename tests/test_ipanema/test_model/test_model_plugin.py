@@ -1,6 +1,8 @@
 import pytest
 from ipanema.model.model_plugin import ModelPlugin
 from types import SimpleNamespace
+import numpy as np
+from iminuit import Minuit
 
 class BasicModel(ModelPlugin):
 
@@ -20,4 +22,41 @@ def test_fit_manager_set_get():
     model = BasicModel({"x": -1})
     test_manager = SimpleNamespace()
     model.fit_manager = test_manager
-    assert model.fit_manager == test_manager
\ No newline at end of file
+    assert model.fit_manager == test_manager
+def test_evaluate_batch_default_loops_fcn():
+    model = BasicModel({})
+    model.fit_manager = Minuit(lambda x, y: (x - 1)**2 + y**2, x=0, y=0)
+    points = np.array([[1., 0.], [0., 0.], [3., 2.]])
+
+    values = model.evaluate_batch(points)
+
+    assert values.shape == (3,)
+    assert np.allclose(values, [0., 1., 8.])
+
+def test_evaluate_batch_single_point():
+    model = BasicModel({})
+    model.fit_manager = Minuit(lambda x: x**2, x=0)
+
+    assert np.allclose(model.evaluate_batch([2.]), [4.])
+
+def test_wrap_fcn_keeps_signature():
+    model = BasicModel({})
+    model.fit_manager = Minuit(
+        model.wrap_fcn(lambda x, y: (x - 1)**2 + y**2), x=0, y=0
+    )
+
+    assert model.fit_manager.parameters == ("x", "y")
+
+def test_fcn_hooks_observe_calls():
+    model = BasicModel({})
+    fcn = model.wrap_fcn(lambda x: x**2)
+    calls = []
+    hook = lambda args, value, seconds: calls.append((args, value))
+
+    fcn(1.)
+    model.add_fcn_hook(hook)
+    fcn(2.)
+    model.remove_fcn_hook(hook)
+    fcn(3.)
+
+    assert calls == [((2.,), 4.)]
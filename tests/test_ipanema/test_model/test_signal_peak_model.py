@@ -0,0 +1,155 @@
+import numpy as np
+import pytest
+from ipanema.model.implementations._support_files.ipatia_host import (
+    log_ap_ipatia
+)
+from ipanema.model.implementations.signal_peak_model import SignalPeakModel
+from sdk.cuda_manager.implementations.numpy_cuda_manager import (
+    NumpyCudaManager
+)
+
+SHAPE = dict(
+    mu=5365., sigma=7., l=-3., beta=0., a=3., n=1., a2=6., n2=1.
+)
+
+def build_model(precision=None, n_bins=2000):
+    rng = np.random.default_rng(0)
+    massbins = np.linspace(5180., 5380., n_bins)
+    mydat = np.concatenate((
+        rng.normal(5365., 7., 300), rng.uniform(5180., 5380., 700)
+    ))
+    model = SignalPeakModel({
+        "mydat": mydat,
+        "n_dat": len(mydat),
+        "d_m": massbins[1] - massbins[0],
+        "m_max": massbins[-1],
+        "m_min": massbins[0],
+        "massbins": massbins
+    }, backend="numpy", precision=precision)
+    model.prepare_fit()
+    return model
+
+@pytest.fixture
+def model():
+    return build_model()
+
+def test_unsupported_backend():
+    with pytest.raises(ValueError):
+        SignalPeakModel({}, backend="opencl")
+
+def test_unsupported_precision():
+    with pytest.raises(ValueError):
+        SignalPeakModel({}, backend="numpy", precision="half")
+
+def test_log_ap_ipatia_is_continuous_at_tail_boundaries():
+    sigma, a, a2 = SHAPE["sigma"], SHAPE["a"], SHAPE["a2"]
+    for boundary in (SHAPE["mu"] - a*sigma, SHAPE["mu"] + a2*sigma):
+        values = log_ap_ipatia(
+            np.array([boundary - 1e-6, boundary + 1e-6]), **SHAPE
+        )
+        assert values[0] == pytest.approx(values[1], abs=1e-5)
+
+def test_log_ap_ipatia_broadcasts_parameter_sets():
+    x = np.linspace(5300., 5400., 7)
+    sigmas = np.array([[6.], [8.]])
+    batch = log_ap_ipatia(x[None, :], **{**SHAPE, "sigma": sigmas})
+
+    assert batch.shape == (2, 7)
+    assert np.allclose(batch[1], log_ap_ipatia(x, **{**SHAPE, "sigma": 8.}))
+
+def test_evaluate_batch_matches_fcn_on_cpu(model):
+    start = np.array(model.fit_manager.values)
+    points = np.vstack([start, start*1.001])
+
+    expected = [model.fit_manager.fcn(point) for point in points]
+    assert np.allclose(model.evaluate_batch(points), expected)
+
+def test_fcn_specializes_kernels_for_fixed_tails(model, monkeypatch):
+    launches = []
+    run_program = model.cuda_manager.run_program
+    def recording_run_program(*args, **kwargs):
+        launches.append(kwargs.get("constants"))
+        return run_program(*args, **kwargs)
+    monkeypatch.setattr(
+        model.cuda_manager, "run_program", recording_run_program
+    )
+    model.fit_manager.fixed["n2"] = False
+
+    model.fit_manager.fcn(np.array(model.fit_manager.values))
+
+    assert launches == 2*[{
+        "IPATIA_FIXED_A": 3., "IPATIA_FIXED_N": 1., "IPATIA_FIXED_A2": 6.
+    }]
+
+def test_mixed_precision_fcn_matches_double(model):
+    mixed = build_model("mixed")
+    values = np.array(model.fit_manager.values)
+
+    assert mixed.fit_manager.fcn(values) == pytest.approx(
+        model.fit_manager.fcn(values), rel=1e-6
+    )
+
+@pytest.mark.parametrize("precision, dtypes", [
+    ("double", [np.float64]),
+    ("mixed", [np.float32]),
+    ("validate", [np.float64, np.float32])
+])
+def test_fcn_uploads_events_once_per_precision(
+        monkeypatch, precision, dtypes
+    ):
+    uploads = []
+    to_device = NumpyCudaManager.to_device
+    def recording_to_device(self, array):
+        uploads.append(array.dtype)
+        return to_device(self, array)
+    monkeypatch.setattr(NumpyCudaManager, "to_device", recording_to_device)
+    model = build_model(precision)
+
+    values = np.array(model.fit_manager.values)
+    model.fit_manager.fcn(values)
+    model.fit_manager.fcn(values*1.001)
+
+    assert uploads == dtypes
+
+def test_validation_records_mixed_precision_difference(model):
+    mixed = build_model("mixed")
+    validated = build_model("validate")
+    values = np.array(model.fit_manager.values)
+
+    assert validated.precision_difference == 0.
+    assert validated.fit_manager.fcn(values) == mixed.fit_manager.fcn(values)
+    assert validated.precision_difference == pytest.approx(
+        abs(mixed.fit_manager.fcn(values) - model.fit_manager.fcn(values))
+    )
+    assert 0. < validated.precision_difference < 1e-2
+
+def test_normalization_matches_fine_integral(model):
+    fine = np.linspace(5180., 5380., 2_000_001)
+    density = np.exp(log_ap_ipatia(fine, **SHAPE))
+    expected = np.sum(0.5*(density[1:] + density[:-1]))*(fine[1] - fine[0])
+
+    value = model.normalization.integrate(
+        lambda x: np.exp(log_ap_ipatia(x, **SHAPE)), 
+        model._normalization_breakpoints(
+            SHAPE["mu"], SHAPE["sigma"], SHAPE["a"], SHAPE["a2"]
+        )
+    )
+    assert value == pytest.approx(expected, rel=1e-8)
+
+def test_fcn_does_not_depend_on_massbins(model):
+    values = np.array(model.fit_manager.values)
+
+    assert build_model(n_bins=50).fit_manager.fcn(values) == pytest.approx(
+        model.fit_manager.fcn(values), rel=1e-12
+    )
+
+def test_normalization_is_cached_by_shape(model):
+    values = np.array(model.fit_manager.values)
+    model.fit_manager.fcn(values)
+    values[list(model.fit_manager.parameters).index("k")] *= 0.5
+    model.fit_manager.fcn(values)
+
+    assert (model.normalization.hits, model.normalization.misses) == (1, 1)
+    assert np.allclose(
+        model.evaluate_batch(values), model.fit_manager.fcn(values)
+    )
@@ -1,17 +1,34 @@
 import pytest
 from unittest.mock import MagicMock
 from iminuit import Minuit
+from ipanema.fit import FitResult
 from ipanema.model.model_plugin import ModelPlugin
 from ipanema.output.implementations.command_line_output import CommandLineOutput
 
-def test_generate_results_calls_fit_manager_methods():
+@pytest.fixture
+def fit_result():
+    minuit = Minuit(lambda x: (x - 3)**2, x=1)
+    minuit.migrad()
+    minuit.hesse()
+    return FitResult.from_minuit(minuit, ("migrad", "hesse"))
+
+def test_generate_results_does_not_fit(fit_result):
 
     fit_manager_mock = MagicMock(Minuit)
     model_plugin_mock = MagicMock(ModelPlugin)
     model_plugin_mock.fit_manager = fit_manager_mock
 
     output = CommandLineOutput()
-    output.generate_results(model_plugin_mock)
+    output.generate_results(model_plugin_mock, fit_result)
+
+    fit_manager_mock.migrad.assert_not_called()
+    fit_manager_mock.hesse.assert_not_called()
+
+def test_generate_results_prints_values(fit_result, capsys):
+    output = CommandLineOutput()
+    output.generate_results(MagicMock(ModelPlugin), fit_result)
 
-    fit_manager_mock.migrad.assert_called_once()
-    fit_manager_mock.hesse.assert_called_once()
\ No newline at end of file
+    captured = capsys.readouterr()
+    assert "Fit Manager Values" in captured.out
+    assert "Fit Manager Error" in captured.out
+    assert "Minos" not in captured.out
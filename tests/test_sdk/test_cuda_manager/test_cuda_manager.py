@@ -1,7 +1,169 @@
 import pytest
 
 from sdk.cuda_manager.abstract_cuda_manager import CudaManager
+from sdk.cuda_manager.instrumentation import (
+    EventKind,
+    InstrumentationListener,
+    KernelEvent
+)
 
 def test_CudaManager_cannot_be_instantiated():
     with pytest.raises(TypeError):
-        CudaManager()
\ No newline at end of file
+        CudaManager()
+
+class DummyCudaManager(CudaManager):
+    def run_program(self, func_name, outputs_idx, outputs_details, block, 
+                    grid, *args, size=None):
+        if self.instrumented:
+            self._emit(EventKind.LAUNCH, func_name, 0.5)
+        return []
+
+    def single_operation(self, func_name, *args):
+        pass
+
+    def reduction_operation(self, op_name, array):
+        pass
+
+    def to_device(self, array):
+        return array
+
+    def evaluate(self, expression):
+        pass
+
+    def histogram(self, data, n_bins, low, high, weights=None):
+        pass
+
+    def scan(self, array, exclusive=False):
+        pass
+
+    def sort(self, array):
+        pass
+
+class RecordingListener(InstrumentationListener):
+    def __init__(self):
+        self.events = []
+
+    def on_event(self, event):
+        self.events.append(event)
+
+
+##################
+# instrumentation
+##################
+
+
+def test_not_instrumented_without_listeners():
+    assert not DummyCudaManager().instrumented
+
+def test_listener_receives_events():
+    manager = DummyCudaManager()
+    listener = RecordingListener()
+    manager.add_listener(listener)
+
+    manager.run_program("kernel", [], {}, (1,1,1), (1,1))
+
+    assert manager.instrumented
+    assert listener.events == [KernelEvent(EventKind.LAUNCH, "kernel", 0.5)]
+
+def test_removed_listener_receives_nothing():
+    manager = DummyCudaManager()
+    listener = RecordingListener()
+    manager.add_listener(listener)
+    manager.remove_listener(listener)
+
+    manager.run_program("kernel", [], {}, (1,1,1), (1,1))
+
+    assert not manager.instrumented
+    assert listener.events == []
+
+
+####################
+# launch dimensions
+####################
+
+
+@pytest.mark.parametrize("size, block, expected", [
+    (1000, (256, 1, 1), (4, 1)),
+    (1024, (256, 1, 1), (4, 1)),
+    ((1000, 8), (512, 1, 1), (2, 8)),
+    (0, (256, 1, 1), (1, 1)),
+])
+def test_grid_for(size, block, expected):
+    assert CudaManager.grid_for(size, block) == expected
+
+def test_autotuning_disabled_by_default():
+    assert DummyCudaManager().tuning_cache is None
+
+def test_enable_autotuning_with_path(tmp_path):
+    manager = DummyCudaManager()
+    manager.enable_autotuning(tmp_path / "tuning.json")
+    assert manager.tuning_cache.path == tmp_path / "tuning.json"
+
+
+################
+# kernel_source
+################
+
+
+@pytest.fixture
+def fragments():
+    manager = DummyCudaManager()
+    manager.add_code_fragment(
+        "common", "#include <math.h>\n__device__ double sq(double x);"
+    )
+    manager.add_code_fragment(
+        "ipatia", "#include <math.h>\n__global__ void Ipatia(double *x) {}",
+        depends=["common"]
+    )
+    manager.add_code_fragment(
+        "rotate", "__global__ void transform_f32(float *x) {}"
+    )
+    return manager
+
+def test_kernel_source_only_includes_dependencies(fragments):
+    group, source = fragments.kernel_source("Ipatia")
+
+    assert group == ("common", "ipatia")
+    assert source.count("#include <math.h>") == 1
+    assert source.index("sq") < source.index("Ipatia")
+    assert "transform_f32" not in source
+
+def test_kernel_source_is_cached_until_fragments_change(fragments):
+    assert fragments.kernel_source("Ipatia") is fragments.kernel_source(
+        "Ipatia"
+    )
+    fragments.add_code_fragment(
+        "common", "__device__ double sq(double x) { return x*x; }"
+    )
+    assert "return x*x" in fragments.kernel_source("Ipatia")[1]
+
+def test_kernel_source_of_unexported_kernel_uses_every_fragment(fragments):
+    group, _ = fragments.kernel_source("missing")
+    assert group == ("common", "ipatia", "rotate")
+
+def test_kernel_source_missing_dependency():
+    manager = DummyCudaManager()
+    manager.add_code_fragment(
+        "a", "__global__ void kernel(double *x) {}", depends=["b"]
+    )
+    with pytest.raises(LookupError):
+        manager.kernel_source("kernel")
+
+def test_kernel_source_circular_dependencies():
+    manager = DummyCudaManager()
+    manager.add_code_fragment(
+        "a", "__global__ void kernel(double *x) {}", depends=["b"]
+    )
+    manager.add_code_fragment("b", "", depends=["a"])
+    with pytest.raises(ValueError):
+        manager.kernel_source("kernel")
+
+def test_kernel_source_variants_by_constants(fragments):
+    _, plain = fragments.kernel_source("Ipatia")
+    _, variant = fragments.kernel_source("Ipatia", {"IPATIA_FIXED_N": 1})
+
+    assert variant.startswith("#define IPATIA_FIXED_N 1.0\n")
+    assert variant.endswith(plain)
+    assert fragments.kernel_source(
+        "Ipatia", {"IPATIA_FIXED_N": 1.}
+    )[1] is variant
@@ -0,0 +1,51 @@
+import pytest
+
+from sdk.cuda_manager.cuda_program import CudaProgram
+
+def test_includes_are_separated():
+    program = CudaProgram(
+        "#include <math.h>\n__global__ void kernel(double *x) {}"
+    )
+    assert program.includes == ["#include <math.h>"]
+    assert program.functions == "__global__ void kernel(double *x) {}"
+
+
+
+##########################
+# exports and dependencies
+##########################
+
+
+def test_exports_are_parsed_from_kernels():
+    program = CudaProgram(
+        "__device__ double f(double x) { return x; }\n"
+        "__global__ void first(double *x) {}\n"
+        "__global__  void second (double *x) {}\n"
+    )
+    assert program.exports == ["first", "second"]
+    assert program.depends == []
+
+def test_declared_exports_and_dependencies():
+    program = CudaProgram(
+        "KERNEL(generated)", exports=["generated"], depends=["macros"]
+    )
+    assert program.exports == ["generated"]
+    assert program.depends == ["macros"]
+
+
+##########
+# defines
+##########
+
+
+def test_defines_are_sorted_and_exact():
+    assert CudaProgram.defines({"B": 0.1, "A": 3}) == [
+        "#define A 3.0", "#define B 0.1"
+    ]
+
+@pytest.mark.parametrize("constants", [
+    {"1A": 1.}, {"A B": 1.}, {"A": float("nan")}, {"A": float("inf")}
+])
+def test_defines_rejects_invalid_constants(constants):
+    with pytest.raises(ValueError):
+        CudaProgram.defines(constants)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from sdk.cuda_manager.expression import (
+    ArrayInput,
+    Reduction,
+    Scalar,
+    exp,
+    log,
+    lower
+)
+
+def test_operators_build_lazy_graph():
+    x = ArrayInput(np.arange(3.))
+    expression = (2*exp(x) - 1).sum()
+
+    assert isinstance(expression, Reduction)
+    assert expression.kind is Reduction.Kind.SUM
+
+def test_lower_names_inputs_in_order():
+    x, y = ArrayInput(np.ones(3)), ArrayInput(np.ones(3, np.float32))
+    lowered = lower(log(x*2.5 + y) + x)
+
+    assert lowered.cuda_code == "(log(((a0[i] * s0) + a1[i])) + a0[i])"
+    assert lowered.numpy_code == "(np.log(((a0 * s0) + a1)) + a0)"
+    assert lowered.scalars == (2.5,)
+    assert lowered.cuda_arguments() == (
+        "const double *a0, const float *a1, double s0"
+    )
+
+def test_signature_ignores_values_but_not_dtypes():
+    def signature(x, k):
+        return lower((exp(k*ArrayInput(x))).sum()).signature
+
+    assert signature(np.ones(3), 1.) == signature(np.zeros(5), 2.)
+    assert signature(np.ones(3), 1.) != signature(np.ones(3, np.float32), 1.)
+
+def test_scalar_operands_are_wrapped():
+    lowered = lower(ArrayInput(np.ones(2)) + np.float32(3))
+    assert lowered.scalars == (3.,)
+
+@pytest.mark.parametrize("build", [
+    lambda x: x.sum() + 1,
+    lambda x: Scalar(1.) + 2,
+    lambda x: x + ArrayInput(np.ones(4)),
+    lambda x: x + ArrayInput(np.ones(3, np.complex128)),
+])
+def test_lower_rejects_invalid_expressions(build):
+    with pytest.raises(ValueError):
+        lower(build(ArrayInput(np.ones(3))))
+
+def test_arrays_must_be_wrapped():
+    with pytest.raises(TypeError):
+        ArrayInput(np.ones(3)) + np.ones(3)
+
+def test_inputs_must_be_one_dimensional():
+    with pytest.raises(ValueError):
+        ArrayInput(np.ones((2, 2)))
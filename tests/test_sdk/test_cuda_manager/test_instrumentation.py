@@ -0,0 +1,39 @@
+import pytest
+
+from sdk.cuda_manager.instrumentation import (
+    EventKind,
+    KernelEvent,
+    StatsCollector
+)
+
+@pytest.fixture
+def collector():
+    collector = StatsCollector()
+    collector.on_event(KernelEvent(EventKind.LAUNCH, "ipatia", 0.002))
+    collector.on_event(KernelEvent(EventKind.LAUNCH, "ipatia", 0.004))
+    collector.on_event(KernelEvent(EventKind.HTOD, "ipatia", 0.001, 2**20))
+    collector.on_event(KernelEvent(EventKind.COMPILE, "sum", 0.5))
+    return collector
+
+def test_stats_aggregate_per_kernel_and_kind(collector):
+    stats = collector.stats
+
+    launch = stats[("ipatia", EventKind.LAUNCH)]
+    assert launch.calls == 2
+    assert launch.seconds == pytest.approx(0.006)
+    assert stats[("ipatia", EventKind.HTOD)].nbytes == 2**20
+
+def test_stats_is_a_copy(collector):
+    collector.stats[("sum", EventKind.COMPILE)].calls = 10
+    assert collector.stats[("sum", EventKind.COMPILE)].calls == 1
+
+def test_summary_sorted_by_total_time(collector):
+    lines = collector.summary().splitlines()
+
+    assert len(lines) == 2 + 3
+    assert lines[2].startswith("sum")
+    assert "launch" in lines[3]
+
+def test_reset(collector):
+    collector.reset()
+    assert collector.stats == {}
@@ -0,0 +1,24 @@
+import json
+
+from sdk.cuda_manager.launch_tuning import LaunchTuningCache
+
+def test_key_buckets_sizes_by_power_of_two():
+    key = LaunchTuningCache.key("GPU", "Ipatia", 1000)
+    assert key == LaunchTuningCache.key("GPU", "Ipatia", 600)
+    assert key != LaunchTuningCache.key("GPU", "Ipatia", 1100)
+    assert key != LaunchTuningCache.key("GPU", "logIpatia", 1000)
+
+def test_get_missing_entry():
+    assert LaunchTuningCache().get("GPU|Ipatia|10") is None
+
+def test_store_in_memory():
+    cache = LaunchTuningCache()
+    cache.store("GPU|Ipatia|10", (128, 1, 1))
+    assert cache.get("GPU|Ipatia|10") == (128, 1, 1)
+
+def test_store_persists_entries(tmp_path):
+    path = tmp_path / "tuning" / "launch.json"
+    LaunchTuningCache(path).store("GPU|Ipatia|10", (128, 1, 1))
+
+    assert json.loads(path.read_text()) == {"GPU|Ipatia|10": [128, 1, 1]}
+    assert LaunchTuningCache(path).get("GPU|Ipatia|10") == (128, 1, 1)
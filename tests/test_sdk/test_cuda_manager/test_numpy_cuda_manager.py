@@ -0,0 +1,187 @@
+import numpy as np
+import pytest
+
+from sdk.cuda_manager.implementations.numpy_cuda_manager import (
+    NumpyCudaManager
+)
+from sdk.cuda_manager.expression import exp, log
+from sdk.cuda_manager.instrumentation import EventKind, StatsCollector
+
+def square(in_, out, n):
+    out[:n] = in_[:n]**2
+
+@pytest.fixture
+def manager():
+    manager = NumpyCudaManager()
+    manager.add_host_kernel("square", square)
+    return manager
+
+
+##############
+# run_program
+##############
+
+
+def test_run_program_fills_outputs(manager):
+    array = np.arange(4.)
+    outputs = manager.run_program(
+        "square", [1], {1: ((4,), np.float64)}, (256,1,1), (1,1),
+        array, np.empty(4), 4
+    )
+
+    assert len(outputs) == 1
+    assert np.array_equal(outputs[0], array**2)
+
+def test_run_program_with_problem_size(manager):
+    array = np.arange(4.)
+    outputs = manager.run_program(
+        "square", [1], {1: ((4,), np.float64)}, None, None,
+        array, np.empty(4), 4, size=4
+    )
+
+    assert np.array_equal(outputs[0], array**2)
+
+def test_run_program_keeps_outputs_on_device(manager):
+    events = manager.to_device(np.arange(4.))
+    outputs = manager.run_program(
+        "square", [1], {1: ((4,), np.float64)}, None, None,
+        events, np.empty(4), 4, size=4, keep_on_device=True
+    )
+
+    assert np.array_equal(outputs[0], np.arange(4.)**2)
+    assert manager.evaluate(manager.array(outputs[0]).sum()) == 14.
+
+def test_run_program_without_host_kernel(manager):
+    with pytest.raises(AttributeError):
+        manager.run_program("missing", [], {}, (1,1,1), (1,1))
+
+def test_run_program_instrumented(manager):
+    collector = StatsCollector()
+    manager.add_listener(collector)
+    manager.run_program(
+        "square", [1], {1: ((4,), np.float64)}, (256,1,1), (1,1),
+        np.arange(4.), np.empty(4), 4
+    )
+
+    stats = collector.stats
+    assert stats[("square", EventKind.LAUNCH)].calls == 1
+    assert stats[("square", EventKind.ALLOC)].nbytes == 32
+
+
+#########################################
+# single_operation / reduction_operation
+#########################################
+
+
+def test_single_operation(manager):
+    assert np.allclose(manager.single_operation("exp", np.zeros(3)), 1.)
+
+def test_single_operation_unknown(manager):
+    with pytest.raises(AttributeError):
+        manager.single_operation("not_a_function", np.zeros(3))
+
+@pytest.mark.parametrize("op_name,expected", [
+    ("sum", 6.), ("max", 3.), ("min", 1.)
+])
+def test_reduction_operation(manager, op_name, expected):
+    assert manager.reduction_operation(op_name, [1., 2., 3.]) == expected
+
+
+###########
+# evaluate
+###########
+
+
+def test_evaluate_elementwise(manager):
+    x = np.linspace(1., 2., 100_000)
+    result = manager.evaluate(log(2*manager.array(x)) + x.size)
+
+    assert np.allclose(result, np.log(2*x) + x.size)
+
+@pytest.mark.parametrize("reduce, expected", [
+    (lambda e: e.sum(), np.sum), 
+    (lambda e: e.max(), np.max), 
+    (lambda e: e.min(), np.min)
+])
+def test_evaluate_reductions(manager, reduce, expected):
+    x = np.random.default_rng(0).random(50_000)
+    y = x.astype(np.float32)
+    expression = reduce(exp(-manager.array(x)) * manager.array(y))
+
+    assert manager.evaluate(expression) == pytest.approx(
+        expected(np.exp(-x)*y)
+    )
+
+def test_evaluate_promotes_single_precision_inputs(manager):
+    x = np.full(10, 1e-4, dtype=np.float32)
+    result = manager.evaluate(manager.array(x) + 1.)
+
+    assert result.dtype == np.float64
+    assert np.all(result == np.float64(np.float32(1e-4)) + 1.)
+
+def test_evaluate_sums_chunks_exactly(manager):
+    manager.EXPRESSION_CHUNK = 1
+    x = np.array([1e16, 1., -1e16, 1.])
+
+    assert manager.evaluate(manager.array(x).sum()) == 2.
+
+def test_evaluate_reuses_generated_code(manager):
+    collector = StatsCollector()
+    manager.add_listener(collector)
+    for k in (1., 2.):
+        manager.evaluate((k*manager.array(np.ones(3))).sum())
+
+    assert list(collector.stats.values())[0].calls == 2
+    assert len(collector.stats) == 1
+
+
+#############
+# primitives
+#############
+
+
+def test_map_reduce(manager):
+    x = np.arange(10.)
+    assert manager.map_reduce((manager.array(x) - 4)**2, "max") == 25.
+    assert manager.map_reduce(manager.array(x)) == 45.
+
+def test_weighted_sum(manager):
+    values, weights = np.arange(4.), np.array([1., 0.5, 0., 2.])
+    assert manager.weighted_sum(values, weights) == pytest.approx(6.5)
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_histogram_matches_numpy(manager, weighted):
+    rng = np.random.default_rng(0)
+    data = np.append(rng.normal(0., 1., 100_000), [-3., 3., 5., np.nan])
+    weights = rng.random(len(data)) if weighted else None
+
+    counts = manager.histogram(data, 30, -3., 3., weights)
+
+    expected, _ = np.histogram(
+        data[~np.isnan(data)], 30, (-3., 3.), 
+        weights=None if weights is None else weights[~np.isnan(data)]
+    )
+    assert np.allclose(counts, expected)
+
+def test_histogram_invalid_binning(manager):
+    with pytest.raises(ValueError):
+        manager.histogram(np.ones(3), 0, 0., 1.)
+    with pytest.raises(ValueError):
+        manager.histogram(np.ones(3), 10, 1., 1.)
+
+@pytest.mark.parametrize("exclusive, expected", [
+    (False, [1, 3, 6, 10]), (True, [0, 1, 3, 6])
+])
+def test_scan(manager, exclusive, expected):
+    result = manager.scan(np.array([1, 2, 3, 4]), exclusive)
+    assert result.tolist() == expected
+
+def test_sort(manager):
+    data = np.random.default_rng(0).random(1001)
+    assert np.array_equal(manager.sort(data), np.sort(data))
+
+def test_sort_empty(manager):
+    result = manager.sort(np.array([], dtype=np.float32))
+
+    assert result.shape == (0,)
+    assert result.dtype == np.float32
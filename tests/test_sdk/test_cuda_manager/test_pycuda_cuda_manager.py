@@ -40,6 +40,21 @@ def test_process_argument_scalars(arg, expected_type):
     assert isinstance(gpu_args[0], expected_type)
 
 
+
+############
+# to_device
+############
+
+
+def test_to_device_uploads_once():
+    manager = FakeCudaManager()
+    array = np.arange(3.)
+
+    with mock.patch("pycuda.gpuarray.to_gpu") as mocked_to_gpu:
+        device = manager.to_device(array)
+        mocked_to_gpu.assert_called_once()
+        assert device is mocked_to_gpu.return_value
+
 ###################
 # single_operation
 ###################
@@ -81,4 +96,21 @@ def test_reduction_operation_mocks_gpu(to_gpu_mock, sum_mock):
     assert result == 42.0
     to_gpu_mock.assert_called_once()
     sum_mock.assert_called_once_with(gpu_array_mock)
-    result_mock.get.assert_called_once()
\ No newline at end of file
+    result_mock.get.assert_called_once()
+
+#######
+# sort
+#######
+
+
+@mock.patch("pycuda.driver.memcpy_dtod")
+@mock.patch("pycuda.gpuarray.to_gpu")
+def test_sort_empty_skips_gpu(to_gpu_mock, memcpy_mock):
+    manager = FakeCudaManager()
+    to_gpu_mock.return_value = mock.Mock(size=0, dtype=np.dtype(np.float32))
+
+    result = manager.sort(np.array([], dtype=np.float32))
+
+    assert result.shape == (0,)
+    assert result.dtype == np.float32
+    memcpy_mock.assert_not_called()
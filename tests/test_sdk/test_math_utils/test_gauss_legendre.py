@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from sdk.math_utils.integration import GaussLegendreQuadrature
+
+def test_integrates_polynomials_exactly():
+    quadrature = GaussLegendreQuadrature(order=4)
+    value = quadrature.integrate(lambda x: x**7 - 2*x**3 + 1, [-1., 2.])
+
+    assert value == pytest.approx(2**8/8 - 1/8 - (2**4 - 1)/2 + 3.)
+
+def test_breakpoints_handle_kinks():
+    quadrature = GaussLegendreQuadrature(order=8)
+
+    assert quadrature.integrate(np.abs, [-1., 0.5, 0., 2.]) == pytest.approx(
+        2.5
+    )
+
+def test_nodes_of_several_ranges():
+    quadrature = GaussLegendreQuadrature(order=3)
+    nodes, weights = quadrature.nodes([[0., 1., 1.], [0., 1., 3.]])
+
+    assert nodes.shape == weights.shape == (2, 6)
+    assert np.all(weights[0, 3:] == 0.)
+    assert np.allclose(weights.sum(axis=1), [1., 3.])
+
+def test_cache_evicts_least_recently_used():
+    quadrature = GaussLegendreQuadrature(order=2, cache_size=2)
+    calls = []
+    def integrand(x):
+        calls.append(1)
+        return np.ones_like(x)
+
+    for key in ("a", "b", "a", "c", "a", "b"):
+        quadrature.integrate(integrand, [0., 1.], key=key)
+
+    assert len(calls) == 4
+    assert (quadrature.hits, quadrature.misses) == (2, 4)
+
+def test_invalid_order():
+    with pytest.raises(ValueError):
+        GaussLegendreQuadrature(order=0)
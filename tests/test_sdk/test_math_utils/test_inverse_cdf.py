@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from sdk.math_utils.sampling import sample_exponential, sample_from_grid
+
+def test_sample_from_grid_follows_density():
+    rng = np.random.default_rng(0)
+    grid = np.linspace(0., 1., 201)
+    samples = sample_from_grid(grid, 2*grid, 100_000, rng)
+
+    assert samples.min() >= 0. and samples.max() <= 1.
+    # Density 2x has mean 2/3
+    assert samples.mean() == pytest.approx(2/3, abs=5e-3)
+
+def test_sample_from_grid_zero_density_raises():
+    with pytest.raises(ValueError):
+        sample_from_grid(np.arange(3.), np.zeros(3), 10, np.random.default_rng())
+
+@pytest.mark.parametrize("k", [-0.05, 0., 0.02])
+def test_sample_exponential_range(k):
+    rng = np.random.default_rng(1)
+    samples = sample_exponential(k, 5300., 5450., 50_000, rng)
+
+    assert samples.min() >= 5300. and samples.max() <= 5450.
+
+def test_sample_exponential_mean():
+    rng = np.random.default_rng(2)
+    k, low, high = -0.05, 0., 100.
+    samples = sample_exponential(k, low, high, 200_000, rng)
+
+    # Mean of exp(k*x) truncated to [0, L]
+    expected = high*np.exp(k*high)/np.expm1(k*high) - 1/k
+    assert samples.mean() == pytest.approx(expected, rel=1e-2)
@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+from sdk.cuda_manager.implementations.numpy_cuda_manager import (
+    NumpyCudaManager
+)
+from sdk.math_utils.rotate.numpy_rotation_algorithm import (
+    NumpyRotationAlgorithm
+)
+from sdk.math_utils.rotate.rotation_algorithm import RotationAlgorithm
+
+@pytest.fixture(params=["cuda_manager", "numpy"])
+def algorithm(request):
+    if request.param == "numpy":
+        return NumpyRotationAlgorithm()
+    return RotationAlgorithm(NumpyCudaManager())
+
+def test_transform_f32_on_cpu_backend():
+    algorithm = RotationAlgorithm(NumpyCudaManager())
+    rng = np.random.default_rng(0)
+    in_matrix = rng.random((10, 3), dtype=np.float32)
+    t_matrix = rng.random((3, 3), dtype=np.float32)
+
+    out = algorithm.transform_f32(in_matrix.ravel(), t_matrix, 3)
+
+    assert np.allclose(out.reshape(10, 3), in_matrix @ t_matrix.T, atol=1e-5)
+
+@pytest.mark.parametrize("n", [2, 3, 40])
+def test_transform_f32_output(algorithm, n):
+    rng = np.random.default_rng(n)
+    in_matrix = rng.random((25, n), dtype=np.float32)
+    t_matrix = rng.random((n, n), dtype=np.float32)
+
+    out = algorithm.transform_f32(in_matrix, t_matrix, n)
+
+    assert out.shape == (25, n)
+    assert out.dtype == np.float32
+    expected = np.einsum("ij,mj->mi", t_matrix, in_matrix)
+    assert np.allclose(out, expected, rtol=1e-5)
+
+def test_transform_f32_converts_inputs(algorithm):
+    in_matrix = np.arange(6.).reshape(3, 2)
+    t_matrix = np.array([[0., 1.], [1., 0.]])
+
+    out = algorithm.transform_f32(in_matrix, t_matrix, 2)
+
+    assert out.dtype == np.float32
+    assert np.array_equal(out, in_matrix[:, ::-1])
+
+def test_transform_f32_rejects_mismatched_rows(algorithm):
+    with pytest.raises(ValueError):
+        algorithm.transform_f32(
+            np.ones(7, np.float32), np.eye(3, dtype=np.float32), 3
+        )
+
+def test_transform_f32_rejects_mismatched_matrix(algorithm):
+    with pytest.raises(ValueError):
+        algorithm.transform_f32(
+            np.ones((4, 3), np.float32), np.eye(2, dtype=np.float32), 3
+        )
+
+
+##################
+# transform_batch
+##################
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_transform_batch_output(algorithm, dtype):
+    rng = np.random.default_rng(0)
+    in_matrix = rng.random((50, 4)).astype(dtype)
+    t_matrices = rng.random((50, 4, 4)).astype(dtype)
+
+    out = algorithm.transform_batch(in_matrix, t_matrices)
+
+    assert out.shape == (50, 4)
+    assert out.dtype == dtype
+    expected = np.stack([t @ row for t, row in zip(t_matrices, in_matrix)])
+    assert np.allclose(out, expected, rtol=1e-5)
+
+def test_transform_batch_promotes_mixed_precision(algorithm):
+    in_matrix = np.ones((2, 3), dtype=np.float32)
+    t_matrices = np.broadcast_to(np.eye(3), (2, 3, 3))
+
+    out = algorithm.transform_batch(in_matrix, t_matrices)
+
+    assert out.dtype == np.float64
+    assert np.array_equal(out, in_matrix)
+
+def test_transform_batch_rejects_mismatched_shapes(algorithm):
+    with pytest.raises(ValueError):
+        algorithm.transform_batch(np.ones((4, 3)), np.ones((3, 3, 3)))
+
+
+#############
+# stream_f32
+#############
+
+
+def test_stream_f32_matches_transform_f32(algorithm):
+    rng = np.random.default_rng(0)
+    in_matrix = rng.random((1000, 3), dtype=np.float32)
+    t_matrix = rng.random((3, 3), dtype=np.float32)
+    out = np.empty((1000, 3), dtype=np.float32)
+
+    result = algorithm.stream_f32(in_matrix, out, t_matrix, 3, tile_rows=64)
+
+    assert np.shares_memory(result, out)
+    assert np.allclose(out, algorithm.transform_f32(in_matrix, t_matrix, 3))
+
+def test_stream_f32_between_files(algorithm, tmp_path):
+    rng = np.random.default_rng(0)
+    in_matrix = rng.random((777, 4), dtype=np.float32)
+    t_matrix = rng.random((4, 4), dtype=np.float32)
+    np.save(tmp_path / "in.npy", in_matrix.ravel())
+
+    result = algorithm.stream_f32(
+        tmp_path / "in.npy", tmp_path / "out.npy", t_matrix, 4, tile_rows=100
+    )
+
+    assert isinstance(result, np.memmap)
+    assert result.shape == (777, 4)
+    assert np.allclose(
+        np.load(tmp_path / "out.npy"), in_matrix @ t_matrix.T, rtol=1e-5
+    )
+
+def test_stream_f32_rejects_mismatched_output(algorithm):
+    with pytest.raises(ValueError):
+        algorithm.stream_f32(
+            np.ones((4, 3), np.float32), np.empty((3, 3), np.float32),
+            np.eye(3, dtype=np.float32), 3
+        )
+
+@pytest.mark.parametrize("tile_rows", [0, -1])
+def test_stream_f32_rejects_invalid_tiles(algorithm, tile_rows):
+    with pytest.raises(ValueError):
+        algorithm.stream_f32(
+            np.ones((4, 3), np.float32), np.empty((4, 3), np.float32),
+            np.eye(3, dtype=np.float32), 3, tile_rows=tile_rows
+        )
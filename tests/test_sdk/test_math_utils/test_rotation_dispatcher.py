@@ -0,0 +1,94 @@
+import json
+
+import numpy as np
+import pytest
+
+from sdk.cuda_manager.implementations.numpy_cuda_manager import (
+    NumpyCudaManager
+)
+from sdk.math_utils.rotate.numpy_rotation_algorithm import (
+    NumpyRotationAlgorithm
+)
+from sdk.math_utils.rotate.rotation_algorithm import RotationAlgorithm
+from sdk.math_utils.rotate.rotation_dispatcher import RotationDispatcher
+
+class FakeTimingDispatcher(RotationDispatcher):
+    """Dispatcher whose GPU is faster from 'crossover' rows on."""
+
+    def __init__(self, crossover, **kwargs):
+        self.crossover = crossover
+        self.measured = 0
+        super().__init__(**kwargs)
+
+    def _measure(self, algorithm, operation, rows):
+        self.measured += 1
+        if algorithm is self.gpu:
+            return 1. if rows >= self.crossover else 3.
+        return 2.
+
+@pytest.fixture
+def implementations():
+    return NumpyRotationAlgorithm(), RotationAlgorithm(NumpyCudaManager())
+
+def test_select_with_thresholds(implementations):
+    cpu, gpu = implementations
+    dispatcher = RotationDispatcher(
+        cpu, gpu, thresholds={"transform_f32": 1000, "transform_batch": None}
+    )
+
+    assert dispatcher.select("transform_f32", 999) is cpu
+    assert dispatcher.select("transform_f32", 1000) is gpu
+    assert dispatcher.select("transform_batch", 10**9) is cpu
+
+def test_transforms_are_dispatched(implementations):
+    cpu, gpu = implementations
+    dispatcher = RotationDispatcher(
+        cpu, gpu, thresholds={"transform_f32": 1, "transform_batch": 1}
+    )
+    rng = np.random.default_rng(0)
+    in_matrix = rng.random((10, 3), dtype=np.float32)
+    t_matrix = rng.random((3, 3), dtype=np.float32)
+
+    out = dispatcher.transform_f32(in_matrix, t_matrix, 3)
+    batch = dispatcher.transform_batch(
+        in_matrix, np.broadcast_to(t_matrix, (10, 3, 3))
+    )
+
+    assert np.allclose(out, in_matrix @ t_matrix.T, rtol=1e-5)
+    assert np.allclose(batch, out, rtol=1e-5)
+
+def test_calibration_finds_crossover(implementations):
+    cpu, gpu = implementations
+    dispatcher = FakeTimingDispatcher(1 << 12, cpu=cpu, gpu=gpu)
+
+    assert dispatcher.thresholds == {
+        "transform_f32": 1 << 12, "transform_batch": 1 << 12
+    }
+
+def test_calibration_without_faster_gpu(implementations):
+    cpu, gpu = implementations
+    dispatcher = FakeTimingDispatcher(float("inf"), cpu=cpu, gpu=gpu)
+
+    assert dispatcher.thresholds == {
+        "transform_f32": None, "transform_batch": None
+    }
+
+def test_calibration_is_persisted(implementations, tmp_path):
+    cpu, gpu = implementations
+    path = tmp_path / "crossovers.json"
+    FakeTimingDispatcher(1 << 10, cpu=cpu, gpu=gpu, path=path).thresholds
+
+    stored = json.loads(path.read_text())[RotationDispatcher.machine()]
+    dispatcher = FakeTimingDispatcher(1 << 20, cpu=cpu, gpu=gpu, path=path)
+
+    assert stored["transform_f32"] == 1 << 10
+    assert dispatcher.thresholds == stored
+    assert dispatcher.measured == 0
+
+def test_without_gpu_everything_runs_on_cpu():
+    cpu = NumpyRotationAlgorithm()
+    # PyCUDA is not available here, so no GPU implementation is found
+    dispatcher = RotationDispatcher(cpu, thresholds={"transform_f32": 1})
+    dispatcher.gpu = None
+
+    assert dispatcher.select("transform_f32", 10**9) is cpu
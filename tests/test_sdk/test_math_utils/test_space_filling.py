@@ -0,0 +1,24 @@
+import sys
+import numpy as np
+import pytest
+
+from sdk.math_utils.sampling import latin_hypercube, sobol
+
+def test_latin_hypercube_one_point_per_stratum():
+    sample = latin_hypercube(50, 3, np.random.default_rng(0))
+
+    assert sample.shape == (50, 3)
+    assert ((sample >= 0) & (sample < 1)).all()
+    for column in sample.T:
+        assert sorted(np.floor(column*50).astype(int)) == list(range(50))
+
+def test_latin_hypercube_reproducible():
+    assert np.array_equal(
+        latin_hypercube(8, 2, np.random.default_rng(1)),
+        latin_hypercube(8, 2, np.random.default_rng(1))
+    )
+
+def test_sobol_without_scipy_raises(monkeypatch):
+    monkeypatch.setitem(sys.modules, "scipy.stats", None)
+    with pytest.raises(ImportError, match="ipanema\\[sobol\\]"):
+        sobol(8, 2)